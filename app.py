@@ -1,241 +1,72 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from io import BytesIO
-from collections import OrderedDict
+import os
+import sqlite3
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from ledger import charts, profiling
+from ledger.aggregate import PartitionAggregates, compare_by_major
+from ledger.cache import ParseCache, content_hash
+from ledger.charts import FigureCache
+from ledger.classify import KeywordClassifier, fix_minor_categories
+from ledger.config import (
+    ALL_MAJOR, ALL_MINOR, AUTO_CLASSIFY, CATEGORY_TREE, MONTHS, PAYMENT_METHODS,
+)
+from ledger.dedup import find_duplicates
+from ledger.export import XLSX_MIME, ExportCache
+from ledger.ingest import (
+    PARSER_VERSION, IngestResult, default_workers, ingest_files, route_by_period,
+)
+from ledger.messages import import_messages, iter_chat_db, iter_dump
+from ledger.money import calc_actual_spend
+from ledger.paging import (
+    PAGE_SIZES, TableFilter, TableIndex, merge_page, page_count, page_rows,
+)
+from ledger.periods import (
+    Period, period_label, trailing, year_ago, year_periods, year_to_date,
+)
+from ledger.profiling import Profiler, stage
+from ledger.reconcile import (
+    DEFAULT_SIMILARITY, DEFAULT_WINDOW, RECONCILE_COLUMNS, Reconciliation, copy_categories, reconcile,
+)
+from ledger.schema import columns_fingerprint, concat_ledgers, empty_ledger
+from ledger.store import UNDATED, LedgerStore, append_rows, default_income
 
 st.set_page_config(page_title="가계부 대시보드", page_icon="💰", layout="wide")
 
-# ===================== 카테고리 & 결제수단 설정 =====================
-
-CATEGORY_TREE: OrderedDict[str, list[str]] = OrderedDict([
-    ("금융보험비", ["보험료", "금융이자", "적금", "상환금", "상품권", "투자", "연금"]),
-    ("식비", ["식사/간식", "차/커피", "회사점심", "식재료"]),
-    ("주거생활비", ["집세/관리비", "통신비", "기타세금", "전자기기"]),
-    ("생활용품비", ["생활용품", "더모아충전"]),
-    ("의류미용비", ["의류/잡화", "미용"]),
-    ("문화생활비", ["영화/공연/OTT/전시", "게임/음악", "전자제품", "도서"]),
-    ("건강관리비", ["운동/다이어트", "병원/약값", "기타요양", "보험청구"]),
-    ("교통비", ["대중교통", "택시비", "장거리경비"]),
-    ("학비", ["학원/강의", "교재비", "모임공간이용료", "문구류", "응시료", "유학수속관련비용"]),
-    ("사회생활비", ["경조사비", "선물/용돈", "모임회비"]),
-    ("유흥비", ["술값", "기타유흥"]),
-    ("사업", ["고정지출비", "초기투자비"]),
-    ("생활유지비", ["기름값", "정비/세차", "주차/통행", "자동차", "보험료",
-                  "과외관련비용", "이사비용", "세탁비", "고정비/구독료"]),
-])
-
-ALL_MAJOR = list(CATEGORY_TREE.keys())
-ALL_MINOR = list(dict.fromkeys(sub for subs in CATEGORY_TREE.values() for sub in subs))
-
-PAYMENT_METHODS = [
-    "", "계좌이체", "현금", "롯데카드신용", "온누리상품권체크", "신한카드-더모아",
-    "신한은행", "우리체크카드", "우리카드", "PAYCO", "현대카드", "현아플",
-    "새마을금고", "네이버페이", "카카오뱅크", "모빌리언스카드", "삼성카드",
-    "롯데체크카드", "신한카드", "KB국민카드", "우리카드연세", "우리은행",
-    "케이뱅크", "지역화페", "카카오페이", "롯데카드", "온누리상품권",
-]
-
-AUTO_CLASSIFY = {
-    "커피": ("식비", "차/커피"), "카페": ("식비", "차/커피"), "스타벅스": ("식비", "차/커피"),
-    "점심": ("식비", "회사점심"), "식당": ("식비", "식사/간식"), "배달": ("식비", "식사/간식"),
-    "편의점": ("식비", "식사/간식"), "마트": ("식비", "식재료"), "식료품": ("식비", "식재료"),
-    "치킨": ("식비", "식사/간식"), "피자": ("식비", "식사/간식"), "빵": ("식비", "식사/간식"),
-    "버스": ("교통비", "대중교통"), "지하철": ("교통비", "대중교통"), "교통": ("교통비", "대중교통"),
-    "택시": ("교통비", "택시비"), "카카오택시": ("교통비", "택시비"),
-    "주유": ("생활유지비", "기름값"), "기름": ("생활유지비", "기름값"),
-    "세차": ("생활유지비", "정비/세차"), "정비": ("생활유지비", "정비/세차"),
-    "주차": ("생활유지비", "주차/통행"), "톨게이트": ("생활유지비", "주차/통행"),
-    "넷플릭스": ("문화생활비", "영화/공연/OTT/전시"), "영화": ("문화생활비", "영화/공연/OTT/전시"),
-    "유튜브": ("문화생활비", "영화/공연/OTT/전시"), "구독": ("생활유지비", "고정비/구독료"),
-    "게임": ("문화생활비", "게임/음악"), "도서": ("문화생활비", "도서"), "책": ("문화생활비", "도서"),
-    "옷": ("의류미용비", "의류/잡화"), "의류": ("의류미용비", "의류/잡화"),
-    "쇼핑": ("의류미용비", "의류/잡화"), "쿠팡": ("의류미용비", "의류/잡화"),
-    "무신사": ("의류미용비", "의류/잡화"), "올리브영": ("의류미용비", "미용"),
-    "화장품": ("의류미용비", "미용"),
-    "병원": ("건강관리비", "병원/약값"), "약국": ("건강관리비", "병원/약값"),
-    "치과": ("건강관리비", "병원/약값"), "안과": ("건강관리비", "병원/약값"),
-    "운동": ("건강관리비", "운동/다이어트"), "헬스": ("건강관리비", "운동/다이어트"),
-    "월세": ("주거생활비", "집세/관리비"), "관리비": ("주거생활비", "집세/관리비"),
-    "전기": ("주거생활비", "집세/관리비"), "가스": ("주거생활비", "집세/관리비"),
-    "통신": ("주거생활비", "통신비"), "핸드폰": ("주거생활비", "통신비"),
-    "인터넷": ("주거생활비", "통신비"),
-    "학원": ("학비", "학원/강의"), "강의": ("학비", "학원/강의"),
-    "보험": ("금융보험비", "보험료"), "적금": ("금융보험비", "적금"),
-    "이자": ("금융보험비", "금융이자"), "대출": ("금융보험비", "상환금"),
-    "술": ("유흥비", "술값"), "회식": ("유흥비", "술값"),
-    "선물": ("사회생활비", "선물/용돈"), "축의금": ("사회생활비", "경조사비"),
-}
-
-INCOME_CATEGORIES = ["급여", "이자소득", "상여", "투자수익", "처분소득", "부수익", "페이백", "기타 수입"]
-MONTHS = ["1월", "2월", "3월", "4월", "5월", "6월", "7월", "8월", "9월", "10월", "11월", "12월"]
-DATA_COLUMNS = ["날짜", "결제수단", "대분류", "소분류", "지출 내용", "결제금액", "할인", "실지출", "비고"]
-
-# ===================== 유틸 함수 =====================
-
-COLUMN_RENAME = {i: c for i, c in enumerate(DATA_COLUMNS)}
-
-
-def categorize_item(text: str) -> tuple[str, str]:
-    if not isinstance(text, str):
-        return ("", "")
-    text_lower = text.lower()
-    for kw, (major, minor) in AUTO_CLASSIFY.items():
-        if kw in text_lower:
-            return (major, minor)
-    return ("", "")
-
-
-# 엑셀 헤더 → 표준 칼럼명 매핑
-HEADER_ALIASES = {
-    # 날짜
-    "날짜": "날짜", "일자": "날짜", "거래일": "날짜", "거래일자": "날짜", "이용일": "날짜",
-    "이용일자": "날짜", "이용일": "날짜", "지출일": "날짜", "date": "날짜",
-    # 결제수단
-    "결제수단": "결제수단", "카드": "결제수단", "카드명": "결제수단", "결제카드": "결제수단",
-    "결제": "결제수단", "이용카드": "결제수단",
-    # 지출 내용
-    "항목": "지출 내용", "내역": "지출 내용", "적요": "지출 내용", "사용처": "지출 내용",
-    "가맹점": "지출 내용", "가맹점명": "지출 내용", "내용": "지출 내용",
-    "지출내역": "지출 내용", "이용가맹점": "지출 내용", "지출 내용": "지출 내용",
-    # 결제금액
-    "이용금액": "결제금액", "금액": "결제금액", "지출금액": "결제금액", "결제금액": "결제금액",
-    "이용 금액": "결제금액", "amount": "결제금액",
-    # 대분류/소분류
-    "대분류": "대분류", "카테고리": "대분류",
-    "소분류": "소분류", "세부카테고리": "소분류",
-    # 할인/실지출/비고
-    # 할인 — 엑셀에서 가져오지 않음 (수동 입력만)
-    "실지출": "실지출", "결제원금": "실지출", "원금": "실지출",
-    "비고": "비고", "메모": "비고",
-}
-
-
-def process_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.dropna(axis=1, how="all")
-    df = df.loc[:, ~df.columns.astype(str).str.match(r"^\s*$")]
-
-    # 1) 헤더 행 찾기 — 처음 10행 내에서 2개 이상 HEADER_ALIASES에 매칭되는 행
-    header_row_idx = None
-    for i in range(min(10, len(df))):
-        row_vals = [str(v).strip() for v in df.iloc[i] if pd.notna(v)]
-        matches = sum(1 for v in row_vals if v in HEADER_ALIASES)
-        if matches >= 2:
-            header_row_idx = i
-            break
-
-    if header_row_idx is not None:
-        # 헤더 행 사용
-        header_row = [str(v).strip() for v in df.iloc[header_row_idx]]
-        df = df.iloc[header_row_idx + 1:].reset_index(drop=True)
-        # 헤더명 → 표준 칼럼명 매핑
-        new_cols = []
-        used = set()
-        for h in header_row:
-            standard = HEADER_ALIASES.get(h)
-            if standard and standard not in used:
-                new_cols.append(standard)
-                used.add(standard)
-            else:
-                new_cols.append(f"_orig_{h}")
-        df.columns = new_cols
-    else:
-        # 위치 기반 매핑 (fallback)
-        new_cols = [COLUMN_RENAME.get(i, f"_drop_{i}") for i in range(len(df.columns))]
-        df.columns = new_cols
-
-    df = df.loc[:, ~df.columns.str.startswith("_drop_")]
-    df = df.loc[:, ~df.columns.str.startswith("_orig_")]
-
-    if "결제금액" in df.columns:
-        def is_not_number(v):
-            if pd.isna(v):
-                return True
-            try:
-                float(str(v).replace(",", "").replace("원", "").strip())
-                return False
-            except (ValueError, TypeError):
-                return True
-        df = df[~df["결제금액"].apply(is_not_number)].reset_index(drop=True)
-
-    df = df.dropna(how="all").reset_index(drop=True)
+# 계측 — ?debug=1 또는 ACCOUNTBOOK_DEBUG=1 일 때만 켬 (꺼져 있으면 stage()는 빈 컨텍스트)
+DEBUG = os.environ.get("ACCOUNTBOOK_DEBUG") == "1" or st.query_params.get("debug") == "1"
+if DEBUG:
+    profiling.activate(Profiler(cprofile=st.session_state.get("debug_cprofile", False),
+                                trace_memory=st.session_state.get("debug_tracemalloc", False)))
+else:
+    profiling.deactivate()   # 계측을 끈 리런 — 예외로 끊긴 지난 리런의 Profiler가 이 스레드에 남아 있을 수 있음
 
-    if "날짜" in df.columns:
-        def parse_date(v):
-            if pd.isna(v):
-                return pd.NaT
-            if isinstance(v, pd.Timestamp):
-                return v
-            s = str(v).strip()
-            if not s:
-                return pd.NaT
-            # 괄호 안의 요일 제거: "2026.01.01 (목)" → "2026.01.01"
-            import re
-            s = re.sub(r"\s*\(.*?\)\s*$", "", s).strip()
-            try:
-                num = float(s)
-                if 1 < num < 100000:
-                    return pd.Timestamp("1899-12-30") + pd.Timedelta(days=int(num))
-            except (ValueError, TypeError):
-                pass
-            for fmt in ["%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%m/%d/%Y",
-                        "%Y-%m-%d %H:%M:%S", "%Y.%m.%d %H:%M",
-                        "%Y년 %m월 %d일", "%Y년%m월%d일"]:
-                try:
-                    return pd.to_datetime(s, format=fmt)
-                except (ValueError, TypeError):
-                    continue
-            return pd.to_datetime(s, errors="coerce")
-        df["날짜"] = df["날짜"].apply(parse_date)
-
-    money_cols = ["결제금액", "할인", "실지출"]
-    for col in money_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(
-                df[col].astype(str).str.replace(",", "").str.replace("원", "").str.strip(),
-                errors="coerce"
-            )
-
-    item_col = "지출 내용" if "지출 내용" in df.columns else None
-    if item_col:
-        categories = df[item_col].apply(categorize_item)
-        if "대분류" not in df.columns:
-            df["대분류"] = categories.apply(lambda x: x[0])
-        else:
-            mask = df["대분류"].isna() | (df["대분류"].astype(str).str.strip() == "")
-            df.loc[mask, "대분류"] = categories[mask].apply(lambda x: x[0])
-        if "소분류" not in df.columns:
-            df["소분류"] = categories.apply(lambda x: x[1])
-        else:
-            mask = df["소분류"].isna() | (df["소분류"].astype(str).str.strip() == "")
-            df.loc[mask, "소분류"] = categories[mask].apply(lambda x: x[1])
+# 저장소 위치 (ACCOUNTBOOK_DB 환경변수로 변경 가능)
+DEFAULT_DB = Path(__file__).resolve().parent / "data" / "ledger.sqlite3"
 
-    for c in ["대분류", "소분류"]:
-        if c in df.columns:
-            df[c] = df[c].fillna("").astype(str).str.strip()
+# ===================== 유틸 함수 =====================
 
-    # 모든 칼럼이 항상 존재하도록 보장
-    for col in DATA_COLUMNS:
-        if col not in df.columns:
-            df[col] = ""
+def rerun():
+    """st.rerun — 예외로 스크립트를 끊으므로 맨 끝의 계측 정리까지 못 감. 켜 둔 Profiler를 여기서 뗌"""
+    try:
+        st.rerun()
+    finally:
+        profiling.deactivate()
 
-    # 음수 결제금액 처리: -금액 → 결제금액=abs, 할인=abs, 실지출=0
-    if "결제금액" in df.columns:
-        df["결제금액"] = pd.to_numeric(df["결제금액"], errors="coerce").fillna(0)
-        neg_mask = df["결제금액"] < 0
-        df.loc[neg_mask, "할인"] = df.loc[neg_mask, "결제금액"].abs()
-        df.loc[neg_mask, "결제금액"] = df.loc[neg_mask, "결제금액"].abs()
 
-    # 실지출 = 결제금액 - 할인
-    if "결제금액" in df.columns and "할인" in df.columns:
-        df["할인"] = pd.to_numeric(df["할인"], errors="coerce").fillna(0)
-        df["실지출"] = df["결제금액"] - df["할인"]
+def get_classifier() -> KeywordClassifier:
+    """세션별 자동분류기 — 리런마다 다시 컴파일하지 않도록 세션에 보관"""
+    if "classifier" not in st.session_state:
+        st.session_state.classifier = KeywordClassifier(AUTO_CLASSIFY)
+    return st.session_state.classifier
 
-    # 칼럼 순서 정렬
-    df = df[[c for c in DATA_COLUMNS if c in df.columns]]
 
-    return df
+def categorize_item(text: str) -> tuple[str, str]:
+    return get_classifier().classify(text)
 
 
 def make_column_config(df):
@@ -260,32 +91,117 @@ def make_column_config(df):
     return cc
 
 
-def calc_actual_spend(df):
-    """실지출 = 결제금액 - 할인 계산"""
-    if "결제금액" in df.columns and "할인" in df.columns:
-        df["결제금액"] = pd.to_numeric(df["결제금액"], errors="coerce").fillna(0)
-        df["할인"] = pd.to_numeric(df["할인"], errors="coerce").fillna(0)
-        df["실지출"] = df["결제금액"] - df["할인"]
-    return df
+def category_edits(df, edited, editor_key) -> pd.Index:
+    """데이터 에디터 편집 내역 중 대분류/소분류가 바뀐 행과 새로 추가된 행의 인덱스"""
+    state = st.session_state.get(editor_key) or {}
+    positions = [int(pos) for pos, cells in state.get("edited_rows", {}).items()
+                 if "대분류" in cells or "소분류" in cells]
+    changed = df.index[[p for p in positions if p < len(df)]]
+    return changed.union(edited.index.difference(df.index))
+
+
+def reset_editor_on_change(key_prefix, rows: pd.Index | None):
+    """편집기에 보내는 행(페이지)이 바뀌면 편집기 상태 초기화 — 편집 내역은 행 위치 기준이라"""
+    rows_key = f"{key_prefix}_page_rows"
+    prev = st.session_state.get(rows_key)
+    same = (prev is None and rows is None) or (
+        prev is not None and rows is not None and prev.equals(rows))
+    if not same:
+        st.session_state.pop(f"{key_prefix}_editor", None)
+    st.session_state[rows_key] = rows
+
+
+def table_index(df, key_prefix) -> TableIndex:
+    """필터용 칼럼 인덱스 — 표 객체가 바뀐 경우에만 다시 만듦"""
+    cached = st.session_state.get(f"{key_prefix}_index")
+    if cached is None or cached[0] is not df:
+        with stage("editor.index", len(df)):
+            cached = (df, TableIndex(df))
+        st.session_state[f"{key_prefix}_index"] = cached
+    return cached[1]
+
+
+def render_filters(index: TableIndex, key_prefix) -> TableFilter:
+    """검색/필터 입력 — 선택지는 표에 실제로 있는 값만"""
+    k = f"{key_prefix}_f"
+    active = any(st.session_state.get(f"{k}_{name}") for name in ("date", "major", "minor", "pay", "text"))
+    with st.expander("🔎 검색 / 필터", expanded=active):
+        c1, c2 = st.columns(2)
+        bounds = index.date_range()
+        picked = c1.date_input("기간", value=[], min_value=bounds[0] if bounds else None,
+                               max_value=bounds[1] if bounds else None, key=f"{k}_date")
+        text = c2.text_input("지출 내용 검색", key=f"{k}_text")
+        c3, c4, c5 = st.columns(3)
+        majors = c3.multiselect("대분류", index.options("대분류"), key=f"{k}_major")
+        minors = c4.multiselect("소분류", index.options("소분류"), key=f"{k}_minor")
+        payments = c5.multiselect("결제수단", index.options("결제수단"), key=f"{k}_pay")
+    picked = list(picked) if isinstance(picked, (list, tuple)) else [picked]
+    return TableFilter(
+        start=picked[0] if picked else None, end=picked[1] if len(picked) > 1 else None,
+        majors=tuple(majors), minors=tuple(minors), payments=tuple(payments), text=text)
+
+
+def render_paged_table(df, key_prefix, state_key=None):
+    """페이지 단위 편집 — 거른 결과 중 한 페이지만 편집기로 보내고, 편집은 행 id로 전체 표에 합침"""
+    index = table_index(df, key_prefix)
+    positions = index.select(render_filters(index, key_prefix))
+
+    c1, c2, c3 = st.columns([1, 1, 3])
+    size = c2.selectbox("페이지 크기", PAGE_SIZES, index=1, key=f"{key_prefix}_page_size")
+    pages = page_count(len(positions), size)
+    page_key = f"{key_prefix}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page_no = c1.number_input("페이지", 1, pages, key=page_key)
+    start = (page_no - 1) * size
+    c3.caption(f"{len(positions):,}건 중 {min(start + 1, len(positions)):,}–"
+               f"{min(start + size, len(positions)):,} · 전체 {len(df):,}건")
+
+    page = df.iloc[page_rows(positions, page_no, size)]
+    reset_editor_on_change(key_prefix, page.index)
+    editor_key = f"{key_prefix}_editor"
+    with stage(f"editor.{key_prefix}", len(page)):
+        edited = st.data_editor(
+            page, column_config=make_column_config(df), num_rows="dynamic",
+            use_container_width=True, key=editor_key
+        )
+    edited = fix_minor_categories(edited)
+    merged = merge_page(df, page, edited)
+
+    if state_key:
+        st.session_state[state_key] = merged
+        # 추가/삭제는 행 위치가 바뀌므로 편집기를 새로 그림 (편집 내역이 다시 적용되지 않게)
+        state = st.session_state.get(editor_key) or {}
+        if state.get("added_rows") or state.get("deleted_rows"):
+            st.session_state.pop(editor_key, None)
+            rerun()
+    return merged
 
 
 def render_data_table(df, key_prefix, state_key=None):
-    """데이터 편집 테이블 렌더"""
+    """데이터 편집 테이블 렌더 — 행이 많으면 페이지 보기 (편집기로 보내는 양을 페이지 크기로 고정)"""
     df = calc_actual_spend(df)
 
-    cc = make_column_config(df)
-    edited = st.data_editor(
-        df, column_config=cc, num_rows="dynamic",
-        use_container_width=True, key=f"{key_prefix}_editor"
-    )
+    paged = st.toggle("📄 페이지 보기", value=len(df) > PAGE_SIZES[1], key=f"{key_prefix}_paged")
+    if paged:
+        return render_paged_table(df, key_prefix, state_key)
+    reset_editor_on_change(key_prefix, None)
 
-    # 대분류-소분류 자동 교정
-    if "대분류" in edited.columns and "소분류" in edited.columns:
-        for idx in edited.index:
-            major = str(edited.at[idx, "대분류"]).strip()
-            minor = str(edited.at[idx, "소분류"]).strip()
-            if major in CATEGORY_TREE and minor and minor not in CATEGORY_TREE[major]:
-                edited.at[idx, "소분류"] = CATEGORY_TREE[major][0]
+    cc = make_column_config(df)
+    with stage(f"editor.{key_prefix}", len(df)):
+        edited = st.data_editor(
+            df, column_config=cc, num_rows="dynamic",
+            use_container_width=True, key=f"{key_prefix}_editor"
+        )
+
+    # 대분류-소분류 자동 교정 — 지난 리런에 교정한 표면 이번에 편집된 행만 검사
+    checked_key = f"{key_prefix}_checked"
+    if st.session_state.get(checked_key) is df:
+        rows = category_edits(df, edited, f"{key_prefix}_editor")
+    else:
+        rows = None
+    edited = fix_minor_categories(edited, rows)
+    st.session_state[checked_key] = edited
 
     if state_key:
         st.session_state[state_key] = edited
@@ -293,13 +209,15 @@ def render_data_table(df, key_prefix, state_key=None):
     return edited
 
 
-def render_category_editor(df, key_prefix):
-    """카테고리 종속 드롭다운 편집"""
+def render_category_editor(df, key_prefix, state_key=None, rows: pd.Index | None = None):
+    """카테고리 종속 드롭다운 편집 — rows가 있으면 그 행(지금 페이지)만 선택지로"""
     if "대분류" not in df.columns or "소분류" not in df.columns or len(df) == 0:
         return df
 
     with st.expander("🏷️ 카테고리 편집 (종속 드롭다운)"):
-        row_options = list(df.index)
+        row_options = list(df.index if rows is None else rows.intersection(df.index, sort=False))
+        if not row_options:
+            return df
         def fmt_row(i):
             item = df.at[i, "지출 내용"] if "지출 내용" in df.columns else ""
             return f"[{i}] {item} — {df.at[i, '대분류']}/{df.at[i, '소분류']}"
@@ -310,224 +228,844 @@ def render_category_editor(df, key_prefix):
         picked_minor = st.selectbox("소분류", sub_options, key=f"{key_prefix}_minor")
 
         if st.button("✅ 적용", key=f"{key_prefix}_apply"):
+            if state_key:
+                # 새 객체로 바꿔야 표 객체 기준 캐시(집계, 필터 인덱스)가 다시 계산됨
+                df = df.copy()
+                st.session_state[state_key] = df
             df.at[selected, "대분류"] = picked_major
             df.at[selected, "소분류"] = picked_minor
             st.toast(f"✅ 행 {selected} → {picked_major} / {picked_minor}")
-            st.rerun()
+            rerun()
     return df
 
 
-def empty_data_df():
-    return pd.DataFrame(columns=DATA_COLUMNS)
+def render_export(sheets, file_name: str, label: str, key: str, token: str | None = None):
+    """엑셀 내보내기 버튼 — 누를 때만 파일을 만들고, 내용이 같으면 만든 파일 재사용
+
+    sheets가 함수면(여러 파티션을 읽어야 할 때) 버튼을 누를 때만 부르고, 바뀜 여부는 token으로 본다.
+    """
+    cache = st.session_state.export_cache
+    fp_key = f"{key}_fp"
+    ready = st.session_state.get(fp_key)
+    current = token if callable(sheets) else None
+    if ready is not None and cache.get(ready) is not None and (current or cache.fingerprint(sheets)) == ready:
+        data = cache.get(ready)
+    elif st.button(f"📦 {label} 엑셀 만들기", key=f"{key}_prepare"):
+        if callable(sheets):
+            sheets = sheets()
+        ready = current or cache.fingerprint(sheets)
+        with st.spinner("엑셀 파일 만드는 중…"):
+            data = cache.build(ready, sheets)
+        st.session_state[fp_key] = ready
+    else:
+        return
+    st.download_button(f"📥 {label} 다운로드", data, file_name=file_name, mime=XLSX_MIME, key=key)
+
 
+# ===================== 파티션 (연도, 월) =====================
+# 화면이 쓰는 파티션만 세션에 올리고, 오래 안 쓴 것은 저장한 뒤 내림 — 기록이 길어져도 메모리는 일정
 
-# ===================== 세션 상태 초기화 =====================
+MAX_LOADED = 6
 
-# 월별 데이터 (지출)
-for m in range(1, 13):
-    key = f"month_{m}"
+
+def part_key(kind: str, p: Period) -> str:
+    """세션 키 — month_2025_3 / iphone_2025_3"""
+    return f"{kind}_{p[0]}_{p[1]}"
+
+
+def editor_prefix(kind: str, p: Period) -> str:
+    return f"{'m' if kind == 'month' else 'ip'}{p[0]}_{p[1]}"
+
+
+def load_part(kind: str, p: Period) -> pd.DataFrame:
+    """파티션 표 — 세션에 없으면 저장소에서 읽고, 올린 파티션이 많으면 가장 오래 안 쓴 것부터 내림"""
+    key = part_key(kind, p)
+    loaded = st.session_state.loaded
+    loaded.pop(key, None)
+    loaded[key] = (kind, p)
     if key not in st.session_state:
-        st.session_state[key] = empty_data_df()
+        with stage("store.load"):
+            st.session_state[key] = st.session_state.store.load(kind, *p)
+    while len(loaded) > MAX_LOADED:
+        unload_part(*next(iter(loaded.values())))
+    return st.session_state[key]
+
+
+def unload_part(kind: str, p: Period):
+    """파티션을 세션에서 내림 — 저장한 뒤 표와 편집기/캐시 상태를 버림 (부분합만 집계에 남김)"""
+    key = part_key(kind, p)
+    if key in st.session_state:
+        persist(kind, p)
+        if kind == "month":
+            agg = st.session_state.aggregates
+            agg.put(p, agg.update(p, st.session_state[key]))
+        del st.session_state[key]
+    st.session_state.loaded.pop(key, None)
+    st.session_state.store.forget(kind, *p)
+    prefix = editor_prefix(kind, p)
+    for suffix in ("_editor", "_checked", "_index", "_page_rows"):
+        st.session_state.pop(f"{prefix}{suffix}", None)
+    st.session_state.pop(f"recon_{p[0]}_{p[1]}", None)
+
+
+def read_part(kind: str, p: Period) -> pd.DataFrame:
+    """읽기만 할 파티션 (내보내기 등) — 올라와 있으면 그 표, 아니면 세션에 올리지 않고 읽음"""
+    key = part_key(kind, p)
+    if key in st.session_state:
+        return st.session_state[key]
+    store = st.session_state.store
+    df = store.load(kind, *p)
+    store.forget(kind, *p)
+    return df
 
-# 월별 아이폰 결제내역
-for m in range(1, 13):
-    key = f"iphone_{m}"
+
+def persist(kind: str, p: Period):
+    """세션의 파티션 표를 저장소에 반영 (바뀐 행만) — 새 행에 id가 붙으면 세션 표도 교체"""
+    key = part_key(kind, p)
+    try:
+        with stage("store.save", len(st.session_state[key])):
+            st.session_state[key] = st.session_state.store.save(kind, *p, st.session_state[key])
+        st.session_state.known_years.add(p[0])
+    except (sqlite3.Error, ValueError) as e:
+        st.warning(f"저장 실패 ({period_label(p)}): {e}")
+
+
+def apply_upload(pending: dict, dropped: pd.DataFrame) -> int:
+    """업로드 파일 행을 월 데이터 뒤에 붙이고 날짜순 정렬 — dropped(frame, row)는 빼고. 추가한 행 수 반환"""
+    p = pending["period"]
+    drop = set(zip(dropped["frame"], dropped["row"]))
+    new = []
+    for i, df in enumerate(pending["frames"][1:], start=1):
+        mask = [(i, r) not in drop for r in df.index] if drop else slice(None)
+        new.append(df.loc[mask])
+    new = concat_ledgers(new, ignore_index=True)
+    merged = append_rows(load_part("month", p), new)
+    st.session_state[part_key("month", p)] = merged.sort_values("날짜", na_position="last", kind="stable")
+    st.session_state.pop(f"{editor_prefix('month', p)}_editor", None)   # 행 위치가 바뀌므로 편집기 상태 초기화
+    persist("month", p)
+    return len(new)
+
+
+def duplicate_table(pending: dict) -> pd.DataFrame:
+    """중복 의심 쌍 → 검토용 표 (업로드 행 / 먼저 있던 행 나란히)"""
+    frames, names, pairs = pending["frames"], pending["names"], pending["pairs"]
+
+    def describe(frame, row):
+        r = frames[frame].loc[row]
+        date = r["날짜"].strftime("%Y-%m-%d") if pd.notna(r["날짜"]) else ""
+        return f"{date} {r['지출 내용']} ₩{r['결제금액']:,} ({r['결제수단']})"
+
+    return pd.DataFrame({
+        "제외": True,
+        "파일": [names[f] for f in pairs["frame"]],
+        "업로드 행": [describe(f, r) for f, r in zip(pairs["frame"], pairs["row"])],
+        "먼저 있던 행": [f"[{names[f]}] {describe(f, r)}"
+                     for f, r in zip(pairs["ref_frame"], pairs["ref_row"])],
+        "일치": [("정확" if k == "exact" else f"유사 {s:.0%}, {d}일 차이")
+               for k, s, d in zip(pairs["match"], pairs["score"], pairs["days_apart"])],
+    })
+
+
+def stage_upload(p: Period, frames: list[pd.DataFrame], names: list[str]) -> int | None:
+    """한 달에 들어갈 파일별 행 — 중복 의심이 없으면 바로 반영(추가한 행 수), 있으면 검토 대기(None)
+
+    그 달에 검토 대기 중인 업로드가 있으면 덮어쓰지 않고 뒤에 합쳐서 다시 검사함
+    """
+    waiting = st.session_state.pending_uploads.pop(p, None)
+    if waiting is not None:
+        frames, names = waiting["frames"][1:] + frames, waiting["names"][1:] + names
+        st.session_state.pop(f"dup_review_{p[0]}_{p[1]}", None)   # 의심 쌍이 바뀌므로 검토 표 초기화
+    frames = [load_part("month", p)] + frames
+    with stage("upload.dedup", sum(len(f) for f in frames)):
+        pairs = find_duplicates(frames, tolerant=st.session_state.get("dedup_tolerant", False))
+    pending = {"period": p, "frames": frames, "names": [f"{period_label(p)} 기존"] + names, "pairs": pairs}
+    if pairs.empty:
+        return apply_upload(pending, pairs)
+    st.session_state.pending_uploads[p] = pending
+    return None
+
+
+def render_duplicate_review():
+    """중복 의심 행 검토 (월별) — 체크한 행은 빼고 월 데이터에 반영"""
+    for p, pending in sorted(st.session_state.pending_uploads.items()):
+        pairs = pending["pairs"]
+        k = f"{p[0]}_{p[1]}"
+        with st.expander(f"⚠️ {period_label(p)} 업로드 — 중복 의심 {len(pairs)}건 (검토 후 반영)", expanded=True):
+            st.caption("이미 있는 거래와 같아 보이는 행입니다. 체크된 행은 빼고 추가합니다.")
+            reviewed = st.data_editor(
+                duplicate_table(pending), hide_index=True, use_container_width=True,
+                disabled=["파일", "업로드 행", "먼저 있던 행", "일치"], key=f"dup_review_{k}")
+            col1, col2 = st.columns(2)
+            if col1.button("✅ 반영", key=f"dup_apply_{k}"):
+                dropped = pairs[reviewed["제외"].to_numpy()]
+                added = apply_upload(pending, dropped)
+                del st.session_state.pending_uploads[p]
+                st.toast(f"✅ {period_label(p)}에 {added}건 추가 (중복 {len(dropped)}건 제외)")
+                rerun()
+            if col2.button("❌ 업로드 취소", key=f"dup_cancel_{k}"):
+                del st.session_state.pending_uploads[p]
+                rerun()
+
+
+def save_undated(df: pd.DataFrame):
+    try:
+        st.session_state.undated = st.session_state.store.save("month", *UNDATED, df)
+    except (sqlite3.Error, ValueError) as e:
+        st.session_state.undated = df
+        st.warning(f"저장 실패 (날짜 없는 행): {e}")
+
+
+def render_undated():
+    """날짜를 못 읽은 업로드 행 — 날짜를 입력하면 그 달로 보냄 (저장소에 보관)"""
+    undated = st.session_state.undated
+    if undated.empty:
+        return
+    with st.expander(f"📭 날짜 없는 행 {len(undated)}건 — 날짜를 입력하면 해당 월로 옮깁니다"):
+        edited = st.data_editor(undated, column_config=make_column_config(undated),
+                                use_container_width=True, key="undated_editor")
+        col1, col2 = st.columns(2)
+        if col1.button("📅 날짜 입력한 행 옮기기", key="undated_route"):
+            # 남는 행은 행 id를 그대로 둬야 저장소에서 바뀐 행만 지움
+            dated = pd.to_datetime(edited["날짜"], errors="coerce").notna().to_numpy()
+            routed, _ = route_by_period([edited[dated]])
+            for p, parts in routed.items():
+                stage_upload(p, [df for _, df in parts], ["날짜 없는 행"])
+            save_undated(edited[~dated])
+            st.session_state.pop("undated_editor", None)
+            rerun()
+        if col2.button("🗑️ 비우기", key="undated_clear"):
+            save_undated(empty_ledger())
+            st.session_state.pop("undated_editor", None)
+            rerun()
+
+
+def render_undated_notices():
+    """날짜를 못 읽은 결제 알림 — 날짜를 입력하면 그 달 아이폰 결제내역으로 보냄 (저장소에 보관)"""
+    undated = st.session_state.undated_notices
+    if undated.empty:
+        return
+    with st.expander(f"📭 날짜 없는 알림 {len(undated)}건 — 날짜를 입력하면 해당 월 아이폰 결제내역으로 옮깁니다"):
+        edited = st.data_editor(undated, column_config=make_column_config(undated),
+                                use_container_width=True, key="undated_notices_editor")
+        col1, col2 = st.columns(2)
+        if col1.button("📅 날짜 입력한 알림 옮기기", key="undated_notices_route"):
+            # 남는 행은 행 id를 그대로 둬야 저장소에서 바뀐 행만 지움
+            dated = pd.to_datetime(edited["날짜"], errors="coerce").notna().to_numpy()
+            routed, _ = route_by_period([edited[dated]])
+            add_notices(routed)
+            save_undated_notices(edited[~dated])
+            st.session_state.pop("undated_notices_editor", None)
+            rerun()
+        if col2.button("🗑️ 비우기", key="undated_notices_clear"):
+            save_undated_notices(empty_ledger())
+            st.session_state.pop("undated_notices_editor", None)
+            rerun()
+
+
+# ===================== 세션 상태 초기화 =====================
+
+# 로컬 저장소 — 세션이 끝나도 남고, (연도, 월) 파티션은 화면이 필요할 때만 읽어옴
+if "store" not in st.session_state:
+    st.session_state.store = LedgerStore(os.environ.get("ACCOUNTBOOK_DB", DEFAULT_DB))
+
+# 날짜를 못 읽은 업로드 행 / 결제 알림 — 다시 올리거나 가져오지 않아도 되게 저장소에 보관해 두고 날짜를 입력받음
+if "undated" not in st.session_state:
+    st.session_state.undated = st.session_state.store.load("month", *UNDATED)
+if "undated_notices" not in st.session_state:
+    st.session_state.undated_notices = st.session_state.store.load("iphone", *UNDATED)
+
+# 세션에 올린 파티션 (세션 키 → (kind, (연도, 월)), 오래 안 쓴 순서)
+if "loaded" not in st.session_state:
+    st.session_state.loaded = {}
+
+# 데이터가 있는 연도 (+ 올해)
+if "known_years" not in st.session_state:
+    st.session_state.known_years = set(st.session_state.store.years()) | {date.today().year}
+
+# 기간 집계 ((연도, 월)별 부분합)
+if "aggregates" not in st.session_state:
+    st.session_state.aggregates = PartitionAggregates()
+
+# 내보내기 파일 캐시
+if "export_cache" not in st.session_state:
+    st.session_state.export_cache = ExportCache()
+
+
+
+def income_df(year: int) -> pd.DataFrame:
+    """한 해의 수입 표 (처음 볼 때 저장소에서 읽음)"""
+    key = f"income_{year}"
     if key not in st.session_state:
-        st.session_state[key] = empty_data_df()
+        income = st.session_state.store.load_income(year)
+        st.session_state[key] = income if income is not None else default_income()
+    return st.session_state[key]
+
+
+# ===================== 사이드바: 연도 =====================
 
-# 수입
-if "income_df" not in st.session_state:
-    data = {"수입 카테고리": INCOME_CATEGORIES}
-    for m_name in MONTHS:
-        data[m_name] = [0] * len(INCOME_CATEGORIES)
-    st.session_state.income_df = pd.DataFrame(data)
+def year_from_query() -> int:
+    """?year=2024 — 없거나 잘못된 값이면 데이터가 있는 가장 최근 연도"""
+    q = str(st.query_params.get("year", ""))
+    if q.isdigit() and 1900 < int(q) < 2200:
+        st.session_state.known_years.add(int(q))
+        return int(q)
+    return max(st.session_state.known_years)
+
+
+if "year" not in st.session_state:
+    st.session_state.year = year_from_query()
+year = st.sidebar.selectbox("📅 연도", sorted(st.session_state.known_years, reverse=True),
+                            format_func=lambda y: f"{y}년", key="year")
+if st.query_params.get("year") != str(year):
+    st.query_params["year"] = str(year)
 
 
 # ===================== 사이드바: 엑셀 업로드 =====================
 
-st.sidebar.header("📂 엑셀 업로드")
-upload_month = st.sidebar.selectbox("업로드할 월", range(1, 13), format_func=lambda m: f"{m}월")
+st.sidebar.header("📂 명세서 업로드")
+# "auto"면 거래 날짜의 (연도, 월)로 나눠서 넣음 (결제 주기에 걸친 명세서, 여러 해 내역)
+upload_month = st.sidebar.selectbox(
+    "업로드할 월", ["auto", *range(1, 13)],
+    format_func=lambda m: "자동 (거래 날짜별)" if m == "auto" else f"{year}년 {m}월")
+upload_target = "auto" if upload_month == "auto" else (year, upload_month)
 uploaded_files = st.sidebar.file_uploader(
-    "엑셀 파일 (.xlsx, .xls) — 여러 개 가능",
-    type=["xlsx", "xls"],
+    "엑셀/CSV 파일 (.xlsx, .xls, .csv, .tsv) — 여러 개 가능",
+    type=["xlsx", "xls", "csv", "tsv"],
     accept_multiple_files=True
 )
 
+if "parse_cache" not in st.session_state:
+    st.session_state.parse_cache = ParseCache()
+with st.sidebar.expander("⚙️ 업로드 설정"):
+    st.number_input("동시 처리 파일 수", min_value=1, max_value=os.cpu_count() or 1,
+                    value=default_workers(), key="ingest_workers")
+    st.checkbox("느슨한 중복 검사 (±1일, 가맹점 이름 유사)", key="dedup_tolerant")
+
+# 업로드 대상 → 마지막으로 반영한 파일 묶음 (같은 묶음이면 리런 때 다시 읽지 않음)
+if "ingested" not in st.session_state:
+    st.session_state.ingested = {}
+# (연도, 월) → 중복 검토 대기 중인 업로드
+if "pending_uploads" not in st.session_state:
+    st.session_state.pending_uploads = {}
+
 if uploaded_files:
-    try:
-        all_dfs = []
-        for f in uploaded_files:
-            raw_df = pd.read_excel(f, header=None)
-            processed = process_dataframe(raw_df)
-            all_dfs.append(processed)
-        
-        if len(all_dfs) == 1:
-            combined = all_dfs[0]
+    cache = st.session_state.parse_cache
+    classifier = get_classifier()
+    file_keys = [(content_hash(f.getvalue()), PARSER_VERSION, classifier.version)
+                 for f in uploaded_files]
+    batch_key = tuple(sorted(file_keys))
+
+    if st.session_state.ingested.get(upload_target) == batch_key:
+        st.sidebar.caption(f"✔️ 이미 반영된 파일입니다 ({len(uploaded_files)}개)")
+    else:
+        # 캐시에 없는 파일만 프로세스 풀로 처리
+        results: list[IngestResult | None] = [None] * len(uploaded_files)
+        todo = []
+        for i, (f, cache_key) in enumerate(zip(uploaded_files, file_keys)):
+            cached = cache.get(cache_key)
+            if cached is None:
+                todo.append(i)
+            else:
+                results[i] = IngestResult(i, f.name, df=cached)
+
+        if todo:
+            progress = st.sidebar.progress(0.0, text=f"파일 처리 중… (0/{len(todo)})")
+
+            def report(res: IngestResult, done: int, total: int):
+                progress.progress(done / total, text=f"파일 처리 중… ({done}/{total}) {res.name}")
+
+            with stage("upload.ingest"):
+                processed = ingest_files(
+                    [(uploaded_files[i].name, uploaded_files[i].getvalue()) for i in todo],
+                    classifier, workers=st.session_state.get("ingest_workers"), on_done=report)
+            profiling.count("upload.rows", sum(len(r.df) for r in processed if r.ok))
+            progress.empty()
+            for i, res in zip(todo, processed):
+                res.index = i
+                results[i] = res
+                if res.ok:
+                    cache.put(file_keys[i], res.df)
+
+        # 월별로 나눈 뒤, 월마다 지금 데이터 + 파일들 — 이미 있는 거래는 중복 의심으로 검토
+        ok = [r for r in results if r.ok]
+        if upload_target == "auto":
+            routed, undated = route_by_period([r.df for r in ok])
+        else:
+            routed, undated = {upload_target: list(enumerate(r.df for r in ok))}, empty_ledger()
+        added, held = [], []
+        for p, parts in routed.items():
+            n = stage_upload(p, [df for _, df in parts], [ok[f].name for f, _ in parts])
+            if n is None:
+                held.append(period_label(p))
+            else:
+                added.append(f"{period_label(p)} {n}건")
+        if len(undated):
+            save_undated(append_rows(st.session_state.undated, undated))
+
+        st.session_state.ingested[upload_target] = batch_key
+        st.session_state.ingest_report = [(r.name, len(r.df) if r.ok else 0, r.error, r.seconds)
+                                          for r in results]
+        if added:
+            st.sidebar.success(f"✅ {' · '.join(added)} 추가 ({len(ok)}/{len(results)}개 파일 합침)")
+        if held:
+            st.sidebar.warning(f"⚠️ 중복 의심 검토 대기: {', '.join(held)}")
+        if len(undated):
+            st.sidebar.warning(f"📭 날짜 없는 행 {len(undated)}건 — 화면 위에서 날짜를 입력하세요")
+
+    # 파일별 결과 (실패한 파일만 오류 표시, 나머지는 합쳐서 반영)
+    for name, rows, error, seconds in st.session_state.get("ingest_report", []):
+        if error:
+            st.sidebar.error(f"❌ {name}: {error}")
         else:
-            combined = pd.concat(all_dfs, ignore_index=True)
-        
-        # 날짜순 정렬
-        if "날짜" in combined.columns:
-            combined["날짜"] = pd.to_datetime(combined["날짜"], errors="coerce")
-            combined = combined.sort_values("날짜", na_position="last").reset_index(drop=True)
-        
-        st.session_state[f"month_{upload_month}"] = combined
-        st.sidebar.success(f"✅ {upload_month}월에 {len(combined)}건 로드 완료 ({len(uploaded_files)}개 파일 합침)")
-    except Exception as e:
-        st.sidebar.error(f"파일 읽기 실패: {e}")
+            st.sidebar.caption(f"📄 {name} — {rows}건 ({seconds:.2f}s)")
 
+    stats = st.session_state.parse_cache.stats()
+    st.sidebar.caption(f"파싱 캐시 — 적중 {stats['hits']} · 미스 {stats['misses']} · "
+                       f"{stats['entries']}개 ({stats['bytes'] / 1024 / 1024:.1f}MB)")
 
-# ===================== 탭 구성 =====================
 
-st.title("💰 가계부 대시보드")
+# ===================== 사이드바: 자동분류 키워드 =====================
+
+with st.sidebar.expander("🔑 자동분류 키워드 추가"):
+    new_kw = st.text_input("키워드 (지출 내용에 포함된 단어)", key="kw_text")
+    kw_major = st.selectbox("대분류", ALL_MAJOR, key="kw_major")
+    kw_minor = st.selectbox("소분류", CATEGORY_TREE[kw_major], key="kw_minor")
+    if st.button("➕ 추가", key="kw_add") and new_kw.strip():
+        get_classifier().add(new_kw.strip().lower(), kw_major, kw_minor)
+        st.toast(f"✅ '{new_kw.strip()}' → {kw_major} / {kw_minor}")
+
+
+# ===================== 사이드바: 결제 알림 가져오기 =====================
+
+def add_notices(routed: dict) -> list[str]:
+    """(연도, 월) → [(순번, 알림 행)] 을 그 달 아이폰 결제내역 뒤에 붙이고 저장 — "2025년 3월 N건" 목록"""
+    added = []
+    for p, parts in routed.items():
+        rows = concat_ledgers([df for _, df in parts])
+        merged = append_rows(load_part("iphone", p), rows)
+        st.session_state[part_key("iphone", p)] = merged.sort_values("날짜", na_position="last", kind="stable")
+        st.session_state.pop(f"{editor_prefix('iphone', p)}_editor", None)
+        persist("iphone", p)
+        added.append(f"{period_label(p)} {len(rows)}건")
+    return added
+
 
-tab_names = ["🏠 홈"] + [f"{m}월" for m in range(1, 13)] + ["💵 수입"]
-tabs = st.tabs(tab_names)
-
-# ===================== 홈 탭 (Summary Dashboard) =====================
-
-with tabs[0]:
-    st.subheader("📊 연간 요약 대시보드")
-
-    # 전체 월 데이터 합치기
-    all_data = []
-    for m in range(1, 13):
-        mdf = st.session_state[f"month_{m}"]
-        if len(mdf) > 0:
-            mdf_copy = mdf.copy()
-            mdf_copy["월"] = f"{m}월"
-            all_data.append(mdf_copy)
-
-    if all_data:
-        combined = pd.concat(all_data, ignore_index=True)
-        amount_col = "결제금액" if "결제금액" in combined.columns else None
-
-        if amount_col and len(combined) > 0:
-            # 메트릭 카드
-            col1, col2, col3 = st.columns(3)
-            total = combined[amount_col].sum()
-            count = len(combined)
-            avg = combined[amount_col].mean()
-            col1.metric("💵 총 지출", f"₩{total:,.0f}")
-            col2.metric("📝 건수", f"{count}건")
-            col3.metric("📈 평균", f"₩{avg:,.0f}")
-
-            # 월별 지출 바차트
-            st.markdown("#### 📅 월별 지출")
-            monthly = combined.groupby("월")[amount_col].sum().reindex(MONTHS).fillna(0)
-            fig_m = px.bar(x=monthly.index, y=monthly.values, labels={"x": "월", "y": "금액"},
-                          text=monthly.values)
-            fig_m.update_traces(texttemplate="₩%{text:,.0f}", textposition="outside")
-            st.plotly_chart(fig_m, use_container_width=True)
-
-            # 대분류별 파이차트
-            chart_col1, chart_col2 = st.columns(2)
-            if "대분류" in combined.columns:
-                with chart_col1:
-                    st.markdown("#### 대분류별 지출")
-                    major_sum = combined.groupby("대분류")[amount_col].sum().reset_index()
-                    major_sum = major_sum[major_sum[amount_col] > 0]
-                    if len(major_sum) > 0:
-                        fig1 = px.pie(major_sum, values=amount_col, names="대분류", hole=0.4,
-                                      color_discrete_sequence=px.colors.qualitative.Set2)
-                        fig1.update_traces(textinfo="label+percent+value",
-                                          texttemplate="%{label}<br>%{percent}<br>₩%{value:,.0f}")
-                        st.plotly_chart(fig1, use_container_width=True)
-
-            if "소분류" in combined.columns:
-                with chart_col2:
-                    st.markdown("#### 소분류별 지출")
-                    minor_sum = combined.groupby("소분류")[amount_col].sum().reset_index()
-                    minor_sum = minor_sum[minor_sum[amount_col] > 0].sort_values(amount_col, ascending=True)
-                    if len(minor_sum) > 0:
-                        fig2 = px.bar(minor_sum, x=amount_col, y="소분류", orientation="h",
-                                      color=amount_col, color_continuous_scale="Blues",
-                                      text=minor_sum[amount_col].apply(lambda x: f"₩{x:,.0f}"))
-                        fig2.update_layout(showlegend=False, coloraxis_showscale=False)
-                        st.plotly_chart(fig2, use_container_width=True)
-
-            # 카테고리별 합계
-            if "대분류" in combined.columns and "소분류" in combined.columns:
-                st.markdown("#### 📑 카테고리별 합계")
-                summary = combined.groupby(["대분류", "소분류"])[amount_col].agg(["sum", "count"]).reset_index()
-                summary.columns = ["대분류", "소분류", "합계", "건수"]
-                summary = summary.sort_values("합계", ascending=False)
-                summary["합계"] = summary["합계"].apply(lambda x: f"₩{x:,.0f}")
-                st.dataframe(summary, use_container_width=True, hide_index=True)
-
-            # 수입 요약
-            income = st.session_state.income_df
-            total_income = income[MONTHS].sum().sum()
-            if total_income > 0:
-                st.markdown("---")
-                st.markdown(f"#### 💵 총 수입: ₩{total_income:,.0f}")
-                st.markdown(f"#### 💰 수지 (수입-지출): ₩{total_income - total:,.0f}")
+def save_undated_notices(df: pd.DataFrame):
+    try:
+        st.session_state.undated_notices = st.session_state.store.save("iphone", *UNDATED, df)
+    except (sqlite3.Error, ValueError) as e:
+        st.session_state.undated_notices = df
+        st.warning(f"저장 실패 (날짜 없는 알림): {e}")
+
+
+def run_message_import(source_id: str, open_batches) -> None:
+    """지난번 이후의 메시지만 파싱해 월별 아이폰 결제내역에 추가 — open_batches(after)는 (rowid, 배치) 이터레이터"""
+    store = st.session_state.store
+    meta_key = f"messages:{source_id}"
+    after = 0 if st.session_state.get("msg_restart") else int(store.get_meta(meta_key, "0"))
+    with st.spinner("메시지 읽는 중…"):
+        result = import_messages(open_batches(after), get_classifier(), last_rowid=after)
+    routed, undated = route_by_period([result.rows.reset_index(drop=True)])
+    added = add_notices(routed)
+    if len(undated):
+        save_undated_notices(append_rows(st.session_state.undated_notices, undated))
+    store.set_meta(meta_key, str(result.last_rowid))
+    summary = " · ".join(added) if added else "새 결제 알림 없음"
+    st.success(f"✅ 메시지 {result.scanned:,}개 확인 — {summary}")
+    if len(undated):
+        st.warning(f"날짜를 읽지 못한 알림 {len(undated)}건은 화면 위 '날짜 없는 알림'에 보관했습니다")
+
+
+with st.sidebar.expander("📱 결제 알림 가져오기 (iMessage/문자)"):
+    source = st.radio("원본", ["chat.db 경로", "파일 업로드"], horizontal=True, key="msg_source")
+    if source == "chat.db 경로":
+        db_path = st.text_input("chat.db 위치", key="msg_db_path",
+                                value=str(Path.home() / "Library" / "Messages" / "chat.db"))
+        msg_file = None
+    else:
+        msg_file = st.file_uploader("chat.db 사본 또는 문자 내보내기 (.db, .csv, .txt)",
+                                    type=["db", "csv", "txt"], key="msg_file")
+    st.checkbox("처음부터 다시 읽기 (이미 가져온 알림이 중복될 수 있음)", key="msg_restart")
+
+    if st.button("📥 가져오기", key="msg_import"):
+        try:
+            if msg_file is None:
+                path = Path(db_path).expanduser()
+                run_message_import(f"chatdb:{path.resolve()}", lambda after: iter_chat_db(path, after))
+            elif msg_file.name.lower().endswith(".db"):
+                # SQLite는 파일 경로가 필요 — 임시 파일로 쓰고 끝나면 지움
+                with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+                    tmp.write(msg_file.getvalue())
+                try:
+                    run_message_import(f"chatdb:{msg_file.name}", lambda after: iter_chat_db(tmp.name, after))
+                finally:
+                    os.unlink(tmp.name)
+            else:
+                data = msg_file.getvalue()
+                run_message_import(f"dump:{msg_file.name}",
+                                   lambda after: iter_dump(data, msg_file.name, after))
+        except (sqlite3.Error, ValueError, OSError) as e:
+            st.error(f"가져오기 실패: {e}")
+
+
+# ===================== 홈 (Summary Dashboard) =====================
+
+def sync_aggregates(periods: list[Period]) -> PartitionAggregates:
+    """기간의 파티션 부분합 준비 — 올린 표는 바뀐 것만 다시 집계, 안 올린 파티션은 저장소에서 한 번에 집계"""
+    agg = st.session_state.aggregates
+    for p in periods:
+        key = part_key("month", p)
+        if key in st.session_state:
+            agg.update(p, st.session_state[key])
+    missing = agg.missing(periods)
+    if missing:
+        with stage("store.partials", len(missing)):
+            for p, partial in st.session_state.store.partials("month", missing).items():
+                agg.put(p, partial)
+    return agg
+
+
+def render_chart(name: str, build, *data):
+    """홈 화면 차트 — 입력 집계가 그대로면 지난번 그림 재사용"""
+    if "figure_cache" not in st.session_state:
+        st.session_state.figure_cache = FigureCache()
+    with stage(f"home.chart.{name}"):
+        fig = st.session_state.figure_cache.get(name, build, *data)
+        st.plotly_chart(fig, use_container_width=True, key=f"home_chart_{name}")
+
+
+def render_home(year: int):
+    st.subheader(f"📊 {year}년 요약 대시보드")
+
+    periods = year_periods(year)
+    annual = sync_aggregates(periods).summary(periods)
+
+    if annual.count > 0:
+        # 메트릭 카드
+        col1, col2, col3 = st.columns(3)
+        total = annual.total
+        col1.metric("💵 총 지출", f"₩{total:,.0f}")
+        col2.metric("📝 건수", f"{annual.count}건")
+        col3.metric("📈 평균", f"₩{annual.avg:,.0f}")
+
+        # 월별 지출 바차트
+        st.markdown("#### 📅 월별 지출")
+        monthly = pd.Series(annual.monthly.to_numpy(), index=[f"{m}월" for _, m in annual.monthly.index])
+        monthly = monthly.reindex(MONTHS).fillna(0)
+        render_chart("monthly", charts.monthly_bar, monthly)
+
+        # 대분류별 파이차트
+        chart_col1, chart_col2 = st.columns(2)
+        with chart_col1:
+            st.markdown("#### 대분류별 지출")
+            if (annual.by_major > 0).any():
+                render_chart("major", charts.major_pie, annual.by_major)
+
+        with chart_col2:
+            st.markdown("#### 소분류별 지출")
+            if (annual.by_minor > 0).any():
+                render_chart("minor", charts.minor_bar, annual.by_minor)
+
+        # 자세히 — 일별 히트맵, 대분류별 월간 추이 (둘 다 집계에서 바로)
+        tab_daily, tab_trend = st.tabs(["🗓️ 일별 지출", "📈 대분류별 추이"])
+        with tab_daily:
+            render_chart("daily", charts.daily_heatmap, annual.daily)
+        with tab_trend:
+            if len(annual.major_by_month.columns):
+                render_chart("trend", charts.category_trend, annual.major_by_month)
+
+        # 카테고리별 합계 — 금액은 숫자 그대로 두고 표에서 형식화
+        if len(annual.by_pair) > 0:
+            st.markdown("#### 📑 카테고리별 합계")
+            summary = annual.by_pair.reset_index()
+            summary.columns = ["대분류", "소분류", "합계", "건수"]
+            summary = summary.sort_values("합계", ascending=False)
+            st.dataframe(summary, use_container_width=True, hide_index=True,
+                         column_config={"합계": st.column_config.NumberColumn("합계", format="₩%d")})
+
+        render_period_compare(year)
+
+        # 수입 요약
+        income = income_df(year)
+        total_income = income[MONTHS].sum().sum()
+        if total_income > 0:
+            st.markdown("---")
+            st.markdown(f"#### 💵 총 수입: ₩{total_income:,.0f}")
+            st.markdown(f"#### 💰 수지 (수입-지출): ₩{total_income - total:,.0f}")
     else:
         st.info("데이터를 업로드하면 연간 요약이 표시됩니다.")
 
 
-# ===================== 월별 탭 (1~12월) =====================
-
-for m in range(1, 13):
-    with tabs[m]:
-        st.subheader(f"📋 {m}월 데이터")
-
-        # 지출 데이터 테이블
-        month_key = f"month_{m}"
-        df = st.session_state[month_key]
-        edited = render_data_table(df, key_prefix=f"m{m}", state_key=month_key)
-        edited = render_category_editor(edited, key_prefix=f"m{m}_cat")
-        st.session_state[month_key] = edited
-
-        # 실지출 계산 버튼
-        if st.button("🔄 실지출 계산 (결제금액 - 할인)", key=f"calc_{m}"):
-            st.session_state[month_key] = calc_actual_spend(st.session_state[month_key])
-            # 위젯 키 리셋하여 새 데이터로 테이블 재생성
-            old_key = f"m{m}_editor"
-            if old_key in st.session_state:
-                del st.session_state[old_key]
-            st.rerun()
-
-        # 월 요약
-        if len(edited) > 0 and "결제금액" in edited.columns:
-            total = edited["결제금액"].sum()
-            st.metric(f"{m}월 총 지출", f"₩{total:,.0f}")
-
-        # 다운로드
-        if len(edited) > 0:
-            buf = BytesIO()
-            edited.to_excel(buf, index=False, engine="openpyxl")
-            st.download_button(
-                f"📥 {m}월 데이터 다운로드", buf.getvalue(),
-                file_name=f"가계부_{m}월.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                key=f"dl_{m}"
-            )
-
-        # 아이폰 결제내역
-        st.markdown("---")
-        st.subheader(f"📱 {m}월 아이폰 결제내역")
-        st.caption("iMessage 결제 알림 자동 정리 (준비 중)")
-
-        iphone_key = f"iphone_{m}"
-        iphone_df = st.session_state[iphone_key]
-        edited_iphone = render_data_table(iphone_df, key_prefix=f"ip{m}", state_key=iphone_key)
-
-
-# ===================== 수입 탭 =====================
-
-with tabs[13]:
-    st.subheader("💵 수입")
+def render_period_compare(year: int):
+    """올해 누적 / 최근 12개월 / 전년 같은 기간 대비 — 파티션 부분합만 더함 (월 표는 읽지 않음)"""
+    today = date.today()
+    ref = today if year == today.year else date(year, 12, 31)
+    ytd, t12 = year_to_date(ref), trailing(ref)
+    agg = sync_aggregates(ytd + year_ago(ytd) + t12 + year_ago(t12))
+    cur, prev = agg.summary(ytd), agg.summary(year_ago(ytd))
+    cur_12, prev_12 = agg.summary(t12), agg.summary(year_ago(t12))
+
+    st.markdown("#### 🔁 기간 비교")
+    ytd_label = f"{ref.year}년 1~{ref.month}월"
+    col1, col2 = st.columns(2)
+    col1.metric(f"누적 ({ytd_label})", f"₩{cur.total:,.0f}",
+                delta=f"{cur.total - prev.total:+,.0f} (전년 같은 기간)", delta_color="inverse")
+    col2.metric(f"최근 12개월 ({period_label(t12[0])}~)", f"₩{cur_12.total:,.0f}",
+                delta=f"{cur_12.total - prev_12.total:+,.0f} (1년 전 12개월)", delta_color="inverse")
+
+    compare = compare_by_major(cur, prev)
+    if len(compare):
+        render_chart("yoy", charts.compare_bar, compare, ytd_label, f"{ref.year - 1}년 1~{ref.month}월")
+        st.dataframe(compare.reset_index(), use_container_width=True, hide_index=True, column_config={
+            "이번": st.column_config.NumberColumn(ytd_label, format="₩%d"),
+            "이전": st.column_config.NumberColumn("전년 같은 기간", format="₩%d"),
+            "증감": st.column_config.NumberColumn("증감", format="₩%d"),
+            "증감률": st.column_config.NumberColumn("증감률", format="percent"),
+        })
+
+
+# ===================== 월별 화면 (1~12월) =====================
+
+def month_summary(p: Period) -> tuple[int, float]:
+    """월별 (건수, 총 지출) — 파티션 부분합을 그대로 사용 (sync_aggregates 뒤에 부름)"""
+    part = st.session_state.aggregates.partial(p)
+    return (0, 0.0) if part is None else (part.rows, part.total)
+
+
+def render_month(p: Period):
+    y, m = p
+    st.subheader(f"📋 {period_label(p)} 데이터")
+
+    # 지출 데이터 테이블
+    month_key = part_key("month", p)
+    prefix = editor_prefix("month", p)
+    df = load_part("month", p)
+    edited = render_data_table(df, key_prefix=prefix, state_key=month_key)
+    edited = render_category_editor(edited, key_prefix=f"{prefix}_cat", state_key=month_key,
+                                    rows=st.session_state.get(f"{prefix}_page_rows"))
+    st.session_state[month_key] = edited
+    persist("month", p)
+
+    # 실지출 계산 버튼
+    if st.button("🔄 실지출 계산 (결제금액 - 할인)", key=f"calc_{y}_{m}"):
+        st.session_state[month_key] = calc_actual_spend(st.session_state[month_key])
+        # 위젯 키 리셋하여 새 데이터로 테이블 재생성
+        old_key = f"{prefix}_editor"
+        if old_key in st.session_state:
+            del st.session_state[old_key]
+        rerun()
+
+    # 월 요약
+    if len(edited) > 0 and "결제금액" in edited.columns:
+        total = edited["결제금액"].sum()
+        st.metric(f"{m}월 총 지출", f"₩{total:,.0f}")
+
+    # 다운로드 — 요청할 때만 엑셀 생성
+    if len(edited) > 0:
+        render_export({f"{m}월": edited}, file_name=f"가계부_{y}년_{m}월.xlsx",
+                      label=f"{m}월 데이터", key=f"dl_{y}_{m}")
+
+    # 아이폰 결제내역
+    st.markdown("---")
+    st.subheader(f"📱 {period_label(p)} 아이폰 결제내역")
+    st.caption("사이드바 '📱 결제 알림 가져오기'에서 iMessage/문자 결제 알림을 불러옵니다")
+
+    iphone_key = part_key("iphone", p)
+    iphone_df = load_part("iphone", p)
+    edited_iphone = render_data_table(iphone_df, key_prefix=editor_prefix("iphone", p), state_key=iphone_key)
+    persist("iphone", p)
+
+    render_reconcile(p)
+
+
+def month_reconciliation(p: Period, window: int, min_similarity: float) -> Reconciliation:
+    """명세서 ↔ 알림 대조 결과 — 두 표의 대조 칼럼 내용과 설정이 그대로면 지난 결과 재사용
+
+    편집기는 리런마다 새 표 객체를 돌려주므로 객체가 아니라 내용 해시로 비교한다
+    (객체가 같으면 해시도 다시 계산하지 않음).
+    """
+    stmt, notes = st.session_state[part_key("month", p)], st.session_state[part_key("iphone", p)]
+    cache_key = f"recon_{p[0]}_{p[1]}"
+    cached = st.session_state.get(cache_key)
+    if cached is not None and cached[0] is stmt and cached[1] is notes:
+        fps = cached[2]
+    else:
+        fps = (columns_fingerprint(stmt, RECONCILE_COLUMNS, index=True),
+               columns_fingerprint(notes, RECONCILE_COLUMNS, index=True))
+    settings = (window, min_similarity)
+    if cached is not None and cached[2] == fps and cached[3] == settings:
+        result = cached[4]
+    else:
+        with stage("reconcile", len(stmt) + len(notes)):
+            result = reconcile(stmt, notes, window, min_similarity)
+    st.session_state[cache_key] = (stmt, notes, fps, settings, result)
+    return result
+
+
+def render_reconcile(p: Period):
+    """명세서와 아이폰 알림 대조 — 짝지은 행 / 명세서에만 / 알림에만, 확인한 짝은 분류 복사"""
+    m = f"{p[0]}_{p[1]}"     # 위젯 키 접미사
+    stmt, notes = st.session_state[part_key("month", p)], st.session_state[part_key("iphone", p)]
+    if stmt.empty or notes.empty:
+        return
+    with st.expander("🔗 명세서 ↔ 알림 대조"):
+        col1, col2 = st.columns(2)
+        window = col1.slider("날짜 허용 범위 (일)", 0, 7, DEFAULT_WINDOW, key=f"recon_window_{m}")
+        min_sim = col2.slider("가맹점 이름 유사도", 0.0, 1.0, DEFAULT_SIMILARITY, 0.05, key=f"recon_sim_{m}")
+        result = month_reconciliation(p, window, min_sim)
+        pairs = result.matched
+        cols = ["날짜", "지출 내용", "결제금액", "대분류", "소분류"]
+
+        tab_match, tab_stmt, tab_note = st.tabs([
+            f"짝지은 거래 {len(pairs)}건", f"명세서에만 {len(result.statement_only)}건",
+            f"알림에만 {len(result.notification_only)}건"])
+        with tab_match:
+            left = stmt.loc[pairs["stmt_row"], cols].reset_index(drop=True).add_prefix("명세서 ")
+            right = notes.loc[pairs["note_row"], cols].reset_index(drop=True).add_prefix("알림 ")
+            table = pd.concat([left, right], axis=1)
+            table.insert(0, "확인", True)
+            table["날짜 차이"] = pairs["days_apart"].to_numpy()
+            table["유사도"] = pairs["score"].to_numpy()
+            reviewed = st.data_editor(table, hide_index=True, use_container_width=True,
+                                      disabled=[c for c in table.columns if c != "확인"],
+                                      key=f"recon_review_{m}")
+            confirmed = pairs[reviewed["확인"].to_numpy()] if len(pairs) else pairs
+            overwrite = st.checkbox("이미 분류된 행도 덮어쓰기", key=f"recon_overwrite_{m}")
+            b1, b2 = st.columns(2)
+            if b1.button("📱→📋 알림 분류를 명세서로", key=f"recon_to_stmt_{m}"):
+                st.session_state[part_key("month", p)] = copy_categories(
+                    notes, stmt, confirmed, "note_row", "stmt_row", overwrite)
+                st.session_state.pop(f"{editor_prefix('month', p)}_editor", None)
+                persist("month", p)
+                rerun()
+            if b2.button("📋→📱 명세서 분류를 알림으로", key=f"recon_to_note_{m}"):
+                st.session_state[part_key("iphone", p)] = copy_categories(
+                    stmt, notes, confirmed, "stmt_row", "note_row", overwrite)
+                st.session_state.pop(f"{editor_prefix('iphone', p)}_editor", None)
+                persist("iphone", p)
+                rerun()
+        with tab_stmt:
+            st.dataframe(stmt.loc[result.statement_only], use_container_width=True)
+        with tab_note:
+            st.dataframe(notes.loc[result.notification_only], use_container_width=True)
+
+
+# ===================== 수입 =====================
+
+def render_income(year: int):
+    st.subheader(f"💵 {year}년 수입")
 
     edited_income = st.data_editor(
-        st.session_state.income_df,
+        income_df(year),
         num_rows="dynamic",
         use_container_width=True,
-        key="income_editor"
+        key=f"income_editor_{year}"
     )
-    st.session_state.income_df = edited_income
+    st.session_state[f"income_{year}"] = edited_income
+    st.session_state.store.save_income(year, edited_income)
 
     total_income = edited_income[MONTHS].sum().sum()
     monthly_totals = edited_income[MONTHS].sum(axis=0)
     st.markdown(f"**총 수입: ₩{total_income:,.0f}**")
     st.bar_chart(monthly_totals)
+
+
+# ===================== 화면 구성 =====================
+
+st.title("💰 가계부 대시보드")
+
+# 선택한 화면 하나만 그림 (st.tabs는 12개월 편집기를 매 리런마다 전부 만듦) — 월은 사이드바에서 고른 연도
+VIEWS = ["home", *range(1, 13), "income"]
+
+
+def view_label(v) -> str:
+    if v == "home":
+        return "🏠 홈"
+    if v == "income":
+        return "💵 수입"
+    return f"{v}월"
+
+
+def view_from_query():
+    """?view=home|1..12|income — 새로고침/공유 링크에서도 같은 화면으로"""
+    q = str(st.query_params.get("view", "home"))
+    if q.isdigit() and 1 <= int(q) <= 12:
+        return int(q)
+    return q if q in ("home", "income") else "home"
+
+
+if "view" not in st.session_state:
+    st.session_state.view = view_from_query()
+
+view = st.radio("화면", VIEWS, format_func=view_label, horizontal=True,
+                key="view", label_visibility="collapsed")
+if st.query_params.get("view") != str(view):
+    st.query_params["view"] = str(view)
+
+render_duplicate_review()
+render_undated()
+render_undated_notices()
+summary_slot = st.empty()
+
+if view == "home":
+    render_home(year)
+elif view == "income":
+    render_income(year)
+else:
+    render_month((year, view))
+
+# 다른 월은 요약만 표시 (선택한 화면을 그린 뒤라 방금 편집한 내용까지 반영)
+sync_aggregates(year_periods(year))
+chips = []
+for m in range(1, 13):
+    count, total = month_summary((year, m))
+    if count:
+        chips.append(f"{m}월 {count}건 ₩{total:,.0f}")
+if chips:
+    summary_slot.caption(" · ".join(chips))
+
+
+# ===================== 사이드바: 연간 내보내기 =====================
+# 화면을 그린 뒤에 둬서 방금 편집한 내용까지 포함
+
+def year_sheets(year: int) -> dict[str, pd.DataFrame]:
+    """한 해 전체 시트 — 올라와 있지 않은 월은 세션에 올리지 않고 읽음"""
+    sheets = {f"{m}월": read_part("month", (year, m)) for m in range(1, 13)}
+    sheets["수입"] = income_df(year)
+    return sheets
+
+
+with st.sidebar.expander(f"📥 {year}년 전체 다운로드"):
+    # 월 표를 읽지 않고 바뀜 여부 확인 — 저장 횟수(파티션별) + 수입 표 내용
+    store = st.session_state.store
+    token = "|".join([f"year:{year}", *(str(store.revision("month", year, m)) for m in range(1, 13)),
+                      st.session_state.export_cache.fingerprint({"수입": income_df(year)})])
+    render_export(lambda: year_sheets(year), file_name=f"가계부_{year}년.xlsx",
+                  label=f"{year}년 전체", key=f"dl_year_{year}", token=token)
+
+
+# ===================== 사이드바: 계측 (debug) =====================
+# 스크립트 맨 끝 — 이번 리런 전체가 기록된 뒤에 표시
+
+if DEBUG:
+    prof = profiling.deactivate()
+    report = prof.report()
+    report["label"] = f"view={view}"
+    runs = st.session_state.setdefault("debug_runs", [])
+    runs.append(report)
+    del runs[:-50]
+    with st.sidebar.expander("🐞 계측"):
+        st.checkbox("cProfile (다음 리런부터)", key="debug_cprofile")
+        st.checkbox("tracemalloc 최대 메모리 (다음 리런부터)", key="debug_tracemalloc")
+        peak = f" · 최대 메모리 {report['peak_mb']:.1f}MB" if report["peak_mb"] is not None else ""
+        st.caption(f"이번 리런 {report['seconds'] * 1000:.0f}ms{peak}")
+        stages = pd.DataFrame.from_dict(report["stages"], orient="index")
+        if len(stages):
+            stages["ms"] = (stages.pop("seconds") * 1000).round(1)
+            st.dataframe(stages[["ms", "calls", "rows"]], use_container_width=True)
+        if report["counters"]:
+            st.json(report["counters"])
+        if report["profile"]:
+            st.code(report["profile"])
+        st.download_button(f"📥 JSON ({len(runs)}회 리런)", profiling.dump_reports(runs),
+                           file_name="accountbook_profile.json", mime="application/json", key="debug_json")
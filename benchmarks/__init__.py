@@ -0,0 +1 @@
+"""헤드리스 벤치마크 — `python -m benchmarks.<모듈>` 로 실행"""
@@ -0,0 +1,72 @@
+"""대분류/소분류 교정 벤치마크 — 행 단위 .at 루프 vs 일괄 교정 vs 편집 행만 교정
+
+    python -m benchmarks.bench_categories --rows 5000
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from benchmarks.synth import make_ledger_month
+from ledger.classify import fix_minor_categories
+from ledger.config import ALL_MINOR, CATEGORY_TREE
+
+
+def legacy_fix(edited: pd.DataFrame) -> pd.DataFrame:
+    """기존 render_data_table의 교정 루프"""
+    for idx in edited.index:
+        major = str(edited.at[idx, "대분류"]).strip()
+        minor = str(edited.at[idx, "소분류"]).strip()
+        if major in CATEGORY_TREE and minor and minor not in CATEGORY_TREE[major]:
+            edited.at[idx, "소분류"] = CATEGORY_TREE[major][0]
+    return edited
+
+
+def scramble(df: pd.DataFrame, ratio: float, seed: int = 0) -> pd.DataFrame:
+    """일부 행의 소분류를 아무 값(빈 칸/결측 포함)으로 바꿔 교정 대상을 만듦"""
+    rng = random.Random(seed)
+    df = df.copy()
+    df["소분류"] = df["소분류"].astype(object)   # 범주에 없는 값도 넣을 수 있게
+    choices = ALL_MINOR + ["", None, "없는분류"]
+    for idx in rng.sample(list(df.index), int(len(df) * ratio)):
+        df.at[idx, "소분류"] = rng.choice(choices)
+    return df
+
+
+def best_of(fn, repeat: int) -> tuple[float, pd.DataFrame]:
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 5_000, 50_000])
+    parser.add_argument("--bad", type=float, default=0.1, help="어긋난 행 비율")
+    parser.add_argument("--edits", type=int, default=5, help="리런 한 번에 편집되는 행 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'행':>8}{'루프(s)':>10}{'일괄(s)':>10}{'편집행(s)':>11}{'일괄 배속':>10}")
+    for rows in args.rows:
+        df = scramble(make_ledger_month(1, rows), args.bad)
+        loop_t, expected = best_of(lambda: legacy_fix(df.copy()), args.repeat)
+        bulk_t, got = best_of(lambda: fix_minor_categories(df.copy()), args.repeat)
+        if not expected.equals(got):
+            raise SystemExit(f"결과 불일치: {rows}행")
+
+        # 이미 교정된 표에서 몇 행만 편집된 경우
+        edited = scramble(expected, args.edits / rows, seed=1)
+        changed = edited.index[edited["소분류"].ne(expected["소분류"])]
+        delta_t, got = best_of(lambda: fix_minor_categories(edited.copy(), changed), args.repeat)
+        if not legacy_fix(edited.copy()).equals(got):
+            raise SystemExit(f"편집 행 교정 결과 불일치: {rows}행")
+        print(f"{rows:>8,}{loop_t:>10.4f}{bulk_t:>10.4f}{delta_t:>11.4f}{loop_t / bulk_t:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""날짜 파싱 벤치마크 — 행 단위 parse_date vs 칼럼 단위 parse_dates
+
+    python -m benchmarks.bench_dates --rows 50000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from ledger.dates import parse_date, parse_dates
+
+WEEKDAYS = "월화수목금토일"
+
+# 카드사별로 자주 보이는 날짜 표기
+STYLES = {
+    "dash": lambda d: d.strftime("%Y-%m-%d"),
+    "dot_weekday": lambda d: f"{d:%Y.%m.%d} ({WEEKDAYS[d.weekday()]})",
+    "slash": lambda d: d.strftime("%Y/%m/%d"),
+    "us": lambda d: d.strftime("%m/%d/%Y"),
+    "datetime": lambda d: d.strftime("%Y-%m-%d %H:%M:%S"),
+    "korean": lambda d: f"{d.year}년 {d.month:02d}월 {d.day:02d}일",
+    "serial": lambda d: (d - datetime(1899, 12, 30)).days,
+    "native": lambda d: d,
+}
+
+
+def make_column(rows: int, styles: list[str], seed: int = 0) -> pd.Series:
+    """합성 날짜 칼럼 — styles 중 하나씩 섞고 빈칸/쓰레기 값을 약간 포함"""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    values = []
+    for _ in range(rows):
+        r = rng.random()
+        if r < 0.01:
+            values.append(None)
+        elif r < 0.02:
+            values.append("합계")
+        else:
+            d = start + timedelta(days=rng.randrange(365), hours=rng.randrange(24))
+            values.append(STYLES[rng.choice(styles)](d))
+    return pd.Series(values, dtype=object)
+
+
+def timed(fn, repeat: int) -> tuple[float, pd.Series]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    scenarios = {
+        "단일 포맷 (dash)": ["dash"],
+        "요일 접미사 (dot_weekday)": ["dot_weekday"],
+        "한글 날짜 (korean)": ["korean"],
+        "엑셀 시리얼+날짜 객체": ["serial", "native"],
+        "전부 혼합": list(STYLES),
+    }
+    print(f"{'시나리오':<24}{'행':>9}{'기존(s)':>10}{'일괄(s)':>10}{'배속':>8}")
+    for name, styles in scenarios.items():
+        for rows in args.rows:
+            col = make_column(rows, styles)
+            old_t, old = timed(lambda: col.apply(parse_date), args.repeat)
+            new_t, new = timed(lambda: parse_dates(col), args.repeat)
+            # pandas 3은 해상도를 입력에 맞춰 추론(us/s)하므로 ns로 맞춰 값만 비교
+            if not pd.to_datetime(old).astype("datetime64[ns]").equals(new.astype("datetime64[ns]")):
+                raise SystemExit(f"결과 불일치: {name} / {rows}행")
+            print(f"{name:<24}{rows:>9,}{old_t:>10.3f}{new_t:>10.3f}{old_t / new_t:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
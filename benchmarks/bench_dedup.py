@@ -0,0 +1,44 @@
+"""중복 검사 벤치마크 — 겹치는 명세서 두 개 (기간 절반이 겹침) 에서 정확/느슨한 검사 시간
+
+    python -m benchmarks.bench_dedup --rows 10000 100000
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.synth import make_ledger_month
+from ledger.dedup import find_duplicates
+
+
+def overlapping(rows: int) -> tuple[pd.DataFrame, pd.DataFrame, int]:
+    """한 달 표를 둘로 나눠 앞 표는 1~20일, 뒤 표는 11일~말일 — 11~20일 행이 중복"""
+    month = make_ledger_month(1, rows)
+    day = month["날짜"].dt.day
+    first = month[day <= 20].reset_index(drop=True)
+    second = month[day > 10].reset_index(drop=True)
+    # 은행 내역처럼 가맹점명 표기가 조금 다르고 결제수단이 빈 행 섞기
+    bank = second.index % 5 == 0
+    second["지출 내용"] = second["지출 내용"].where(~bank, "(주)" + second["지출 내용"].astype(str))
+    second["결제수단"] = second["결제수단"].where(~bank, "")
+    return first, second, int(((day > 10) & (day <= 20)).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'행':>9}{'실제 중복':>10}{'정확(s)':>10}{'정확 건수':>10}{'느슨(s)':>10}{'느슨 건수':>10}")
+    for rows in args.rows:
+        first, second, expected = overlapping(rows)
+        t0 = time.perf_counter()
+        exact = find_duplicates([first, second])
+        t1 = time.perf_counter()
+        loose = find_duplicates([first, second], tolerant=True)
+        t2 = time.perf_counter()
+        print(f"{rows:>9,}{expected:>10,}{t1 - t0:>10.3f}{len(exact):>10,}{t2 - t1:>10.3f}{len(loose):>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""여러 파일 업로드 벤치마크 — 파일 수 × 작업 프로세스 수에 따른 처리 시간
+
+    python -m benchmarks.bench_ingest --files 1 10 30 --rows 2000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, timedelta
+from io import BytesIO
+
+import pandas as pd
+
+from ledger.config import AUTO_CLASSIFY
+from ledger.ingest import ingest_files, merge_results, shutdown_pool
+
+MERCHANTS = list(AUTO_CLASSIFY) + ["GS25 역삼점", "(주)우아한형제들", "네이버페이 결제", "알 수 없음"]
+
+
+def make_workbook(rows: int, seed: int) -> bytes:
+    """카드사 명세서 모양의 xlsx — 위쪽 안내 행 몇 줄 + 헤더 + 거래 행"""
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    body = pd.DataFrame({
+        "이용일자": [f"{start + timedelta(days=rng.randrange(365)):%Y.%m.%d}" for _ in range(rows)],
+        "이용카드": rng.choices(["신한카드", "삼성카드", "현대카드"], k=rows),
+        "가맹점명": rng.choices(MERCHANTS, k=rows),
+        "이용금액": [f"{rng.randrange(-5, 300) * 100:,}원" for _ in range(rows)],
+        "비고": [""] * rows,
+    })
+    preamble = pd.DataFrame([["이용대금 명세서"], [f"발행일 {start:%Y-%m-%d}"]])
+    buf = BytesIO()
+    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+        preamble.to_excel(writer, index=False, header=False)
+        body.to_excel(writer, index=False, startrow=3)
+    return buf.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, nargs="+", default=[1, 10, 30])
+    parser.add_argument("--rows", type=int, default=2000, help="파일당 행 수")
+    cpu = os.cpu_count() or 1
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, cpu} & set(range(1, cpu + 1))))
+    args = parser.parse_args()
+
+    files = [(f"statement_{i:02d}.xlsx", make_workbook(args.rows, seed=i)) for i in range(max(args.files))]
+    print(f"CPU {cpu}개, 파일당 {args.rows:,}행")
+    print(f"{'파일':>6}{'작업':>6}{'시간(s)':>10}{'파일/s':>10}{'배속':>8}")
+    try:
+        for n in args.files:
+            base = None
+            reference = None
+            for w in args.workers:
+                if w > 1:
+                    ingest_files(files[:w], workers=w)  # 프로세스 기동 비용 제외 (워밍업)
+                t0 = time.perf_counter()
+                results = ingest_files(files[:n], workers=w)
+                elapsed = time.perf_counter() - t0
+                merged = merge_results(results)
+                if reference is None:
+                    reference = merged
+                elif not reference.equals(merged):
+                    raise SystemExit(f"병합 결과가 작업 수에 따라 다름: 파일 {n}, 작업 {w}")
+                base = base or elapsed
+                print(f"{n:>6}{w:>6}{elapsed:>10.2f}{n / elapsed:>10.1f}{base / elapsed:>7.1f}x")
+    finally:
+        shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""결제 알림 가져오기 벤치마크 — 합성 chat.db에서 전체/증분 가져오기 시간과 최대 메모리
+
+    python -m benchmarks.bench_messages --messages 100000 --notice 0.2
+"""
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from benchmarks.synth import MERCHANTS
+from ledger.classify import KeywordClassifier
+from ledger.config import AUTO_CLASSIFY
+from ledger.messages import APPLE_EPOCH, import_messages, iter_chat_db
+
+NOTICES = [
+    "[Web발신]\n신한카드(1234)승인 홍*동 {amount:,}원(일시불){d:%m/%d %H:%M} {merchant} 누적1,234,567원",
+    "삼성1234승인 홍*동\n{amount:,}원 일시불\n{d:%m/%d %H:%M} {merchant}\n누적1,234,567원",
+    "[Web발신]\nKB국민카드1*2*승인\n홍*동님\n{amount:,}원 일시불\n{d:%m/%d %H:%M}\n{merchant}\n누적100,000원",
+    "현대카드 승인 홍*동 {amount:,}원 3개월 {d:%m/%d %H:%M} {merchant}",
+]
+CHATTER = ["오늘 저녁 뭐 먹어?", "회의 10분 늦어요", "[Web발신]\n인증번호 [123456]를 입력하세요", "ㅋㅋㅋ 알겠어"]
+
+
+def make_chat_db(path: Path, messages: int, notice_ratio: float, start_rowid: int = 1, seed: int = 0):
+    """chat.db의 message 표 모양만 흉내낸 SQLite (ROWID, date(나노초), text, attributedBody, is_from_me)"""
+    rng = random.Random(seed + start_rowid)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS message (ROWID INTEGER PRIMARY KEY, date INTEGER, "
+                 "text TEXT, attributedBody BLOB, is_from_me INTEGER)")
+    base = datetime(2025, 1, 1)
+    rows = []
+    for rowid in range(start_rowid, start_rowid + messages):
+        d = base + timedelta(minutes=rowid * 5)
+        if rng.random() < notice_ratio:
+            text = rng.choice(NOTICES).format(amount=rng.randrange(1, 300) * 100, d=d,
+                                              merchant=rng.choice(MERCHANTS))
+        else:
+            text = rng.choice(CHATTER)
+        nanos = int((d - APPLE_EPOCH.to_pydatetime()).total_seconds() * 1e9)
+        rows.append((rowid, nanos, text, None, int(rng.random() < 0.3)))
+    conn.executemany("INSERT INTO message VALUES (?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def run(path: Path, after: int, batch_size: int):
+    classifier = KeywordClassifier(AUTO_CLASSIFY)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = import_messages(iter_chat_db(path, after, batch_size), classifier, last_rowid=after)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--notice", type=float, default=0.2, help="결제 알림 비율")
+    parser.add_argument("--new", type=int, default=1_000, help="증분 가져오기 때 새로 온 메시지 수")
+    parser.add_argument("--batch", type=int, nargs="+", default=[1_000, 5_000, 20_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "chat.db"
+        make_chat_db(path, args.messages, args.notice)
+        print(f"메시지 {args.messages:,}개 (알림 비율 {args.notice:.0%})")
+        print(f"{'단계':<8}{'배치':>8}{'확인(개)':>10}{'알림(건)':>10}{'시간(s)':>10}{'최대 메모리(MB)':>16}")
+        last = 0
+        for batch in args.batch:
+            result, elapsed, peak = run(path, 0, batch)
+            last = result.last_rowid
+            print(f"{'전체':<8}{batch:>8,}{result.scanned:>10,}{len(result.rows):>10,}"
+                  f"{elapsed:>10.3f}{peak:>16.1f}")
+
+        make_chat_db(path, args.new, args.notice, start_rowid=last + 1)
+        result, elapsed, peak = run(path, last, args.batch[0])
+        print(f"{'증분':<8}{args.batch[0]:>8,}{result.scanned:>10,}{len(result.rows):>10,}"
+              f"{elapsed:>10.3f}{peak:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
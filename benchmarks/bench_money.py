@@ -0,0 +1,106 @@
+"""금액 정규화 벤치마크 — 기존 행 단위 필터 + 칼럼별 문자열 치환 vs normalize_amounts
+
+    python -m benchmarks.bench_money --rows 100000
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from ledger.money import normalize_amounts
+
+FULL_WIDTH = str.maketrans("0123456789,", "０１２３４５６７８９，")
+
+# 명세서에 나오는 금액 표기
+STYLES = {
+    "comma_won": lambda n: f"{n:,}원",
+    "comma": lambda n: f"{n:,}",
+    "plain": lambda n: str(n),
+    "number": lambda n: n,
+    "won_sign": lambda n: f"₩{n:,}" if n >= 0 else f"-₩{-n:,}",
+    "full_width": lambda n: f"{n:,}".translate(FULL_WIDTH),
+    "paren": lambda n: f"({-n:,})" if n < 0 else f"{n:,}",
+}
+BASIC = ["comma_won", "comma", "plain", "number"]
+
+
+def make_frame(rows: int, styles: list[str], seed: int = 0) -> pd.DataFrame:
+    """칼럼 매핑 직후 모양의 표 — 금액은 문자열, 환불/합계 행/빈 줄 포함"""
+    rng = random.Random(seed)
+    amounts, discounts = [], []
+    for _ in range(rows):
+        r = rng.random()
+        if r < 0.01:
+            amounts.append("합계")
+        elif r < 0.02:
+            amounts.append(None)
+        else:
+            n = rng.randrange(1, 3000) * 100 * (-1 if r < 0.07 else 1)
+            amounts.append(STYLES[rng.choice(styles)](n))
+        discounts.append(f"{rng.randrange(0, 10) * 100:,}원" if rng.random() < 0.2 else None)
+    return pd.DataFrame({
+        "날짜": ["2025.01.01"] * rows,
+        "지출 내용": ["스타벅스"] * rows,
+        "결제금액": pd.Series(amounts, dtype=object),
+        "할인": pd.Series(discounts, dtype=object),
+    })
+
+
+def legacy_amounts(df: pd.DataFrame) -> pd.DataFrame:
+    """기존 process_dataframe의 금액 처리 (필터 → 칼럼별 치환 → 음수/실지출 재변환)"""
+    def is_not_number(v):
+        if pd.isna(v):
+            return True
+        try:
+            float(str(v).replace(",", "").replace("원", "").strip())
+            return False
+        except (ValueError, TypeError):
+            return True
+    df = df[~df["결제금액"].apply(is_not_number)].reset_index(drop=True)
+    for col in ["결제금액", "할인", "실지출"]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(
+                df[col].astype(str).str.replace(",", "").str.replace("원", "").str.strip(),
+                errors="coerce"
+            )
+    df["결제금액"] = pd.to_numeric(df["결제금액"], errors="coerce").fillna(0)
+    neg_mask = df["결제금액"] < 0
+    df.loc[neg_mask, "할인"] = df.loc[neg_mask, "결제금액"].abs()
+    df.loc[neg_mask, "결제금액"] = df.loc[neg_mask, "결제금액"].abs()
+    df["할인"] = pd.to_numeric(df["할인"], errors="coerce").fillna(0)
+    df["실지출"] = df["결제금액"] - df["할인"]
+    return df
+
+
+def timed(fn, repeat: int) -> tuple[float, pd.DataFrame]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    scenarios = {"기존 표기만": BASIC, "₩/전각/괄호 포함": list(STYLES)}
+    print(f"{'시나리오':<18}{'행':>9}{'기존(s)':>10}{'일괄(s)':>10}{'배속':>8}{'기존 행':>10}{'일괄 행':>10}")
+    for name, styles in scenarios.items():
+        for rows in args.rows:
+            df = make_frame(rows, styles)
+            old_t, old = timed(lambda: legacy_amounts(df.copy()), args.repeat)
+            new_t, new = timed(lambda: normalize_amounts(df.copy()), args.repeat)
+            cols = ["결제금액", "할인", "실지출"]
+            if styles == BASIC and not old[cols].astype(float).equals(new[cols].astype(float)):
+                raise SystemExit(f"결과 불일치: {name} / {rows}행")
+            print(f"{name:<18}{rows:>9,}{old_t:>10.3f}{new_t:>10.3f}{old_t / new_t:>7.1f}x"
+                  f"{len(old):>10,}{len(new):>10,}")
+
+
+if __name__ == "__main__":
+    main()
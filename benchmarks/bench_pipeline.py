@@ -0,0 +1,140 @@
+"""업로드 → 홈 화면 경로 벤치마크 — 단계별 처리량과 최대 메모리, 저장해 둔 기준값과 비교
+
+    python -m benchmarks.bench_pipeline --rows 1000 10000 100000 1000000
+    python -m benchmarks.bench_pipeline --save-baseline        # 지금 결과를 기준값으로 저장
+
+benchmarks/baseline.json은 이 벤치마크를 처음 넣은 시점의 코드로 잰 기준값이다.
+기준값 파일이 없으면 비교 없이 넘어가지 않고 멈춘다.
+    python -m benchmarks.bench_pipeline --kind bank --repeat 5
+
+단계:
+    process_dataframe   명세서 원본(header=None으로 읽은 표) → 정리된 표
+    categorize_item     지출 내용 한 건씩 분류 (앱의 categorize_item과 같은 호출, 빈 캐시에서 시작)
+    calc_actual_spend   편집 표를 그릴 때마다 하는 실지출 계산
+    home_aggregate      (연도, 월) 표 → 홈 화면 기간 요약 (부분합 계산 + 합치기)
+
+시간은 --repeat 번 중 최솟값, 최대 메모리는 tracemalloc을 켜고 한 번 더 돌려서 잰다.
+'기준 대비'는 기준 시간 / 이번 시간 (1보다 크면 빨라짐).
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synth import make_statement
+from ledger.aggregate import PartitionAggregates
+from ledger.classify import KeywordClassifier
+from ledger.config import AUTO_CLASSIFY
+from ledger.ingest import process_dataframe
+from ledger.money import calc_actual_spend
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+STAGES = ["process_dataframe", "categorize_item", "calc_actual_spend", "home_aggregate"]
+
+
+def measure(fn: Callable, prepare: Callable, repeat: int) -> tuple[float, float]:
+    """(최소 시간 s, 최대 메모리 MB) — prepare()의 결과를 fn에 넘기고, prepare는 재지 않음"""
+    times = []
+    for _ in range(repeat):
+        arg = prepare()
+        t0 = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - t0)
+    arg = prepare()
+    tracemalloc.start()
+    try:
+        fn(arg)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def run_size(rows: int, kind: str, repeat: int, seed: int) -> dict[str, dict]:
+    raw = make_statement(rows, kind, seed=seed)
+    processed = process_dataframe(raw)
+    merchants = processed["지출 내용"].tolist()
+    day = processed["날짜"].dt
+    months = {(y, m): g.reset_index(drop=True)
+              for (y, m), g in processed.groupby([day.year, day.month], sort=True)}
+
+    def categorize(texts):
+        classifier = KeywordClassifier(AUTO_CLASSIFY)
+        for text in texts:
+            classifier.classify(text)
+
+    cases = {
+        "process_dataframe": (process_dataframe, lambda: raw),
+        "categorize_item": (categorize, lambda: merchants),
+        "calc_actual_spend": (calc_actual_spend, processed.copy),
+        "home_aggregate": (lambda frames: PartitionAggregates().sync(frames).summary(), lambda: months),
+    }
+    out = {}
+    for name in STAGES:
+        fn, prepare = cases[name]
+        seconds, peak = measure(fn, prepare, repeat)
+        out[name] = {"rows": rows, "seconds": round(seconds, 6),
+                     "rows_per_s": round(rows / seconds) if seconds else None, "peak_mb": round(peak, 3)}
+    return out
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": f"{platform.system()} {platform.machine()}",
+        "date": time.strftime("%Y-%m-%d"),
+    }
+
+
+def load_baseline(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8")).get("results", {})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--kind", choices=["card", "bank"], default="card")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="비교할 기준값 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 --baseline 경로에 저장")
+    args = parser.parse_args()
+
+    if args.save_baseline:
+        baseline = {}
+    elif args.baseline.exists():
+        baseline = load_baseline(args.baseline)
+    else:
+        raise SystemExit(f"기준값 파일이 없음: {args.baseline} — 먼저 --save-baseline으로 만들어 두세요")
+    results: dict[str, dict[str, dict]] = {name: {} for name in STAGES}
+    env = environment()
+    print(f"Python {env['python']} / pandas {env['pandas']} / numpy {env['numpy']} · {args.kind} 명세서")
+    if baseline:
+        print(f"기준값: {args.baseline}")
+    print(f"{'단계':<20}{'행':>11}{'시간(s)':>10}{'행/s':>13}{'최대 메모리(MB)':>16}{'기준 대비':>10}")
+    for rows in args.rows:
+        for name, r in run_size(rows, args.kind, args.repeat, args.seed).items():
+            results[name][str(rows)] = r
+            base = baseline.get(name, {}).get(str(rows))
+            ratio = f"{base['seconds'] / r['seconds']:.2f}x" if base and r["seconds"] else "-"
+            print(f"{name:<20}{rows:>11,}{r['seconds']:>10.3f}{r['rows_per_s'] or 0:>13,}"
+                  f"{r['peak_mb']:>16.1f}{ratio:>10}")
+        sys.stdout.flush()
+
+    if args.save_baseline:
+        payload = {"environment": env, "kind": args.kind, "repeat": args.repeat, "results": results}
+        args.baseline.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"기준값 저장: {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""명세서 ↔ 알림 대조 벤치마크 — 정렬 인덱스 구간 조회 vs 모든 쌍 비교
+
+    python -m benchmarks.bench_reconcile --rows 1000 10000 50000
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synth import make_ledger_month
+from ledger import reconcile as rc
+
+# 모든 쌍 비교는 행 수의 제곱이라 이 크기까지만 돌려서 결과를 맞춰 봄
+PAIRWISE_LIMIT = 3_000
+
+
+def make_notifications(stmt: pd.DataFrame, coverage: float = 0.8, seed: int = 0) -> pd.DataFrame:
+    """명세서 행 일부를 알림으로 — 날짜 ±1일, 가맹점명 변형, 알림에만 있는 행 추가"""
+    rng = random.Random(seed)
+    notes = stmt.sample(frac=coverage, random_state=seed).copy()
+    shift = [rng.choice([-1, 0, 0, 0, 1]) for _ in range(len(notes))]
+    notes["날짜"] = notes["날짜"] + pd.to_timedelta(shift, unit="D")
+    merchants = notes["지출 내용"].astype(str)
+    notes["지출 내용"] = [f"{m} 강남점" if rng.random() < 0.3 else m for m in merchants]
+    extra = stmt.sample(frac=0.1, random_state=seed + 1).copy()
+    extra["결제금액"] = extra["결제금액"] + 50
+    return pd.concat([notes, extra], ignore_index=True)
+
+
+def pairwise(statement: pd.DataFrame, notifications: pd.DataFrame, window: int,
+             min_similarity: float) -> pd.DataFrame:
+    """같은 배정 규칙, 후보만 모든 쌍에서 찾는 방식"""
+    original = rc.candidates
+
+    def all_pairs(stmt, notes, window):
+        s, n = np.meshgrid(np.arange(len(stmt)), np.arange(len(notes)), indexing="ij")
+        s, n = s.ravel(), n.ravel()
+        same = stmt["amount"].to_numpy()[s] == notes["amount"].to_numpy()[n]
+        near = np.abs(stmt["day"].to_numpy()[s] - notes["day"].to_numpy()[n]) <= window
+        keep = same & near
+        return pd.DataFrame({"s": s[keep], "n": n[keep]})
+
+    rc.candidates = all_pairs
+    try:
+        return rc.reconcile(statement, notifications, window, min_similarity).matched
+    finally:
+        rc.candidates = original
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--window", type=int, default=rc.DEFAULT_WINDOW)
+    parser.add_argument("--similarity", type=float, default=rc.DEFAULT_SIMILARITY)
+    args = parser.parse_args()
+
+    print(f"{'행':>8}{'알림':>8}{'짝':>8}{'명세서만':>10}{'알림만':>8}{'인덱스(s)':>11}{'전체 쌍(s)':>12}")
+    for rows in args.rows:
+        stmt = make_ledger_month(1, rows)
+        notes = make_notifications(stmt)
+        t0 = time.perf_counter()
+        result = rc.reconcile(stmt, notes, args.window, args.similarity)
+        fast = time.perf_counter() - t0
+        slow = "-"
+        if rows <= PAIRWISE_LIMIT:
+            t0 = time.perf_counter()
+            expected = pairwise(stmt, notes, args.window, args.similarity)
+            slow = f"{time.perf_counter() - t0:.3f}"
+            if not expected.reset_index(drop=True).equals(result.matched.reset_index(drop=True)):
+                raise SystemExit(f"결과 불일치: {rows}행")
+        print(f"{rows:>8,}{len(notes):>8,}{len(result.matched):>8,}{len(result.statement_only):>10,}"
+              f"{len(result.notification_only):>8,}{fast:>11.3f}{slow:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""리런 시간 측정 — 데이터가 있는 월 수(1 / 12)에 따른 스크립트 실행 시간
+
+Streamlit AppTest로 app.py를 브라우저 없이 실행한다.
+
+    python -m benchmarks.bench_rerun --rows 2000
+    python -m benchmarks.bench_rerun --app /path/to/old/app.py   # 이전 버전과 비교
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.synth import make_ledger_month
+
+APP = Path(__file__).resolve().parents[1] / "app.py"
+
+
+def time_reruns(app: Path, months: int, rows: int, view, repeat: int) -> list[float]:
+    # 빈 임시 저장소에서 실행 — 실제 가계부(data/ledger.sqlite3)를 건드리지 않음
+    old = os.environ.get("ACCOUNTBOOK_DB")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ACCOUNTBOOK_DB"] = str(Path(tmp) / "ledger.sqlite3")
+        try:
+            return _time_reruns(app, months, rows, view, repeat)
+        finally:
+            if old is None:
+                os.environ.pop("ACCOUNTBOOK_DB", None)
+            else:
+                os.environ["ACCOUNTBOOK_DB"] = old
+
+
+def _time_reruns(app: Path, months: int, rows: int, view, repeat: int) -> list[float]:
+    at = AppTest.from_file(str(app), default_timeout=300)
+    for m in range(1, months + 1):
+        at.session_state[f"month_2025_{m}"] = make_ledger_month(m, rows, year=2025)
+    at.session_state["known_years"] = {2025}
+    at.session_state["year"] = 2025
+    at.session_state["view"] = view
+    at.run()  # 첫 실행 (세션 초기화) 제외
+    if at.exception:
+        raise SystemExit(at.exception[0].value)
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--app", type=Path, default=APP)
+    parser.add_argument("--rows", type=int, default=2000, help="월당 행 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'화면':<8}{'데이터 월':>10}{'중앙값(s)':>12}{'최소(s)':>10}")
+    for view in ["home", 1]:
+        for months in (1, 12):
+            times = time_reruns(args.app, months, args.rows, view, args.repeat)
+            print(f"{str(view):<8}{months:>10}{statistics.median(times):>12.3f}{min(times):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
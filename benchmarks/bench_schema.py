@@ -0,0 +1,55 @@
+"""스키마 dtype 벤치마크 — object/float 표 vs categorical/Int64 표의 메모리와 집계 시간
+
+    python -m benchmarks.bench_schema --rows 1000 10000
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.synth import make_ledger_month
+from ledger.aggregate import month_partial
+from ledger.schema import CATEGORY_BASE, MONEY_COLUMNS
+
+
+def untyped(df: pd.DataFrame) -> pd.DataFrame:
+    """스키마 도입 전 모양 — 분류/결제수단은 문자열 object, 금액은 float"""
+    df = df.copy()
+    for col in CATEGORY_BASE:
+        df[col] = df[col].astype(object)
+    for col in MONEY_COLUMNS:
+        df[col] = df[col].astype("float64")
+    return df
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000],
+                        help="월별 행 수 (12개월치를 만듦)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'월별 행':>8}{'object(MB)':>12}{'스키마(MB)':>12}{'절감':>8}"
+          f"{'object 집계(s)':>15}{'스키마 집계(s)':>15}")
+    for rows in args.rows:
+        typed = [make_ledger_month(m, rows) for m in range(1, 13)]
+        plain = [untyped(df) for df in typed]
+        mem_plain = sum(df.memory_usage(deep=True).sum() for df in plain) / 2**20
+        mem_typed = sum(df.memory_usage(deep=True).sum() for df in typed) / 2**20
+        t_plain = best_of(lambda: [month_partial(df) for df in plain], args.repeat)
+        t_typed = best_of(lambda: [month_partial(df) for df in typed], args.repeat)
+        print(f"{rows:>8,}{mem_plain:>12.2f}{mem_typed:>12.2f}{1 - mem_typed / mem_plain:>7.0%}"
+              f"{t_plain:>15.4f}{t_typed:>15.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""합성 가계부 데이터 생성 — 정리된 월 표, 또는 카드사/은행 명세서 원본"""
+import random
+from datetime import date, timedelta
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from ledger.config import AUTO_CLASSIFY, DATA_COLUMNS, HEADER_ALIASES, PAYMENT_METHODS
+from ledger.schema import enforce_schema
+
+MERCHANTS = list(AUTO_CLASSIFY) + ["GS25 역삼점", "(주)우아한형제들", "네이버페이 결제", "알 수 없음"]
+
+
+def make_ledger_month(month: int, rows: int, year: int = 2025, seed: int = 0) -> pd.DataFrame:
+    """process_dataframe을 거친 것과 같은 모양의 월별 지출 표"""
+    rng = random.Random(seed * 100 + month)
+    first = date(year, month, 1)
+    days = ((first.replace(month=month % 12 + 1, year=year + month // 12)) - first).days
+    merchants = rng.choices(MERCHANTS, k=rows)
+    amounts = [rng.randrange(1, 300) * 100 for _ in range(rows)]
+    df = pd.DataFrame({
+        "날짜": pd.to_datetime([first + timedelta(days=rng.randrange(days)) for _ in range(rows)]),
+        "결제수단": rng.choices(PAYMENT_METHODS[1:], k=rows),
+        "대분류": [AUTO_CLASSIFY.get(m, ("", ""))[0] for m in merchants],
+        "소분류": [AUTO_CLASSIFY.get(m, ("", ""))[1] for m in merchants],
+        "지출 내용": merchants,
+        "결제금액": amounts,
+        "할인": [0] * rows,
+        "실지출": amounts,
+        "비고": [""] * rows,
+    })
+    return enforce_schema(df[DATA_COLUMNS].sort_values("날짜", kind="stable").reset_index(drop=True))
+
+
+# ===================== 합성 명세서 (process_dataframe 입력) =====================
+
+WEEKDAYS = "월화수목금토일"
+# 칼럼 → 이 칼럼으로 매핑되는 엑셀 헤더들
+ALIASES_BY_COLUMN: dict[str, list[str]] = {}
+for _alias, _col in HEADER_ALIASES.items():
+    ALIASES_BY_COLUMN.setdefault(_col, []).append(_alias)
+
+# 명세서 종류별 칼럼 (None은 매핑되지 않는 칼럼 — 읽을 때 버려짐)
+STATEMENT_LAYOUTS = {
+    "card": [("날짜", None), ("결제수단", None), ("지출 내용", None), ("결제금액", None),
+             (None, "승인번호"), ("비고", None)],
+    "bank": [("날짜", None), ("지출 내용", None), ("결제금액", None), (None, "잔액"), ("비고", None)],
+}
+DATE_STYLES = ["%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%Y-%m-%d %H:%M:%S", "%Y년 %m월 %d일",
+               "weekday", "native"]
+AMOUNT_STYLES = ["{:,}원", "{:,}", "{}", "₩{:,}"]
+BRANCHES = ["", "", "", " 강남점", " 역삼점", " 온라인"]
+BANK_ITEMS = ["급여", "이자", "대출", "관리비", "월세", "축의금", "카카오페이", "토스 송금", "ATM 출금"]
+CARD_NAMES = ["신한카드", "삼성카드", "현대카드", "KB국민카드", "롯데카드"]
+
+
+def _format_dates(days: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """날짜를 행마다 여러 표기로 섞음 (문자열, 요일 접미사, 한글, 날짜 객체)"""
+    dates = pd.to_datetime(days, unit="D") + pd.to_timedelta(rng.integers(0, 86400, len(days)), unit="s")
+    style = rng.integers(0, len(DATE_STYLES), len(days))
+    out = np.empty(len(days), dtype=object)
+    for i, fmt in enumerate(DATE_STYLES):
+        pick = style == i
+        if not pick.any():
+            continue
+        part = dates[pick]
+        if fmt == "native":
+            out[pick] = list(part.normalize())
+        elif fmt == "weekday":
+            out[pick] = part.strftime("%Y.%m.%d").to_numpy(object) + " (" + \
+                np.array(list(WEEKDAYS), dtype=object)[part.dayofweek.to_numpy()] + ")"
+        else:
+            out[pick] = part.strftime(fmt).to_numpy(object)
+    return out
+
+
+def _format_amounts(amounts: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """원/쉼표/₩ 표기 섞기 — 음수(환불)는 '-' 또는 괄호"""
+    style = rng.integers(0, len(AMOUNT_STYLES), len(amounts))
+    paren = rng.random(len(amounts)) < 0.5
+    out = np.empty(len(amounts), dtype=object)
+    for i, (a, s, p) in enumerate(zip(amounts.tolist(), style.tolist(), paren.tolist())):
+        text = AMOUNT_STYLES[s].format(abs(a))
+        out[i] = text if a >= 0 else (f"({text})" if p else f"-{text}")
+    return out
+
+
+def make_statement(rows: int, kind: str = "card", year: int = 2025, seed: int = 0,
+                   header_offset: int | None = None, refund_ratio: float = 0.03) -> pd.DataFrame:
+    """엑셀을 header=None으로 읽은 것과 같은 모양의 카드/은행 명세서
+
+    위쪽 안내 행(0~9행) 뒤에 HEADER_ALIASES 중 무작위 헤더, 거래 행, 마지막에 합계 행.
+    날짜 표기와 금액 표기(원/쉼표, 음수 환불)는 행마다 섞고 가맹점은 AUTO_CLASSIFY 키워드 위주.
+    """
+    rng = np.random.default_rng(seed)
+    layout = STATEMENT_LAYOUTS[kind]
+    if header_offset is None:
+        header_offset = int(rng.integers(0, 10))
+    header = [str(rng.choice(ALIASES_BY_COLUMN[col])) if col else name for col, name in layout]
+
+    start = (pd.Timestamp(year, 1, 1) - pd.Timestamp("1970-01-01")).days
+    days = np.sort(start + rng.integers(0, 365, rows))
+    amounts = rng.integers(1, 300, rows) * 100
+    amounts[rng.random(rows) < refund_ratio] *= -1
+    items = MERCHANTS if kind == "card" else BANK_ITEMS + MERCHANTS
+    names = np.array(items, dtype=object)[rng.integers(0, len(items), rows)]
+    names = names + np.array(BRANCHES, dtype=object)[rng.integers(0, len(BRANCHES), rows)]
+    values = {
+        "날짜": _format_dates(days, rng),
+        "결제수단": np.array(CARD_NAMES, dtype=object)[rng.integers(0, len(CARD_NAMES), rows)],
+        "지출 내용": names,
+        "결제금액": _format_amounts(amounts, rng),
+        "비고": np.where(rng.random(rows) < 0.05, "할부", None).astype(object),
+        "승인번호": rng.integers(10_000_000, 99_999_999, rows).astype(str).astype(object),
+        "잔액": rng.integers(0, 10_000_000, rows).astype(object),
+    }
+    body = pd.DataFrame({i: values[col or name] for i, (col, name) in enumerate(layout)})
+
+    width = len(layout)
+    preamble = [[None] * width for _ in range(header_offset)]
+    if header_offset:
+        preamble[0][0] = "이용대금 명세서" if kind == "card" else "거래내역 조회"
+    if header_offset > 1:
+        preamble[1][0] = f"조회기간 {year}.01.01 ~ {year}.12.31"
+    total = [None] * width
+    total[0] = "합계"
+    total[[c for c, _ in layout].index("결제금액")] = f"{int(np.abs(amounts).sum()):,}"
+    head = pd.DataFrame(preamble + [header], columns=range(width), dtype=object)
+    tail = pd.DataFrame([total], columns=range(width), dtype=object)
+    return pd.concat([head, body.astype(object), tail], ignore_index=True)
+
+
+def statement_bytes(grid: pd.DataFrame, fmt: str = "xlsx") -> bytes:
+    """make_statement 결과를 업로드 파일 내용으로 (xlsx / csv)"""
+    if fmt == "csv":
+        return grid.to_csv(header=False, index=False).encode("utf-8-sig")
+    buf = BytesIO()
+    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+        grid.to_excel(writer, index=False, header=False)
+    return buf.getvalue()
@@ -0,0 +1 @@
+"""가계부 데이터 처리 — Streamlit 없이 import 가능한 순수 pandas 로직"""
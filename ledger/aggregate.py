@@ -0,0 +1,196 @@
+"""기간 집계 — (연도, 월) 파티션별 부분합을 보관하고, 기간 질의는 부분합만 더해서 답함
+
+부분합은 두 군데서 온다. 메모리에 올린 월 표는 month_partial()로, 올리지 않은 파티션은
+저장소의 GROUP BY 결과(LedgerStore.partials)로 만든다. 둘 다 같은 그룹 표
+(대분류, 소분류, 날짜 → 합계, 금액 건수, 행 수)를 거쳐서 결과가 같다.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+from ledger.profiling import stage
+from ledger.schema import columns_fingerprint
+
+AMOUNT = "결제금액"
+DATE = "날짜"
+MAJOR = "대분류"
+MINOR = "소분류"
+GROUP_KEYS = ["major", "minor", "day"]
+# 부분합이 읽는 칼럼 — 이 칼럼 내용이 같으면 (비고 수정 등) 다시 집계하지 않음
+SOURCE_COLUMNS = [AMOUNT, DATE, MAJOR, MINOR]
+
+
+@dataclass
+class MonthPartial:
+    """한 달치 부분합 — 합계와 건수를 같이 둬서 여러 달을 더하기만 하면 되게 함"""
+    rows: int
+    total: float
+    n_amount: int                 # 금액이 있는 행 수 (평균 계산용)
+    by_major: pd.Series           # 대분류 → 합계
+    by_minor: pd.Series           # 소분류 → 합계
+    by_pair: pd.DataFrame         # (대분류, 소분류) → sum, count
+    by_day: pd.Series             # 날짜(자정) → 합계
+
+
+@dataclass
+class PeriodSummary:
+    total: float
+    count: int
+    avg: float
+    monthly: pd.Series            # (연도, 월) → 합계
+    by_major: pd.Series
+    by_minor: pd.Series
+    by_pair: pd.DataFrame
+    daily: pd.Series              # 날짜 → 합계 (일별 히트맵)
+    major_by_month: pd.DataFrame  # (연도, 월) × 대분류 → 합계 (분류별 추이)
+
+
+def _empty_pairs() -> pd.DataFrame:
+    index = pd.MultiIndex.from_arrays([[], []], names=[MAJOR, MINOR])
+    return pd.DataFrame({"sum": pd.Series(dtype=float), "count": pd.Series(dtype="int64")}, index=index)
+
+
+def _dates(values: pd.Series) -> pd.Series:
+    """스키마 표는 이미 datetime — 다시 파싱하지 않음"""
+    if is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors="coerce")
+
+
+def month_groups(df: pd.DataFrame) -> pd.DataFrame:
+    """월 표 → 그룹 표 (major, minor, day, sum, count, rows) — 분류/날짜가 비면 NaN 그룹
+
+    대분류/소분류가 categorical(스키마 표)이면 그대로 묶음 — 코드로 묶고, 없는 범주 조합은 만들지 않음.
+    """
+    if AMOUNT in df.columns:
+        amount = pd.to_numeric(df[AMOUNT], errors="coerce").astype("float64")
+    else:
+        amount = pd.Series(float("nan"), index=df.index)
+    missing = pd.Series(None, index=df.index, dtype=object)
+    work = pd.DataFrame({
+        "major": df[MAJOR] if MAJOR in df.columns else missing,
+        "minor": df[MINOR] if MINOR in df.columns else missing,
+        "day": (_dates(df[DATE]).dt.normalize() if DATE in df.columns
+                else pd.Series(pd.NaT, index=df.index)),
+        "amount": amount,
+    })
+    return (work.groupby(GROUP_KEYS, dropna=False, sort=False, observed=True)["amount"]
+            .agg(sum="sum", count="count", rows="size").reset_index())
+
+
+def partial_from_groups(groups: pd.DataFrame) -> MonthPartial:
+    """그룹 표 → 부분합 (분류가 빈 칸(NaN)인 행은 분류별 집계에서 빠짐)"""
+    # 그룹 표는 작으니 분류를 문자열로 — 저장소 GROUP BY에서 온 부분합과 인덱스 모양을 맞춤
+    g = groups.assign(sum=groups["sum"].fillna(0.0).astype("float64"),
+                      major=groups["major"].astype(object), minor=groups["minor"].astype(object))
+    pairs = g.groupby(["major", "minor"])[["sum", "count"]].sum()
+    return MonthPartial(
+        rows=int(g["rows"].sum()),
+        total=float(g["sum"].sum()),
+        n_amount=int(g["count"].sum()),
+        by_major=g.groupby("major")["sum"].sum().rename_axis(MAJOR),
+        by_minor=g.groupby("minor")["sum"].sum().rename_axis(MINOR),
+        by_pair=(pairs.rename_axis([MAJOR, MINOR]).astype({"count": "int64"})
+                 if len(pairs) else _empty_pairs()),
+        by_day=g.groupby("day")["sum"].sum().rename_axis(DATE),
+    )
+
+
+def month_partial(df: pd.DataFrame) -> MonthPartial:
+    """월 표 하나의 부분합 (결제금액은 숫자로 변환, 분류가 빈 칸인 행은 분류별 집계에서 빠짐)"""
+    return partial_from_groups(month_groups(df))
+
+
+def _merge_series(parts: list[pd.Series]) -> pd.Series:
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return pd.Series(dtype=float)
+    return pd.concat(parts).groupby(level=0).sum()
+
+
+def merge_partials(parts: dict) -> PeriodSummary:
+    """파티션 키 → 부분합 을 더한 기간 요약 (행이 없는 파티션은 월별 합계에서도 빠짐)"""
+    parts = {k: p for k, p in parts.items() if p.rows > 0}
+    total = sum(p.total for p in parts.values())
+    n_amount = sum(p.n_amount for p in parts.values())
+    pairs = [p.by_pair for p in parts.values() if len(p.by_pair)]
+    keys = sorted(parts)
+    return PeriodSummary(
+        total=total,
+        count=sum(p.rows for p in parts.values()),
+        avg=total / n_amount if n_amount else float("nan"),
+        monthly=pd.Series([parts[k].total for k in keys],
+                          index=pd.MultiIndex.from_tuples(keys, names=["연도", "월"]) if keys else None,
+                          dtype=float),
+        by_major=_merge_series([p.by_major for p in parts.values()]),
+        by_minor=_merge_series([p.by_minor for p in parts.values()]),
+        by_pair=(pd.concat(pairs).groupby(level=[0, 1]).sum() if pairs else _empty_pairs()),
+        daily=_merge_series([p.by_day for p in parts.values()]).sort_index(),
+        major_by_month=pd.DataFrame([parts[k].by_major for k in keys],
+                                    index=pd.MultiIndex.from_tuples(keys, names=["연도", "월"]) if keys else None,
+                                    dtype=float).fillna(0.0),
+    )
+
+
+def compare_by_major(current: PeriodSummary, previous: PeriodSummary) -> pd.DataFrame:
+    """대분류별 두 기간 비교 — 이번, 이전, 증감, 증감률(이전이 0이면 NaN)"""
+    df = pd.DataFrame({"이번": current.by_major, "이전": previous.by_major}, dtype=float).fillna(0.0)
+    df["증감"] = df["이번"] - df["이전"]
+    df["증감률"] = df["증감"] / df["이전"].where(df["이전"] != 0)
+    return df.rename_axis(MAJOR).sort_values("이번", ascending=False)
+
+
+class PartitionAggregates:
+    """파티션 키 → 부분합 저장소
+
+    update()는 집계에 쓰는 칼럼 내용이 바뀐 파티션만 다시 집계한다. 편집기는 리런마다
+    새 객체를 돌려주므로, 객체가 같으면 바로 넘어가고 다르면 내용 해시로 비교한다.
+    put()은 메모리에 올리지 않은 파티션의 부분합(저장소 집계)을 넣는다.
+    기간 요약은 파티션 목록별로 캐시하고, 어느 파티션이든 바뀌면 비운다.
+    """
+
+    def __init__(self):
+        self._parts: dict = {}
+        self._summaries: dict[tuple, PeriodSummary] = {}
+
+    def update(self, key, df: pd.DataFrame) -> MonthPartial:
+        cur = self._parts.get(key)
+        if cur is not None and cur[0] is df:
+            return cur[2]
+        fp = columns_fingerprint(df, SOURCE_COLUMNS)
+        if cur is None or cur[1] != fp:
+            with stage("aggregate.month", len(df)):
+                cur = (df, fp, month_partial(df))
+            self._summaries.clear()
+        else:
+            cur = (df, fp, cur[2])
+        self._parts[key] = cur
+        return cur[2]
+
+    def put(self, key, partial: MonthPartial):
+        self._parts[key] = (None, None, partial)
+        self._summaries.clear()
+
+    def sync(self, frames: dict) -> "PartitionAggregates":
+        for key, df in frames.items():
+            self.update(key, df)
+        return self
+
+    def missing(self, keys) -> list:
+        """부분합이 아직 없는 파티션"""
+        return [k for k in keys if k not in self._parts]
+
+    def partial(self, key) -> MonthPartial | None:
+        cur = self._parts.get(key)
+        return None if cur is None else cur[2]
+
+    def summary(self, keys=None) -> PeriodSummary:
+        """파티션 목록의 요약 (None이면 보관 중인 전체) — 부분합이 없는 파티션은 빈 달로 봄"""
+        keys = tuple(sorted(self._parts if keys is None else set(keys)))
+        cached = self._summaries.get(keys)
+        if cached is None:
+            with stage("aggregate.summary"):
+                cached = merge_partials({k: self._parts[k][2] for k in keys if k in self._parts})
+            self._summaries[keys] = cached
+        return cached
@@ -0,0 +1,60 @@
+"""업로드 파일 파싱 캐시 — 파일 내용 해시 기준 LRU"""
+import hashlib
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ParseCache:
+    """(내용 해시, 파서 버전, ...) → 처리된 DataFrame
+
+    항목 수와 대략적인 메모리 크기 두 가지로 제한하고, 넘치면 가장 오래 안 쓴 것부터 버린다.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[tuple, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: tuple) -> pd.DataFrame | None:
+        entry = self._items.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return entry[0].copy()
+
+    def put(self, key: tuple, df: pd.DataFrame):
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+        if key in self._items:
+            self._bytes -= self._items.pop(key)[1]
+        self._items[key] = (df.copy(), size)
+        self._bytes += size
+        while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, old_size) = self._items.popitem(last=False)
+            self._bytes -= old_size
+
+    def clear(self):
+        self._items.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "entries": len(self._items), "bytes": self._bytes}
@@ -0,0 +1,111 @@
+"""홈 화면 차트 — 연간 집계(작은 Series)로만 그리고, 입력이 같으면 만든 그림을 재사용
+
+그림마다 입력 집계의 내용 해시를 지문으로 쓴다. 편집해도 차트에 쓰이는 합계가 그대로면
+(비고 수정 등) 같은 그림 객체를 다시 넘기므로 plotly 그림을 새로 만들지 않는다.
+금액 표시는 plotly texttemplate / hovertemplate으로 브라우저에서 형식화한다.
+"""
+import hashlib
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+WON = "₩%{value:,.0f}"
+
+
+def fingerprint(*parts) -> str:
+    """집계 Series/DataFrame(과 설정 값)의 내용 해시 — 인덱스와 순서까지 포함"""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, (pd.Series, pd.DataFrame)):
+            h.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+            if isinstance(part, pd.DataFrame):
+                h.update(repr(list(part.columns)).encode())
+        else:
+            h.update(repr(part).encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class FigureCache:
+    """차트 이름 → (지문, 그림) — 이름마다 마지막 그림 하나만 보관"""
+
+    def __init__(self):
+        self._figs: dict[str, tuple[str, go.Figure]] = {}
+
+    def get(self, name: str, build: Callable[..., go.Figure], *data) -> go.Figure:
+        fp = fingerprint(*data)
+        cur = self._figs.get(name)
+        if cur is None or cur[0] != fp:
+            cur = (fp, build(*data))
+            self._figs[name] = cur
+        return cur[1]
+
+
+# ===================== 그림 =====================
+
+def monthly_bar(monthly: pd.Series) -> go.Figure:
+    """월 이름 → 합계"""
+    fig = px.bar(x=monthly.index, y=monthly.to_numpy(), labels={"x": "월", "y": "금액"})
+    fig.update_traces(texttemplate="₩%{y:,.0f}", textposition="outside")
+    return fig
+
+
+def major_pie(by_major: pd.Series) -> go.Figure:
+    """대분류 → 합계 (0 이하 제외)"""
+    s = by_major[by_major > 0]
+    fig = px.pie(values=s.to_numpy(), names=s.index.astype(str), hole=0.4,
+                 color_discrete_sequence=px.colors.qualitative.Set2)
+    fig.update_traces(textinfo="label+percent+value", texttemplate="%{label}<br>%{percent}<br>" + WON)
+    return fig
+
+
+def minor_bar(by_minor: pd.Series) -> go.Figure:
+    """소분류 → 합계 (0 이하 제외, 큰 값이 위로)"""
+    s = by_minor[by_minor > 0].sort_values()
+    fig = px.bar(x=s.to_numpy(), y=s.index.astype(str), orientation="h", color=s.to_numpy(),
+                 color_continuous_scale="Blues", labels={"x": "결제금액", "y": "소분류"})
+    fig.update_traces(texttemplate="₩%{x:,.0f}")
+    fig.update_layout(showlegend=False, coloraxis_showscale=False)
+    return fig
+
+
+def daily_heatmap(daily: pd.Series) -> go.Figure:
+    """일별 합계 → 월(행) × 일(열) 히트맵 — 거래가 없는 날은 빈 칸"""
+    grid = np.full((12, 31), np.nan)
+    if len(daily):
+        idx = pd.DatetimeIndex(daily.index)
+        grid[idx.month.to_numpy() - 1, idx.day.to_numpy() - 1] = daily.to_numpy(dtype=float)
+    fig = go.Figure(go.Heatmap(
+        z=grid, x=list(range(1, 32)), y=[f"{m}월" for m in range(1, 13)],
+        colorscale="Blues", hoverongaps=False,
+        hovertemplate="%{y} %{x}일<br>₩%{z:,.0f}<extra></extra>"))
+    fig.update_layout(xaxis_title="일", yaxis_autorange="reversed", xaxis_dtick=1)
+    return fig
+
+
+def category_trend(major_by_month: pd.DataFrame) -> go.Figure:
+    """(연도, 월) × 대분류 합계 → 대분류별 월간 추이 (합계가 큰 분류부터)"""
+    df = major_by_month.sort_index()
+    df = df[df.sum().sort_values(ascending=False).index]
+    fig = go.Figure()
+    months = [f"{y}.{m:02d}" for y, m in df.index]
+    for major in df.columns:
+        fig.add_trace(go.Scatter(x=months, y=df[major].to_numpy(), name=str(major), mode="lines+markers",
+                                 hovertemplate=f"{major}<br>%{{x}}: ₩%{{y:,.0f}}<extra></extra>"))
+    fig.update_layout(yaxis_title="금액", legend_title="대분류", hovermode="x unified")
+    return fig
+
+
+def compare_bar(compare: pd.DataFrame, current: str, previous: str) -> go.Figure:
+    """compare_by_major 결과 → 대분류별 두 기간 막대 (이번/이전)"""
+    fig = go.Figure([
+        go.Bar(x=compare.index.astype(str), y=compare["이전"].to_numpy(), name=previous,
+               marker_color="#bbbbbb", hovertemplate="%{x}<br>₩%{y:,.0f}<extra></extra>"),
+        go.Bar(x=compare.index.astype(str), y=compare["이번"].to_numpy(), name=current,
+               hovertemplate="%{x}<br>₩%{y:,.0f}<extra></extra>"),
+    ])
+    fig.update_layout(barmode="group", yaxis_title="금액", legend_title="기간")
+    return fig
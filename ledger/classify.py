@@ -0,0 +1,143 @@
+"""지출 내용 자동분류 — 키워드 표를 정규식 하나로 컴파일해 칼럼 단위로 분류"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from ledger.config import CATEGORY_TREE
+
+EMPTY = ("", "")
+
+# 유효한 (대분류, 소분류) 쌍과 대분류별 기본 소분류 (교정용)
+VALID_PAIRS = pd.MultiIndex.from_tuples(
+    [(major, minor) for major, subs in CATEGORY_TREE.items() for minor in subs])
+DEFAULT_MINOR = {major: subs[0] for major, subs in CATEGORY_TREE.items()}
+
+
+class KeywordClassifier:
+    """키워드 → (대분류, 소분류) 분류기
+
+    키워드 표의 순서가 우선순위다 (앞선 키워드가 먼저 매칭되면 그 분류를 씀).
+    가맹점 문자열별 결과를 캐시하므로 같은 가맹점이 반복되는 카드 내역에 유리하다.
+    """
+
+    def __init__(self, table: dict[str, tuple[str, str]], cache_size: int = 50_000):
+        self._table = dict(table)
+        self._cache: dict[str, tuple[str, str]] = {}
+        self._cache_size = cache_size
+        self._pattern = None
+        self._priority: dict[str, int] = {}
+        self._values: list[tuple[str, str]] = []
+        self._dirty = True
+        self.version = 0
+
+    def __getstate__(self):
+        # 프로세스 풀로 보낼 때 캐시는 빼고 보냄 (받는 쪽에서 다시 채움)
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
+
+    @property
+    def table(self) -> dict[str, tuple[str, str]]:
+        return dict(self._table)
+
+    def add(self, keyword: str, major: str, minor: str):
+        """키워드 추가/변경 — 다음 분류 때 한 번만 다시 컴파일"""
+        if self._table.get(keyword) == (major, minor):
+            return
+        self._table[keyword] = (major, minor)
+        self._dirty = True
+        self._cache.clear()
+        self.version += 1
+
+    def _compile(self):
+        keywords = list(self._table)
+        self._priority = {kw: i for i, kw in enumerate(keywords)}
+        self._values = [self._table[kw] for kw in keywords]
+        # 위치마다 우선순위가 가장 높은 키워드를 잡는 전방탐색 — 전체 최솟값이 첫 매칭 키워드
+        alternation = "|".join(re.escape(kw) for kw in keywords)
+        self._pattern = re.compile(f"(?=({alternation}))") if keywords else None
+        self._dirty = False
+
+    def _match(self, text_lower: str) -> tuple[str, str]:
+        best = None
+        for m in self._pattern.finditer(text_lower):
+            p = self._priority[m.group(1)]
+            if best is None or p < best:
+                best = p
+                if p == 0:
+                    break
+        return EMPTY if best is None else self._values[best]
+
+    def classify(self, text) -> tuple[str, str]:
+        """문자열 하나 분류 — 매칭이 없거나 문자열이 아니면 ("", "")"""
+        if not isinstance(text, str):
+            return EMPTY
+        hit = self._cache.get(text)
+        if hit is None:
+            if self._dirty:
+                self._compile()
+            hit = EMPTY if self._pattern is None else self._match(text.lower())
+            if len(self._cache) >= self._cache_size:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[text] = hit
+        return hit
+
+    def classify_series(self, texts: pd.Series) -> tuple[pd.Series, pd.Series]:
+        """칼럼 일괄 분류 — 고유 문자열만 분류하고 코드로 펼침"""
+        codes, uniques = pd.factorize(texts)
+        pairs = [self.classify(u) for u in uniques]
+        # 마지막 원소는 결측(code -1)용 빈 값
+        majors = np.array([p[0] for p in pairs] + [""], dtype=object)
+        minors = np.array([p[1] for p in pairs] + [""], dtype=object)
+        return (pd.Series(majors[codes], index=texts.index),
+                pd.Series(minors[codes], index=texts.index))
+
+
+def _blank(col: pd.Series) -> pd.Series:
+    return col.isna() | (col.astype(str).str.strip() == "")
+
+
+def apply_categories(df: pd.DataFrame, classifier: KeywordClassifier,
+                     item_col: str = "지출 내용") -> pd.DataFrame:
+    """대분류/소분류가 비어 있는 행만 지출 내용으로 채움 (칼럼이 없으면 새로 만듦)"""
+    if item_col not in df.columns:
+        return df
+    need_major = _blank(df["대분류"]) if "대분류" in df.columns else None
+    need_minor = _blank(df["소분류"]) if "소분류" in df.columns else None
+    if need_major is None or need_minor is None:
+        rows = df.index
+    else:
+        rows = df.index[need_major | need_minor]
+    majors, minors = classifier.classify_series(df.loc[rows, item_col])
+
+    if need_major is None:
+        df["대분류"] = majors
+    else:
+        target = need_major[need_major].index
+        df.loc[target, "대분류"] = majors[target]
+    if need_minor is None:
+        df["소분류"] = minors
+    else:
+        target = need_minor[need_minor].index
+        df.loc[target, "소분류"] = minors[target]
+    return df
+
+
+def fix_minor_categories(df: pd.DataFrame, rows: pd.Index | None = None) -> pd.DataFrame:
+    """대분류에 속하지 않는 소분류를 그 대분류의 첫 소분류로 교정 (rows가 있으면 그 행만)
+
+    대분류가 CATEGORY_TREE에 없거나 소분류가 빈 칸이면 그대로 둔다. df를 직접 고친다.
+    """
+    if "대분류" not in df.columns or "소분류" not in df.columns:
+        return df
+    target = df if rows is None else df.loc[df.index.intersection(rows)]
+    if target.empty:
+        return df
+    major = target["대분류"].astype(str).str.strip()
+    minor = target["소분류"].astype(str).str.strip()
+    valid = pd.MultiIndex.from_arrays([major, minor]).isin(VALID_PAIRS)
+    bad = major.isin(list(DEFAULT_MINOR)) & (minor != "") & ~valid
+    if bad.any():
+        df.loc[bad[bad].index, "소분류"] = major[bad].map(DEFAULT_MINOR)
+    return df
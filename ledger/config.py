@@ -0,0 +1,93 @@
+"""카테고리·결제수단·헤더 별칭 등 가계부 공통 설정"""
+from collections import OrderedDict
+
+# ===================== 카테고리 & 결제수단 설정 =====================
+
+CATEGORY_TREE: OrderedDict[str, list[str]] = OrderedDict([
+    ("금융보험비", ["보험료", "금융이자", "적금", "상환금", "상품권", "투자", "연금"]),
+    ("식비", ["식사/간식", "차/커피", "회사점심", "식재료"]),
+    ("주거생활비", ["집세/관리비", "통신비", "기타세금", "전자기기"]),
+    ("생활용품비", ["생활용품", "더모아충전"]),
+    ("의류미용비", ["의류/잡화", "미용"]),
+    ("문화생활비", ["영화/공연/OTT/전시", "게임/음악", "전자제품", "도서"]),
+    ("건강관리비", ["운동/다이어트", "병원/약값", "기타요양", "보험청구"]),
+    ("교통비", ["대중교통", "택시비", "장거리경비"]),
+    ("학비", ["학원/강의", "교재비", "모임공간이용료", "문구류", "응시료", "유학수속관련비용"]),
+    ("사회생활비", ["경조사비", "선물/용돈", "모임회비"]),
+    ("유흥비", ["술값", "기타유흥"]),
+    ("사업", ["고정지출비", "초기투자비"]),
+    ("생활유지비", ["기름값", "정비/세차", "주차/통행", "자동차", "보험료",
+                  "과외관련비용", "이사비용", "세탁비", "고정비/구독료"]),
+])
+
+ALL_MAJOR = list(CATEGORY_TREE.keys())
+ALL_MINOR = list(dict.fromkeys(sub for subs in CATEGORY_TREE.values() for sub in subs))
+
+PAYMENT_METHODS = [
+    "", "계좌이체", "현금", "롯데카드신용", "온누리상품권체크", "신한카드-더모아",
+    "신한은행", "우리체크카드", "우리카드", "PAYCO", "현대카드", "현아플",
+    "새마을금고", "네이버페이", "카카오뱅크", "모빌리언스카드", "삼성카드",
+    "롯데체크카드", "신한카드", "KB국민카드", "우리카드연세", "우리은행",
+    "케이뱅크", "지역화페", "카카오페이", "롯데카드", "온누리상품권",
+]
+
+AUTO_CLASSIFY = {
+    "커피": ("식비", "차/커피"), "카페": ("식비", "차/커피"), "스타벅스": ("식비", "차/커피"),
+    "점심": ("식비", "회사점심"), "식당": ("식비", "식사/간식"), "배달": ("식비", "식사/간식"),
+    "편의점": ("식비", "식사/간식"), "마트": ("식비", "식재료"), "식료품": ("식비", "식재료"),
+    "치킨": ("식비", "식사/간식"), "피자": ("식비", "식사/간식"), "빵": ("식비", "식사/간식"),
+    "버스": ("교통비", "대중교통"), "지하철": ("교통비", "대중교통"), "교통": ("교통비", "대중교통"),
+    "택시": ("교통비", "택시비"), "카카오택시": ("교통비", "택시비"),
+    "주유": ("생활유지비", "기름값"), "기름": ("생활유지비", "기름값"),
+    "세차": ("생활유지비", "정비/세차"), "정비": ("생활유지비", "정비/세차"),
+    "주차": ("생활유지비", "주차/통행"), "톨게이트": ("생활유지비", "주차/통행"),
+    "넷플릭스": ("문화생활비", "영화/공연/OTT/전시"), "영화": ("문화생활비", "영화/공연/OTT/전시"),
+    "유튜브": ("문화생활비", "영화/공연/OTT/전시"), "구독": ("생활유지비", "고정비/구독료"),
+    "게임": ("문화생활비", "게임/음악"), "도서": ("문화생활비", "도서"), "책": ("문화생활비", "도서"),
+    "옷": ("의류미용비", "의류/잡화"), "의류": ("의류미용비", "의류/잡화"),
+    "쇼핑": ("의류미용비", "의류/잡화"), "쿠팡": ("의류미용비", "의류/잡화"),
+    "무신사": ("의류미용비", "의류/잡화"), "올리브영": ("의류미용비", "미용"),
+    "화장품": ("의류미용비", "미용"),
+    "병원": ("건강관리비", "병원/약값"), "약국": ("건강관리비", "병원/약값"),
+    "치과": ("건강관리비", "병원/약값"), "안과": ("건강관리비", "병원/약값"),
+    "운동": ("건강관리비", "운동/다이어트"), "헬스": ("건강관리비", "운동/다이어트"),
+    "월세": ("주거생활비", "집세/관리비"), "관리비": ("주거생활비", "집세/관리비"),
+    "전기": ("주거생활비", "집세/관리비"), "가스": ("주거생활비", "집세/관리비"),
+    "통신": ("주거생활비", "통신비"), "핸드폰": ("주거생활비", "통신비"),
+    "인터넷": ("주거생활비", "통신비"),
+    "학원": ("학비", "학원/강의"), "강의": ("학비", "학원/강의"),
+    "보험": ("금융보험비", "보험료"), "적금": ("금융보험비", "적금"),
+    "이자": ("금융보험비", "금융이자"), "대출": ("금융보험비", "상환금"),
+    "술": ("유흥비", "술값"), "회식": ("유흥비", "술값"),
+    "선물": ("사회생활비", "선물/용돈"), "축의금": ("사회생활비", "경조사비"),
+}
+
+INCOME_CATEGORIES = ["급여", "이자소득", "상여", "투자수익", "처분소득", "부수익", "페이백", "기타 수입"]
+MONTHS = ["1월", "2월", "3월", "4월", "5월", "6월", "7월", "8월", "9월", "10월", "11월", "12월"]
+DATA_COLUMNS = ["날짜", "결제수단", "대분류", "소분류", "지출 내용", "결제금액", "할인", "실지출", "비고"]
+
+COLUMN_RENAME = {i: c for i, c in enumerate(DATA_COLUMNS)}
+
+# 엑셀 헤더 → 표준 칼럼명 매핑
+HEADER_ALIASES = {
+    # 날짜
+    "날짜": "날짜", "일자": "날짜", "거래일": "날짜", "거래일자": "날짜", "이용일": "날짜",
+    "이용일자": "날짜", "이용일": "날짜", "지출일": "날짜", "date": "날짜",
+    # 결제수단
+    "결제수단": "결제수단", "카드": "결제수단", "카드명": "결제수단", "결제카드": "결제수단",
+    "결제": "결제수단", "이용카드": "결제수단",
+    # 지출 내용
+    "항목": "지출 내용", "내역": "지출 내용", "적요": "지출 내용", "사용처": "지출 내용",
+    "가맹점": "지출 내용", "가맹점명": "지출 내용", "내용": "지출 내용",
+    "지출내역": "지출 내용", "이용가맹점": "지출 내용", "지출 내용": "지출 내용",
+    # 결제금액
+    "이용금액": "결제금액", "금액": "결제금액", "지출금액": "결제금액", "결제금액": "결제금액",
+    "이용 금액": "결제금액", "amount": "결제금액",
+    # 대분류/소분류
+    "대분류": "대분류", "카테고리": "대분류",
+    "소분류": "소분류", "세부카테고리": "소분류",
+    # 할인/실지출/비고
+    # 할인 — 엑셀에서 가져오지 않음 (수동 입력만)
+    "실지출": "실지출", "결제원금": "실지출", "원금": "실지출",
+    "비고": "비고", "메모": "비고",
+}
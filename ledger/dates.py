@@ -0,0 +1,111 @@
+"""날짜 칼럼 정규화 — 셀 단위 parse_date 대신 칼럼 단위로 일괄 파싱"""
+import re
+from datetime import date, datetime
+
+import pandas as pd
+
+DATE_FORMATS = [
+    "%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%m/%d/%Y",
+    "%Y-%m-%d %H:%M:%S", "%Y.%m.%d %H:%M",
+    "%Y년 %m월 %d일", "%Y년%m월%d일",
+]
+
+EXCEL_EPOCH = pd.Timestamp("1899-12-30")
+
+# 괄호 안의 요일 제거: "2026.01.01 (목)" → "2026.01.01"
+_WEEKDAY_SUFFIX = re.compile(r"\s*\(.*?\)\s*$")
+# float()로 읽히는 일반적인 숫자 문자열 (엑셀 시리얼 후보)
+_NUMERIC = r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$"
+# 포맷 추론에 쓰는 샘플 크기
+_SAMPLE_SIZE = 50
+
+
+def parse_date(v):
+    """셀 하나를 Timestamp로 변환 (기존 행 단위 구현 — 일괄 파싱의 기준 동작)"""
+    if pd.isna(v):
+        return pd.NaT
+    if isinstance(v, pd.Timestamp):
+        return v
+    s = str(v).strip()
+    if not s:
+        return pd.NaT
+    s = _WEEKDAY_SUFFIX.sub("", s).strip()
+    try:
+        num = float(s)
+        if 1 < num < 100000:
+            return EXCEL_EPOCH + pd.Timedelta(days=int(num))
+    except (ValueError, TypeError):
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return pd.to_datetime(s, format=fmt)
+        except (ValueError, TypeError):
+            continue
+    return pd.to_datetime(s, errors="coerce")
+
+
+def infer_formats(strings: pd.Series) -> list[str]:
+    """샘플에 맞는 포맷을 앞으로 당긴 시도 순서 반환 (나머지는 원래 순서 유지)"""
+    sample = strings.head(_SAMPLE_SIZE)
+    hits = [fmt for fmt in DATE_FORMATS
+            if pd.to_datetime(sample, format=fmt, errors="coerce").notna().any()]
+    return hits + [fmt for fmt in DATE_FORMATS if fmt not in hits]
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """날짜 칼럼 일괄 파싱 — values.apply(parse_date)와 같은 값을 반환
+
+    1) 결측/날짜 객체 분리  2) 요일 접미사 제거 (문자열 1회 처리)
+    3) 엑셀 시리얼 숫자 일괄 변환  4) 추론한 포맷 순서대로 남은 행만 파싱
+    5) 어느 포맷에도 맞지 않은 행만 parse_date로 개별 처리
+    """
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return values.copy()
+
+    raw = values.reset_index(drop=True)
+    out = pd.Series(pd.NaT, index=raw.index, dtype="datetime64[ns]")
+    pending = raw[raw.notna()]
+
+    # 날짜 객체(Timestamp/datetime/date) — 문자열화 없이 그대로 변환
+    if pending.dtype == object and not pending.empty:
+        is_dt = pending.map(lambda v: isinstance(v, (datetime, date))).astype(bool)
+        if is_dt.any():
+            dts = pending[is_dt]
+            # 타임존이 있으면 결과가 datetime64[ns]에 담기지 않으므로 기존 로직 그대로
+            if any(getattr(v, "tzinfo", None) is not None for v in dts):
+                return values.apply(parse_date)
+            out.loc[dts.index] = pd.to_datetime(dts, errors="coerce")
+            pending = pending[~is_dt]
+
+    strings = pending.astype(str).str.strip()
+    strings = strings[strings != ""]
+    strings = strings.str.replace(_WEEKDAY_SUFFIX, "", regex=True).str.strip()
+
+    # 엑셀 시리얼 (1 < n < 100000) — 소수점은 버림
+    numeric = strings.str.match(_NUMERIC)
+    if numeric.any():
+        num = pd.to_numeric(strings[numeric], errors="coerce")
+        num = num[(num > 1) & (num < 100000)]
+        out.loc[num.index] = EXCEL_EPOCH + pd.to_timedelta(num.astype("int64"), unit="D")
+        strings = strings.drop(num.index)
+
+    # 포맷별 일괄 파싱 — 포맷끼리는 구분자가 달라 한 행이 둘 이상에 맞지 않음
+    if not strings.empty:
+        for fmt in infer_formats(strings):
+            parsed = pd.to_datetime(strings, format=fmt, errors="coerce")
+            hit = parsed.notna()
+            if hit.any():
+                out.loc[parsed.index[hit]] = parsed[hit]
+                strings = strings[~hit]
+            if strings.empty:
+                break
+
+    # 남은 행 — 원래 값으로 기존 로직 적용
+    if not strings.empty:
+        rest = raw.loc[strings.index].map(parse_date)
+        if any(getattr(v, "tzinfo", None) is not None for v in rest):
+            return values.apply(parse_date)
+        out.loc[rest.index] = pd.to_datetime(rest)
+
+    out.index = values.index
+    return out
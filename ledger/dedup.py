@@ -0,0 +1,133 @@
+"""중복 거래 찾기 — 겹치는 명세서(같은 카드의 기간 중복, 카드+은행 내역)를 합치기 전에 검사
+
+표 목록을 순서대로 보며, 각 표의 행을 앞선 표들의 행과 비교한다 (같은 표 안은 비교하지 않음 —
+한 명세서에 같은 날 같은 금액 결제가 두 번 있으면 실제로 두 번 쓴 것).
+
+- 금액은 부호 있는 금액 (환불은 음수) — 같은 날 같은 금액의 결제와 환불은 중복이 아님.
+- 정확 일치: (날짜, 금액, 정규화한 지출 내용, 결제수단) 해시 키 + 표 안에서 몇 번째 같은 키인지.
+  앞선 표에 같은 키가 n번 있으면 뒤 표의 n번째까지만 중복으로 본다.
+- 느슨한 일치(tolerant): 정확 일치가 안 된 행을 (금액, 날짜±max_days) 블록으로 묶고
+  블록 안에서만 가맹점 이름 유사도를 계산 — 모든 행 쌍을 비교하지 않음.
+  결제수단은 블록 키가 아님 (은행 내역은 비어 있거나 카드 이름과 다름). 같으면 배정 때 우선.
+"""
+import re
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from ledger.money import signed_amounts
+
+DEFAULT_SIMILARITY = 0.8
+PAIR_COLUMNS = ["frame", "row", "ref_frame", "ref_row", "match", "score", "days_apart"]
+
+_EPOCH = pd.Timestamp("1970-01-01")
+# 법인 표기와 공백/기호 제거 (NFKC 뒤라 ㈜는 (주)가 됨)
+_NOISE = re.compile(r"\(주\)|주식회사|[^0-9a-z가-힣]")
+
+
+def normalize_merchant(values: pd.Series) -> pd.Series:
+    """가맹점 이름 정규화 — 전각/반각 통일, 소문자, (주)·주식회사·공백·기호 제거"""
+    s = values.astype(object).fillna("").astype(str).str.normalize("NFKC").str.lower()
+    return s.str.replace(_NOISE, "", regex=True)
+
+
+def merchant_similarity(a: str, b: str) -> float:
+    """0~1 — 한쪽이 다른 쪽을 포함하면(은행 내역의 잘린 가맹점명 등) 0.9"""
+    if a == b:
+        return 1.0
+    if a and b and (a in b or b in a):
+        return 0.9
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def transaction_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """행별 비교 칼럼 — day(정수 일), amount(원, 환불은 음수), merchant, payment, key(네 칼럼 해시)
+
+    날짜나 금액이 없는 행은 비교 대상에서 뺀다.
+    """
+    dates = pd.to_datetime(df["날짜"], errors="coerce")
+    keys = pd.DataFrame({
+        "day": (dates.dt.normalize() - _EPOCH).dt.days,
+        "amount": signed_amounts(df),
+        "merchant": normalize_merchant(df["지출 내용"]),
+        "payment": df["결제수단"].astype(object).fillna("").astype(str).str.strip(),
+    }, index=df.index)
+    keys = keys[keys["day"].notna() & keys["amount"].notna()]
+    keys = keys.astype({"day": "int64", "amount": "int64"})
+    keys["key"] = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return keys
+
+
+def _exact(part: pd.DataFrame, pool: pd.DataFrame) -> pd.DataFrame:
+    ref = (pool.drop_duplicates(["key", "occ"])[["key", "occ", "frame", "row"]]
+           .rename(columns={"frame": "ref_frame", "row": "ref_row"}))
+    found = part[["key", "occ", "frame", "row"]].merge(ref, on=["key", "occ"])
+    return found.assign(match="exact", score=1.0, days_apart=0)[PAIR_COLUMNS]
+
+
+def _tolerant(part: pd.DataFrame, pool: pd.DataFrame, used: set,
+              max_days: int, min_similarity: float) -> pd.DataFrame:
+    """(금액, 날짜+shift) 블록 조인 → 이름 유사도 → 점수 순으로 1:1 배정 (결제수단이 같은 짝 우선)"""
+    left = part[["frame", "row", "day", "amount", "payment", "merchant"]]
+    right = pool[["frame", "row", "day", "amount", "payment", "merchant"]].rename(
+        columns={"frame": "ref_frame", "row": "ref_row", "merchant": "ref_merchant", "day": "ref_day",
+                 "payment": "ref_payment"})
+    blocks = []
+    for shift in range(-max_days, max_days + 1):
+        shifted = right.assign(day=right["ref_day"] + shift)
+        blocks.append(left.merge(shifted, on=["day", "amount"]))
+    cand = pd.concat(blocks, ignore_index=True)
+    if cand.empty:
+        return pd.DataFrame(columns=PAIR_COLUMNS)
+
+    # 유사도는 고유한 이름 쌍마다 한 번만
+    names = cand[["merchant", "ref_merchant"]].drop_duplicates()
+    names["score"] = [merchant_similarity(a, b)
+                      for a, b in zip(names["merchant"], names["ref_merchant"])]
+    cand = cand.merge(names, on=["merchant", "ref_merchant"])
+    cand = cand[cand["score"] >= min_similarity]
+    cand["days_apart"] = (cand["day"] - cand["ref_day"]).abs()
+    cand["same_payment"] = cand["payment"] == cand["ref_payment"]
+    cand = cand.sort_values(["score", "days_apart", "same_payment", "ref_frame", "ref_row"],
+                            ascending=[False, True, False, True, True], kind="stable")
+
+    taken, out = set(), []
+    for row, ref_frame, ref_row, score, days in zip(
+            cand["row"], cand["ref_frame"], cand["ref_row"], cand["score"], cand["days_apart"]):
+        ref = (ref_frame, ref_row)
+        if row in taken or ref in used:
+            continue
+        taken.add(row)
+        used.add(ref)
+        out.append((part["frame"].iat[0], row, ref_frame, ref_row, "fuzzy", score, int(days)))
+    return pd.DataFrame(out, columns=PAIR_COLUMNS)
+
+
+def find_duplicates(frames: list[pd.DataFrame], tolerant: bool = False, max_days: int = 1,
+                    min_similarity: float = DEFAULT_SIMILARITY) -> pd.DataFrame:
+    """frames[i]의 행 중 앞선 표(frames[:i])에 이미 있는 거래
+
+    반환: frame/row(중복 의심 행의 표 번호와 인덱스), ref_frame/ref_row(먼저 있던 행),
+    match("exact"/"fuzzy"), score(이름 유사도), days_apart
+    """
+    pairs, pool = [], None
+    for i, df in enumerate(frames):
+        part = transaction_keys(df)
+        part["frame"] = i
+        part["row"] = part.index
+        part["occ"] = part.groupby("key").cumcount()
+        part = part.reset_index(drop=True)
+        if pool is not None and len(part):
+            found = _exact(part, pool)
+            if tolerant:
+                rest = part[~part["row"].isin(found["row"])]
+                used = set(zip(found["ref_frame"], found["ref_row"]))
+                if len(rest):
+                    found = pd.concat(
+                        [found, _tolerant(rest, pool, used, max_days, min_similarity)],
+                        ignore_index=True)
+            pairs.append(found)
+        pool = part if pool is None else pd.concat([pool, part], ignore_index=True)
+    if not pairs:
+        return pd.DataFrame(columns=PAIR_COLUMNS)
+    return pd.concat(pairs, ignore_index=True).sort_values(["frame", "row"], kind="stable")
@@ -0,0 +1,80 @@
+"""엑셀 내보내기 — 요청할 때만 만들고, 같은 내용이면 만든 파일을 재사용"""
+import hashlib
+import weakref
+from collections import OrderedDict
+from io import BytesIO
+
+import pandas as pd
+from openpyxl import Workbook
+
+from ledger.profiling import stage
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """칼럼 이름과 값 기준 해시 — 인덱스는 제외"""
+    h = hashlib.sha1()
+    h.update(repr(list(df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def write_workbook(sheets: dict[str, pd.DataFrame]) -> bytes:
+    """시트 이름 → DataFrame을 xlsx로 — 쓰기 전용 모드로 행을 흘려 써서 메모리를 적게 씀"""
+    wb = Workbook(write_only=True)
+    for name, df in sheets.items():
+        ws = wb.create_sheet(title=name[:31])
+        ws.append([str(c) for c in df.columns])
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+class ExportCache:
+    """내용 해시 → xlsx 바이트 (최근 것만 보관)"""
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._files: OrderedDict[str, bytes] = OrderedDict()
+        # DataFrame 객체 → 해시 (바뀌지 않은 월을 매번 다시 해시하지 않도록)
+        # 약한 참조라 편집기가 리런마다 새로 만든 표를 붙잡지 않음 — 표가 사라지면 항목도 사라짐
+        self._fingerprints: dict[int, tuple[weakref.ref, str]] = {}
+
+    def fingerprint(self, sheets: dict[str, pd.DataFrame]) -> str:
+        h = hashlib.sha1()
+        for name, df in sheets.items():
+            memo = self._fingerprints.get(id(df))
+            if memo is None or memo[0]() is not df:
+                memo = (self._watch(df), frame_fingerprint(df))
+                self._fingerprints[id(df)] = memo
+            h.update(name.encode())
+            h.update(memo[1].encode())
+        return h.hexdigest()
+
+    def _watch(self, df: pd.DataFrame) -> weakref.ref:
+        memos, key = self._fingerprints, id(df)
+
+        def drop(ref):
+            if key in memos and memos[key][0] is ref:
+                del memos[key]
+        return weakref.ref(df, drop)
+
+    def get(self, fp: str) -> bytes | None:
+        data = self._files.get(fp)
+        if data is not None:
+            self._files.move_to_end(fp)
+        return data
+
+    def build(self, fp: str, sheets: dict[str, pd.DataFrame]) -> bytes:
+        data = self.get(fp)
+        if data is None:
+            with stage("export.xlsx", sum(len(df) for df in sheets.values())):
+                data = write_workbook(sheets)
+            self._files[fp] = data
+            while len(self._files) > self.max_entries:
+                self._files.popitem(last=False)
+        return data
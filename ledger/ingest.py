@@ -0,0 +1,212 @@
+"""명세서 읽기/정리 — 파일 여러 개는 프로세스 풀에서 병렬 처리"""
+import os
+import time
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from dataclasses import dataclass
+from multiprocessing import get_context
+
+import pandas as pd
+
+from ledger import profiling
+from ledger.classify import KeywordClassifier, apply_categories
+from ledger.config import AUTO_CLASSIFY, COLUMN_RENAME, DATA_COLUMNS
+from ledger.dates import parse_dates
+from ledger.money import normalize_amounts
+from ledger.profiling import stage
+from ledger.reader import find_header_row, map_header, read_statement
+from ledger.schema import concat_ledgers, empty_ledger, enforce_schema
+
+_default_classifier: KeywordClassifier | None = None
+
+
+def default_classifier() -> KeywordClassifier:
+    """AUTO_CLASSIFY 기본 분류기 (분류기를 따로 넘기지 않은 경우)"""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = KeywordClassifier(AUTO_CLASSIFY)
+    return _default_classifier
+
+
+# process_dataframe 결과가 달라지는 수정을 하면 올릴 것 (파싱 캐시 무효화)
+PARSER_VERSION = 4
+
+
+def process_dataframe(df: pd.DataFrame, classifier: KeywordClassifier | None = None) -> pd.DataFrame:
+    with stage("parse.header", len(df)):
+        df = df.dropna(axis=1, how="all")
+        df = df.loc[:, ~df.columns.astype(str).str.match(r"^\s*$")]
+
+        # 1) 헤더 행 찾기 — 처음 10행 내에서 2개 이상 HEADER_ALIASES에 매칭되는 행
+        header_row_idx = find_header_row(df)
+
+        if header_row_idx is not None:
+            # 헤더 행 사용
+            header_row = [str(v).strip() for v in df.iloc[header_row_idx]]
+            df = df.iloc[header_row_idx + 1:].reset_index(drop=True)
+            # 헤더명 → 표준 칼럼명 매핑
+            df.columns = map_header(header_row)
+        else:
+            # 위치 기반 매핑 (fallback)
+            new_cols = [COLUMN_RENAME.get(i, f"_drop_{i}") for i in range(len(df.columns))]
+            df.columns = new_cols
+
+        df = df.loc[:, ~df.columns.str.startswith("_drop_")]
+        df = df.loc[:, ~df.columns.str.startswith("_orig_")]
+
+        df = df.dropna(how="all").reset_index(drop=True)
+
+    # 금액 칼럼은 한 번만 파싱 — 결제금액이 금액이 아닌 행(합계 등) 제거, 환불 처리, 실지출 계산
+    with stage("parse.amounts", len(df)):
+        df = normalize_amounts(df)
+
+    if "날짜" in df.columns:
+        with stage("parse.dates", len(df)):
+            df["날짜"] = parse_dates(df["날짜"])
+
+    with stage("parse.classify", len(df)):
+        df = apply_categories(df, classifier or default_classifier())
+
+        for c in ["대분류", "소분류"]:
+            if c in df.columns:
+                df[c] = df[c].fillna("").astype(str).str.strip()
+
+    # 모든 칼럼이 항상 존재하도록 보장
+    for col in DATA_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+
+    # 칼럼 순서 정렬 + 스키마 dtype (categorical 분류, Int64 금액, datetime64 날짜)
+    with stage("parse.schema", len(df)):
+        return enforce_schema(df[[c for c in DATA_COLUMNS if c in df.columns]])
+
+
+# ===================== 여러 파일 병렬 처리 =====================
+
+@dataclass
+class IngestResult:
+    """파일 하나의 처리 결과 — 실패하면 df 대신 error"""
+    index: int
+    name: str
+    df: pd.DataFrame | None = None
+    error: str | None = None
+    seconds: float = 0.0
+    stages: dict | None = None     # 계측을 켰을 때만 — 단계 이름 → {calls, seconds, rows}
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def ingest_one(index: int, name: str, data: bytes,
+               classifier: KeywordClassifier | None = None, profile: bool = False) -> IngestResult:
+    """파일 하나 읽기+정리 — 예외는 결과에 담아 돌려줌 (배치 전체를 멈추지 않음)
+
+    profile이면 단계별 시간을 result.stages에 담아 돌려줌 (작업 프로세스에서 잰 값을 넘기려고).
+    """
+    t0 = time.perf_counter()
+    with (profiling.capture() if profile else nullcontext()) as prof:
+        try:
+            with stage("read.file", len(data)):
+                raw = read_statement(data, name)
+            res = IngestResult(index, name, df=process_dataframe(raw, classifier))
+        except Exception as e:
+            detail = traceback.format_exception_only(type(e), e)[-1].strip()
+            res = IngestResult(index, name, error=detail)
+    res.seconds = time.perf_counter() - t0
+    if prof is not None:
+        res.stages = prof.stats()
+    return res
+
+
+def default_workers() -> int:
+    return max(1, min(8, (os.cpu_count() or 1) - 1))
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """리런마다 프로세스를 새로 띄우지 않도록 풀을 재사용 (작업 수가 바뀌면 다시 만듦)"""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        # Streamlit 서버 스레드를 fork하지 않도록 spawn 사용
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown_pool():
+    """풀 종료 — 다음 병렬 처리 때 새로 만듦"""
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool, _pool_workers = None, 0
+
+
+def ingest_files(files: list[tuple[str, bytes]], classifier: KeywordClassifier | None = None,
+                 workers: int | None = None,
+                 on_done: Callable[[IngestResult, int, int], None] | None = None) -> list[IngestResult]:
+    """(파일명, 내용) 목록 처리 — 완료 순서대로 on_done(결과, 완료 수, 전체 수) 호출, 반환은 입력 순서"""
+    workers = default_workers() if workers is None else max(1, workers)
+    total = len(files)
+    results: list[IngestResult] = []
+
+    def finish(res: IngestResult):
+        results.append(res)
+        if on_done:
+            on_done(res, len(results), total)
+
+    profile = profiling.enabled()
+    if workers == 1 or total <= 1:
+        for i, (name, data) in enumerate(files):
+            finish(ingest_one(i, name, data, classifier, profile))
+    else:
+        pool = _get_pool(workers)
+        futures = {pool.submit(ingest_one, i, name, data, classifier, profile): (i, name)
+                   for i, (name, data) in enumerate(files)}
+        for fut in as_completed(futures):
+            i, name = futures[fut]
+            try:
+                finish(fut.result())
+            except BrokenProcessPool as e:
+                shutdown_pool()
+                finish(IngestResult(i, name, error=f"작업 프로세스 종료: {e}"))
+            except Exception as e:
+                finish(IngestResult(i, name, error=str(e)))
+
+    for res in results:
+        if res.stages:
+            profiling.active().merge(res.stages)
+    return sorted(results, key=lambda r: r.index)
+
+
+def merge_results(results: list[IngestResult]) -> pd.DataFrame:
+    """성공한 결과를 입력 순서대로 합치고 날짜순 정렬 (같은 날짜는 입력 순서 유지)"""
+    combined = concat_ledgers([r.df for r in results if r.ok], ignore_index=True)
+    return combined.sort_values("날짜", na_position="last", kind="stable").reset_index(drop=True)
+
+
+def route_by_period(frames: list[pd.DataFrame]) -> tuple[dict[tuple[int, int], list[tuple[int, pd.DataFrame]]], pd.DataFrame]:
+    """파일별 표를 거래 날짜의 (연도, 월)로 나눔 — ({(연도, 월): [(파일 번호, 그 달 행)]}, 날짜 없는 행)
+
+    모든 파일을 한 표로 합쳐 (연도, 월, 파일) groupby 한 번으로 나눈다.
+    """
+    if not frames:
+        return {}, empty_ledger()
+    combined = enforce_schema(pd.concat(frames, keys=range(len(frames))))
+    file_no = combined.index.get_level_values(0).to_numpy()
+    dates = combined["날짜"]
+    dated = dates.notna().to_numpy()
+
+    routed: dict[tuple[int, int], list[tuple[int, pd.DataFrame]]] = {}
+    keys = [dates[dated].dt.year.to_numpy(), dates[dated].dt.month.to_numpy(), file_no[dated]]
+    for (y, m, f), part in combined[dated].groupby(keys, sort=True):
+        routed.setdefault((int(y), int(m)), []).append((int(f), part.reset_index(drop=True)))
+    return routed, combined[~dated].reset_index(drop=True)
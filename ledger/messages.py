@@ -0,0 +1,270 @@
+"""카드 결제 알림(iMessage/문자) 가져오기 — 메시지를 배치 단위로 흘려 읽고 카드사 템플릿으로 파싱
+
+원본은 iMessage의 chat.db(SQLite) 또는 문자 내보내기(CSV/텍스트). 메시지마다 rowid가 있어서
+마지막으로 처리한 rowid 이후만 읽는다 (텍스트/CSV는 파일 안의 순번이 rowid — 뒤에 덧붙는 내보내기 기준).
+한 번에 batch_size개 메시지만 메모리에 둔다.
+"""
+import codecs
+import csv
+import io
+import re
+import sqlite3
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from ledger.classify import KeywordClassifier, apply_categories
+from ledger.money import normalize_amounts
+from ledger.reader import CSV_ENCODINGS
+from ledger.schema import enforce_schema
+
+BATCH_SIZE = 5_000
+# chat.db의 date는 2001-01-01(UTC) 기준 초 (macOS 10.13부터는 나노초)
+APPLE_EPOCH = pd.Timestamp("2001-01-01")
+# 결제 알림이 아닌 메시지를 SQL에서 먼저 거름
+NOTICE_WORDS = ["승인", "취소"]
+
+TEXT_ALIASES = {"text", "body", "message", "내용", "메시지", "본문", "문자"}
+DATE_ALIASES = {"date", "datetime", "time", "날짜", "시간", "수신시간", "받은시간", "일시"}
+
+# ===================== 카드사 템플릿 =====================
+
+# "(주)홍*동님" 같은 가린 이름 — 금액 앞에 올 수 있음
+_NAME = r"(?:[^\s\d]*\*[^\s\d]*님?\s+)?"
+# 카드사 접두어 뒤 공통 본문: 승인/취소, 이름, 금액, 할부, 월/일 시:분, 가맹점, (누적/잔액 …)
+_BODY = (r"(?P<kind>승인취소|취소|승인)\S*\s*" + _NAME +
+         r"(?P<amount>[\d,]+)원\s*(?:\(?(?P<plan>일시불|\d+개월)\)?\s*)?"
+         r"(?P<date>\d{1,2}/\d{1,2})\s+(?P<time>\d{1,2}:\d{2})\s+"
+         r"(?P<merchant>.+?)(?:\s+(?:누적|잔액|사용가능|일시불한도)\S*.*)?$")
+_CARD = r"\s*\(?(?P<card>[\d*]{4})?\)?\s*"
+
+# 결제수단 이름 → 접두어 정규식 (알림에 나오는 카드사 표기)
+ISSUER_TEMPLATES = {
+    "신한카드": r"신한(?:카드|체크)",
+    "삼성카드": r"삼성(?:카드|체크)?",
+    "현대카드": r"현대카드",
+    "KB국민카드": r"KB국민(?:카드|체크)",
+    "우리카드": r"우리(?:카드|체크)?",
+    "롯데카드": r"롯데(?:카드|체크)?",
+}
+
+
+@dataclass
+class _Template:
+    payment: str
+    pattern: re.Pattern
+
+
+_TEMPLATES = [_Template(p, re.compile(prefix + _CARD + _BODY)) for p, prefix in ISSUER_TEMPLATES.items()]
+# 메시지에 어느 카드사 이름이 있는지 한 번에 찾음 → 그 템플릿만 시도
+_DISPATCH = re.compile("|".join(f"(?P<t{i}>{prefix})" for i, prefix in enumerate(ISSUER_TEMPLATES.values())))
+
+
+def parse_notice(text: str) -> dict | None:
+    """결제 알림 한 건 → {payment, card, kind, amount, plan, date, time, merchant} (알림이 아니면 None)"""
+    if not isinstance(text, str):
+        return None
+    text = " ".join(text.replace("[Web발신]", " ").split())
+    head = _DISPATCH.search(text)
+    if head is None:
+        return None
+    template = _TEMPLATES[int(head.lastgroup[1:])]
+    m = template.pattern.match(text, head.start())
+    if m is None:
+        return None
+    return {"payment": template.payment, **m.groupdict()}
+
+
+def parse_batch(batch: pd.DataFrame, year: int | None = None) -> pd.DataFrame:
+    """메시지 배치(rowid, sent, text) → 가계부 행 (알림이 아닌 메시지는 버림)
+
+    알림의 월/일에 받은 시각의 연도를 붙인다 (12월 거래를 1월에 받았으면 전년도).
+    받은 시각이 없으면 year (없으면 올해).
+    """
+    found = [(rowid, sent, n) for rowid, sent, n in
+             zip(batch["rowid"], batch["sent"], map(parse_notice, batch["text"])) if n is not None]
+    if not found:
+        return enforce_schema(pd.DataFrame())
+    rows = pd.DataFrame([n for _, _, n in found])
+    sent = pd.to_datetime(pd.Series([s for _, s, _ in found]), errors="coerce")
+
+    md = rows["date"].str.split("/", expand=True).astype(int)
+    hm = rows["time"].str.split(":", expand=True).astype(int)
+    base_year = sent.dt.year.fillna(year or pd.Timestamp.now().year).astype(int)
+    base_year -= ((md[0] > sent.dt.month) & sent.notna()).astype(int)
+    dates = pd.to_datetime(pd.DataFrame({"year": base_year, "month": md[0], "day": md[1],
+                                         "hour": hm[0], "minute": hm[1]}), errors="coerce")
+
+    amount = rows["amount"].str.replace(",", "", regex=False).astype("int64")
+    amount = amount.where(~rows["kind"].str.contains("취소"), -amount)   # 취소는 환불(음수)
+    card = ("카드 " + rows["card"]).where(rows["card"].notna(), "")
+    note = (card + " " + rows["plan"].fillna("")).str.strip()
+    df = pd.DataFrame({
+        "날짜": dates,
+        "결제수단": rows["payment"],
+        "지출 내용": rows["merchant"],
+        "결제금액": amount,
+        "비고": note,
+    })
+    df.index = pd.Index([r for r, _, _ in found], name="rowid")
+    return df
+
+
+# ===================== 원본 읽기 (배치) =====================
+
+def _attributed_text(blob: bytes | None) -> str | None:
+    """최근 macOS는 본문을 text 대신 attributedBody(typedstream)에 둠 — NSString 값만 꺼냄"""
+    if not blob:
+        return None
+    i = blob.find(b"NSString")
+    if i < 0:
+        return None
+    j = i + len(b"NSString") + 5
+    if j >= len(blob):
+        return None
+    length = blob[j]
+    j += 1
+    if length == 0x81:
+        length = int.from_bytes(blob[j:j + 2], "little")
+        j += 2
+    elif length == 0x82:
+        length = int.from_bytes(blob[j:j + 4], "little")
+        j += 4
+    return blob[j:j + length].decode("utf-8", errors="ignore")
+
+
+def iter_chat_db(path: str | Path, after: int = 0,
+                 batch_size: int = BATCH_SIZE) -> Iterator[tuple[int, pd.DataFrame]]:
+    """chat.db의 받은 메시지를 rowid 순으로 batch_size개씩 — (이번 배치까지 훑은 rowid, 배치)
+
+    읽기 전용으로 열고, rowid 범위로 페이지를 넘기므로 표 전체를 한 번에 읽지 않는다.
+    """
+    uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+    words = " OR ".join("text LIKE ? OR CAST(attributedBody AS TEXT) LIKE ?" for _ in NOTICE_WORDS)
+    params = [p for w in NOTICE_WORDS for p in (f"%{w}%", f"%{w}%")]
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        (last,) = conn.execute("SELECT COALESCE(MAX(ROWID), 0) FROM message").fetchone()
+        cursor = after
+        while cursor < last:
+            rows = conn.execute(
+                f"SELECT ROWID, date, text, attributedBody FROM message "
+                f"WHERE ROWID > ? AND ROWID <= ? AND is_from_me = 0 AND ({words}) "
+                f"ORDER BY ROWID LIMIT ?", (cursor, last, *params, batch_size)).fetchall()
+            if not rows:
+                break
+            cursor = rows[-1][0] if len(rows) == batch_size else last
+            batch = pd.DataFrame(rows, columns=["rowid", "date", "text", "body"])
+            raw = pd.to_numeric(batch["date"], errors="coerce")
+            seconds = raw.where(raw.abs() < 1e11, raw / 1e9)
+            batch["sent"] = APPLE_EPOCH + pd.to_timedelta(seconds, unit="s")
+            batch["text"] = batch["text"].where(batch["text"].notna(), batch["body"].map(_attributed_text))
+            yield cursor, batch[["rowid", "sent", "text"]]
+        if cursor < last:
+            yield last, pd.DataFrame(columns=["rowid", "sent", "text"])
+    finally:
+        conn.close()
+
+
+def _text_stream(data: bytes) -> io.TextIOBase:
+    """앞부분으로 인코딩을 정해 텍스트 스트림으로 (명세서 CSV와 같은 후보)"""
+    head = data[:65536]
+    for enc in CSV_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(enc)().decode(head)
+            return io.TextIOWrapper(io.BytesIO(data), encoding=enc, errors="replace", newline="")
+        except UnicodeDecodeError:
+            continue
+    return io.TextIOWrapper(io.BytesIO(data), encoding=CSV_ENCODINGS[0], errors="replace", newline="")
+
+
+def _iter_csv(stream) -> Iterator[tuple[str | None, str]]:
+    reader = csv.reader(stream)
+    header = [h.strip().lower().replace(" ", "") for h in next(reader, [])]
+    text_col = next((i for i, h in enumerate(header) if h in TEXT_ALIASES), None)
+    date_col = next((i for i, h in enumerate(header) if h in DATE_ALIASES), None)
+    if text_col is None:
+        raise ValueError("메시지 본문 칼럼을 찾을 수 없습니다 (text/내용/메시지 …)")
+    for row in reader:
+        if len(row) > text_col:
+            sent = row[date_col] if date_col is not None and len(row) > date_col else None
+            yield sent, row[text_col]
+
+
+_STAMP = re.compile(r"^\s*\d{4}[-./년]\s*\d{1,2}[-./월]\s*\d{1,2}")
+
+
+def _iter_text(stream) -> Iterator[tuple[str | None, str]]:
+    """빈 줄로 구분된 메시지 — 첫 줄이 날짜로 시작하면 받은 시각으로 씀"""
+    lines: list[str] = []
+    for line in stream:
+        line = line.rstrip("\r\n")
+        if line.strip():
+            lines.append(line)
+            continue
+        if lines:
+            yield _split_stamp(lines)
+            lines = []
+    if lines:
+        yield _split_stamp(lines)
+
+
+def _split_stamp(lines: list[str]) -> tuple[str | None, str]:
+    if len(lines) > 1 and _STAMP.match(lines[0]):
+        return lines[0].strip(), "\n".join(lines[1:])
+    return None, "\n".join(lines)
+
+
+def iter_dump(data: bytes, name: str, after: int = 0,
+              batch_size: int = BATCH_SIZE) -> Iterator[tuple[int, pd.DataFrame]]:
+    """문자 내보내기(CSV/텍스트)를 batch_size개씩 — rowid는 파일 안의 메시지 순번(1부터)"""
+    stream = _text_stream(data)
+    messages = _iter_csv(stream) if name.lower().endswith(".csv") else _iter_text(stream)
+    buf, rowid = [], 0
+    for rowid, (sent, text) in enumerate(messages, start=1):
+        if rowid <= after:
+            continue
+        buf.append((rowid, sent, text))
+        if len(buf) >= batch_size:
+            yield rowid, _dump_batch(buf)
+            buf = []
+    if buf or rowid > after:
+        yield max(rowid, after), _dump_batch(buf)
+
+
+def _dump_batch(buf: list) -> pd.DataFrame:
+    batch = pd.DataFrame(buf, columns=["rowid", "sent", "text"])
+    batch["sent"] = pd.to_datetime(batch["sent"], errors="coerce", format="mixed")
+    return batch
+
+
+# ===================== 가져오기 =====================
+
+@dataclass
+class ImportResult:
+    rows: pd.DataFrame     # 가계부 행 (분류까지 끝난 것), 인덱스는 메시지 rowid
+                           # 날짜를 못 읽은 알림도 날짜 NaT로 들어 있음 — last_rowid가 이미 지나갔으니 버리면 안 됨
+    scanned: int           # 읽은 메시지 수
+    last_rowid: int        # 다음 가져오기는 이 rowid 이후부터
+
+
+def import_messages(batches: Iterator[tuple[int, pd.DataFrame]], classifier: KeywordClassifier,
+                    last_rowid: int = 0, year: int | None = None) -> ImportResult:
+    """배치마다 파싱 → 알림 행만 모아 분류/금액 정리 (원본 메시지는 배치가 끝나면 버림)"""
+    parts, scanned = [], 0
+    for last_rowid, batch in batches:
+        scanned += len(batch)
+        if len(batch):
+            parts.append(parse_batch(batch, year))
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return ImportResult(enforce_schema(pd.DataFrame()), scanned, last_rowid)
+    rows = pd.concat(parts)
+    index = rows.index
+    rows = normalize_amounts(rows.reset_index(drop=True))
+    rows = apply_categories(rows, classifier)
+    rows = enforce_schema(rows)
+    rows.index = index
+    return ImportResult(rows, scanned, last_rowid)
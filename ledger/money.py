@@ -0,0 +1,100 @@
+"""금액 칼럼 정규화 — 칼럼마다 한 번만 파싱하고, 같은 결과로 행 거르기와 실지출 계산까지"""
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from ledger.schema import to_won
+
+# 통화 기호·천 단위 구분자·공백 — 정규식 한 번으로 칼럼 전체에서 삭제
+_STRIP = "[,，원₩￦\\s\u00a0\u3000]"
+# 삭제 후 바로 float로 바꿀 수 있는 평범한 숫자
+_PLAIN = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+# 나머지 표기: 전각 숫자/부호 → 반각 (str.translate)
+_TRANSLATE = str.maketrans(
+    {**{chr(0xFF10 + i): str(i) for i in range(10)},
+     "．": ".", "－": "-", "−": "-", "＋": "+", "（": "(", "）": ")"})
+# (1000) / -1000 / +1000 / 1000- → 부호, 숫자
+_MONEY = r"^(?P<open>\()?(?P<sign>[+-])?(?P<num>\d+(?:\.\d*)?|\.\d+)(?P<close>\))?(?P<trail>-)?$"
+
+
+def parse_amounts(values: pd.Series) -> pd.Series:
+    """금액 칼럼 → float (인식 못 한 값은 NaN)
+
+    "12,000원", "₩12,000", "１２，０００", "(12,000)", "-12,000", "12,000-" 처럼
+    명세서에 나오는 표기를 처리한다. 괄호와 마이너스는 음수(환불)다.
+    """
+    if is_numeric_dtype(values) and not is_bool_dtype(values):
+        out = values.astype("float64")
+        return out.where(np.isfinite(out))
+    # 구분자를 지우고 평범한 숫자는 칼럼째로 float 변환 → 남은 것만 전각 → 반각 후 다시
+    # → 그래도 남은 괄호/끝 마이너스 표기만 정규식으로
+    out = np.full(len(values), np.nan)
+    pos = np.flatnonzero(values.notna().to_numpy())
+    text = values.iloc[pos].astype(str).str.replace(_STRIP, "", regex=True)
+    for step in range(2):
+        plain = text.str.fullmatch(_PLAIN).to_numpy(dtype=bool, na_value=False)
+        out[pos[plain]] = text[plain].astype("float64").to_numpy()
+        pos, text = pos[~plain], text[~plain]
+        if not len(pos):
+            break
+        if step == 0:
+            text = text.str.translate(_TRANSLATE)
+    if len(pos):
+        parts = text.str.extract(_MONEY)
+        num = pd.to_numeric(parts["num"], errors="coerce").astype("float64")
+        paren = parts["open"].notna()
+        num[paren != parts["close"].notna()] = np.nan  # 괄호 짝이 안 맞으면 금액 아님
+        neg = paren | parts["sign"].eq("-") | parts["trail"].notna()
+        out[pos] = num.where(~neg, -num).to_numpy()
+    out = pd.Series(out, index=values.index)
+    return out.where(np.isfinite(out))
+
+
+def normalize_amounts(df: pd.DataFrame) -> pd.DataFrame:
+    """결제금액이 금액이 아닌 행(합계/빈 줄 등)을 거르고 결제금액/할인/실지출 계산
+
+    음수 결제금액(환불)은 결제금액=할인=|금액|, 실지출=0 으로 기록한다.
+    """
+    if "결제금액" in df.columns:
+        amount = parse_amounts(df["결제금액"])
+        valid = amount.notna().to_numpy()
+        if not valid.all():
+            df = df[valid].reset_index(drop=True)
+            amount = amount[valid].reset_index(drop=True)
+    else:
+        amount = pd.Series(0.0, index=df.index)
+    if "할인" in df.columns:
+        discount = parse_amounts(df["할인"]).fillna(0)
+    else:
+        discount = pd.Series(0.0, index=df.index)
+
+    refund = amount < 0
+    amount = amount.abs()
+    discount = discount.mask(refund, amount)
+    df = df.copy()
+    df["결제금액"] = amount
+    df["할인"] = discount
+    df["실지출"] = amount - discount
+    return df
+
+
+def signed_amounts(df: pd.DataFrame) -> pd.Series:
+    """결제금액 → 원 단위, 환불 행은 음수 — 같은 금액의 결제와 환불을 같은 거래로 보지 않도록
+
+    normalize_amounts는 환불을 결제금액 = 할인 = |금액| 로 기록하므로 그 모양의 행을 환불로 본다
+    (전액 할인 결제도 같은 모양이라 환불 쪽으로 묶임).
+    """
+    amount = to_won(df["결제금액"])
+    if "할인" not in df.columns:
+        return amount
+    refund = ((amount > 0) & (to_won(df["할인"]) == amount)).fillna(False).astype(bool)
+    return amount.where(~refund, -amount)
+
+
+def calc_actual_spend(df: pd.DataFrame) -> pd.DataFrame:
+    """실지출 = 결제금액 - 할인 계산 (편집 표에서 리런마다 — 제자리 수정)"""
+    if "결제금액" in df.columns and "할인" in df.columns:
+        df["결제금액"] = to_won(df["결제금액"]).fillna(0)
+        df["할인"] = to_won(df["할인"]).fillna(0)
+        df["실지출"] = df["결제금액"] - df["할인"]
+    return df
@@ -0,0 +1,119 @@
+"""월 표 페이지 보기 — 칼럼 인덱스로 서버에서 거르고, 한 페이지만 편집기로 보낸 뒤 행 id로 되돌려 합침
+
+편집기로 가는 행 수가 페이지 크기로 고정되므로 월 표가 커져도 리런마다 보내는 양은 같다.
+인덱스는 표 객체가 바뀔 때만 다시 만든다 (날짜 정렬 배열, 분류/결제수단별 행 위치, 가맹점 고유값).
+"""
+import math
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from ledger.schema import concat_ledgers, enforce_schema
+from ledger.store import append_rows, row_hashes
+
+PAGE_SIZES = [50, 100, 200, 500]
+GROUP_COLUMNS = ["대분류", "소분류", "결제수단"]
+
+
+@dataclass(frozen=True)
+class TableFilter:
+    start: date | None = None
+    end: date | None = None            # 이 날짜까지 포함
+    majors: tuple[str, ...] = ()
+    minors: tuple[str, ...] = ()
+    payments: tuple[str, ...] = ()
+    text: str = ""                     # 지출 내용 부분 문자열 (대소문자 무시)
+
+    def active(self) -> bool:
+        return bool(self.start or self.end or self.majors or self.minors or self.payments
+                    or self.text.strip())
+
+
+class TableIndex:
+    """표 하나의 칼럼 인덱스 — 거르기는 인덱스에서 행 위치만 모아 교집합"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.size = len(df)
+        days = pd.to_datetime(df["날짜"], errors="coerce").to_numpy("datetime64[ns]")
+        valid = np.flatnonzero(~np.isnat(days))
+        self._date_order = valid[np.argsort(days[valid], kind="stable")]
+        self._date_keys = days[self._date_order]
+        self._groups = {col: df[col].groupby(df[col], observed=True, sort=True).indices
+                        for col in GROUP_COLUMNS if col in df.columns}
+        codes, uniques = pd.factorize(df["지출 내용"].astype(object))
+        self._text_codes = codes
+        self._text_lower = pd.Index(uniques).astype(str).str.lower()
+
+    def options(self, col: str) -> list[str]:
+        """칼럼에 실제로 있는 값 (빈 칸 제외) — 필터 선택지"""
+        return [str(v) for v in self._groups.get(col, {}) if str(v).strip()]
+
+    def date_range(self) -> tuple[date, date] | None:
+        if not len(self._date_keys):
+            return None
+        return (pd.Timestamp(self._date_keys[0]).date(), pd.Timestamp(self._date_keys[-1]).date())
+
+    def _positions(self, col: str, values) -> np.ndarray:
+        groups = self._groups.get(col, {})
+        hits = [groups[v] for v in values if v in groups]
+        return np.concatenate(hits) if hits else np.empty(0, dtype=np.intp)
+
+    def select(self, f: TableFilter) -> np.ndarray:
+        """조건에 맞는 행 위치 (표 순서)"""
+        if not f.active():
+            return np.arange(self.size)
+        mask = np.ones(self.size, dtype=bool)
+
+        if f.start or f.end:
+            lo = 0 if f.start is None else np.searchsorted(
+                self._date_keys, np.datetime64(f.start, "ns"), side="left")
+            hi = len(self._date_keys) if f.end is None else np.searchsorted(
+                self._date_keys, np.datetime64(f.end + timedelta(days=1), "ns"), side="left")
+            hit = np.zeros(self.size, dtype=bool)
+            hit[self._date_order[lo:hi]] = True
+            mask &= hit
+        for col, values in (("대분류", f.majors), ("소분류", f.minors), ("결제수단", f.payments)):
+            if values:
+                hit = np.zeros(self.size, dtype=bool)
+                hit[self._positions(col, values)] = True
+                mask &= hit
+        needle = f.text.strip().lower()
+        if needle:
+            codes = np.flatnonzero(self._text_lower.str.contains(needle, regex=False))
+            mask &= np.isin(self._text_codes, codes)
+        return np.flatnonzero(mask)
+
+
+def page_count(n: int, page_size: int) -> int:
+    return max(1, math.ceil(n / page_size))
+
+
+def page_rows(positions: np.ndarray, page: int, page_size: int) -> np.ndarray:
+    """1부터 세는 page번째 페이지의 행 위치"""
+    start = (page - 1) * page_size
+    return positions[start:start + page_size]
+
+
+def merge_page(full: pd.DataFrame, page: pd.DataFrame, edited: pd.DataFrame) -> pd.DataFrame:
+    """편집한 페이지를 전체 표에 합침 — 행 id(인덱스)로 맞추고, 바뀐 게 없으면 full 그대로
+
+    page에 있던 행 중 edited에 없는 행은 삭제, page에 없던 행은 표 끝에 새 행으로 붙인다.
+    """
+    in_page = edited.index.isin(page.index)
+    kept = edited.index[in_page]
+    deleted = page.index.difference(kept)
+    added = edited[~in_page]
+    patch = enforce_schema(edited.loc[kept])[full.columns]
+    changed = kept[row_hashes(patch) != row_hashes(page.loc[kept])]
+    if changed.empty and deleted.empty and added.empty:
+        return full
+
+    order = full.index.difference(deleted, sort=False)
+    out = full.drop(index=deleted)
+    if len(changed):
+        out = concat_ledgers([out.drop(index=changed), patch.loc[changed]]).reindex(order)
+    if len(added):
+        out = append_rows(out, added.reindex(columns=full.columns))
+    return out
@@ -0,0 +1,44 @@
+"""연·월 파티션 키와 기간 — 파티션 키는 (연도, 월) 튜플
+
+기간 질의(올해 누적, 최근 12개월, 전년 같은 기간)는 모두 월 단위 파티션 목록으로 바꿔서
+파티션별 부분합을 더한다. 달의 일부만 걸치는 기간은 그 달 전체로 센다.
+"""
+from datetime import date
+
+Period = tuple[int, int]
+
+
+def period_label(p: Period) -> str:
+    return f"{p[0]}년 {p[1]}월"
+
+
+def shift(p: Period, months: int) -> Period:
+    """months개월 뒤(음수면 앞)의 파티션"""
+    n = p[0] * 12 + (p[1] - 1) + months
+    return n // 12, n % 12 + 1
+
+
+def months_between(start: Period, end: Period) -> list[Period]:
+    """start ~ end (양 끝 포함)"""
+    n = (end[0] * 12 + end[1]) - (start[0] * 12 + start[1])
+    return [shift(start, i) for i in range(n + 1)]
+
+
+def year_periods(year: int) -> list[Period]:
+    return [(year, m) for m in range(1, 13)]
+
+
+def year_to_date(today: date) -> list[Period]:
+    """올해 1월 ~ 이번 달"""
+    return months_between((today.year, 1), (today.year, today.month))
+
+
+def trailing(today: date, months: int = 12) -> list[Period]:
+    """이번 달까지 최근 months개월"""
+    end = (today.year, today.month)
+    return months_between(shift(end, -(months - 1)), end)
+
+
+def year_ago(periods: list[Period]) -> list[Period]:
+    """같은 달들의 1년 전"""
+    return [(y - 1, m) for y, m in periods]
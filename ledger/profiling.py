@@ -0,0 +1,160 @@
+"""단계별 시간/행 수 계측 — 켜져 있을 때만 기록하고, 꺼져 있으면 빈 컨텍스트만 돌려줌
+
+    with profiling.stage("parse.dates", rows=len(df)):
+        ...
+
+리런 하나가 Profiler 하나다. activate()로 켠 동안에만 stage()/count()가 기록되고,
+꺼져 있으면 스레드 로컬 확인 한 번으로 끝난다 (Streamlit 세션마다 스크립트 스레드가 따로라 서로 안 섞임).
+작업 프로세스에서 잰 값은 stats()로 받아 merge()로 합친다.
+"""
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+
+_NULL = nullcontext()
+_local = threading.local()
+
+
+@dataclass
+class StageStat:
+    calls: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+
+
+@dataclass
+class Profiler:
+    """리런 하나의 단계별 기록 — cprofile/tracemalloc은 선택 (켜면 그만큼 느려짐)"""
+    cprofile: bool = False
+    trace_memory: bool = False
+    label: str = ""
+    stages: dict[str, StageStat] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    started: float = field(default_factory=time.time)
+    seconds: float = 0.0
+    peak_mb: float | None = None
+    profile_text: str = ""
+
+    def __post_init__(self):
+        self._t0 = time.perf_counter()
+        self._profile = cProfile.Profile() if self.cprofile else None
+        self._own_trace = False
+
+    @contextmanager
+    def stage(self, name: str, rows: int | None = None):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - t0, rows)
+
+    def add(self, name: str, seconds: float, rows: int | None = None, calls: int = 1):
+        stat = self.stages.get(name)
+        if stat is None:
+            stat = self.stages[name] = StageStat()
+        stat.calls += calls
+        stat.seconds += seconds
+        if rows:
+            stat.rows += rows
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, stats: dict[str, dict]):
+        """다른 프로세스에서 잰 stats() 합치기"""
+        for name, s in stats.items():
+            self.add(name, s["seconds"], s["rows"], s["calls"])
+
+    def stats(self) -> dict[str, dict]:
+        return {name: asdict(s) for name, s in self.stages.items()}
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_trace = True
+        if self._profile is not None:
+            self._profile.enable()
+
+    def stop(self, top: int = 30):
+        if self._profile is not None:
+            self._profile.disable()
+            buf = io.StringIO()
+            pstats.Stats(self._profile, stream=buf).sort_stats("cumulative").print_stats(top)
+            self.profile_text = buf.getvalue()
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            if self._own_trace:
+                tracemalloc.stop()
+        self.seconds = time.perf_counter() - self._t0
+
+    def report(self) -> dict:
+        """JSON으로 내보낼 수 있는 요약"""
+        return {
+            "label": self.label,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "seconds": round(self.seconds, 6),
+            "peak_mb": None if self.peak_mb is None else round(self.peak_mb, 3),
+            "stages": {name: {**asdict(s), "seconds": round(s.seconds, 6)}
+                       for name, s in sorted(self.stages.items(), key=lambda kv: -kv[1].seconds)},
+            "counters": dict(self.counters),
+            "profile": self.profile_text,
+        }
+
+
+def active() -> Profiler | None:
+    return getattr(_local, "profiler", None)
+
+
+def enabled() -> bool:
+    return active() is not None
+
+
+def activate(profiler: Profiler) -> Profiler:
+    # 지난 리런이 중간에 끊겼으면(st.rerun 등) 남은 것부터 정리
+    deactivate()
+    _local.profiler = profiler
+    profiler.start()
+    return profiler
+
+
+def deactivate() -> Profiler | None:
+    profiler = active()
+    _local.profiler = None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+@contextmanager
+def capture():
+    """이 블록만 따로 재는 Profiler (작업 프로세스에서 파일 하나 처리할 때) — 끝나면 이전 상태로"""
+    prev = active()
+    _local.profiler = Profiler()
+    try:
+        yield _local.profiler
+    finally:
+        _local.profiler = prev
+
+
+def stage(name: str, rows: int | None = None):
+    """켜져 있으면 단계 시간 기록, 꺼져 있으면 아무것도 안 하는 컨텍스트"""
+    p = getattr(_local, "profiler", None)
+    if p is None:
+        return _NULL
+    return p.stage(name, rows)
+
+
+def count(name: str, n: int = 1):
+    p = getattr(_local, "profiler", None)
+    if p is not None:
+        p.count(name, n)
+
+
+def dump_reports(reports: list[dict]) -> str:
+    return json.dumps(reports, ensure_ascii=False, indent=2)
@@ -0,0 +1,153 @@
+"""명세서 파일 읽기 — 앞부분만 먼저 읽어 헤더를 찾고, 필요한 칼럼만 다시 읽음"""
+import csv
+import importlib.util
+from io import BytesIO, StringIO
+from itertools import islice
+
+import pandas as pd
+
+from ledger.config import HEADER_ALIASES
+
+# 헤더 행을 찾는 범위 (process_dataframe과 동일)
+PEEK_ROWS = 10
+
+# pandas read_csv/read_excel이 결측으로 보는 문자열 — 직접 읽을 때도 같게 맞춤
+NA_STRINGS = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+              "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"]
+
+HAS_CALAMINE = (importlib.util.find_spec("python_calamine") is not None
+                and tuple(int(x) for x in pd.__version__.split(".")[:2]) >= (2, 2))
+
+CSV_ENCODINGS = ["utf-8-sig", "cp949"]
+
+
+# ===================== 헤더 탐지 =====================
+
+def find_header_row(df: pd.DataFrame) -> int | None:
+    """처음 10행 내에서 2개 이상 HEADER_ALIASES에 매칭되는 행"""
+    for i in range(min(PEEK_ROWS, len(df))):
+        row_vals = [str(v).strip() for v in df.iloc[i] if pd.notna(v)]
+        matches = sum(1 for v in row_vals if v in HEADER_ALIASES)
+        if matches >= 2:
+            return i
+    return None
+
+
+def map_header(header_row: list[str]) -> list[str]:
+    """헤더명 → 표준 칼럼명 (중복되거나 모르는 헤더는 _orig_ 접두사)"""
+    new_cols = []
+    used = set()
+    for h in header_row:
+        standard = HEADER_ALIASES.get(h)
+        if standard and standard not in used:
+            new_cols.append(standard)
+            used.add(standard)
+        else:
+            new_cols.append(f"_orig_{h}")
+    return new_cols
+
+
+def needed_columns(peek: pd.DataFrame) -> list[int] | None:
+    """미리 읽은 앞부분에서 표준 칼럼으로 매핑되는 칼럼 위치 — 못 찾으면 None (전체 읽기)"""
+    header_idx = find_header_row(peek)
+    if header_idx is None:
+        return None
+    header_row = [str(v).strip() for v in peek.iloc[header_idx]]
+    positions = [pos for pos, col in zip(peek.columns, map_header(header_row))
+                 if not col.startswith("_orig_")]
+    # 표준 칼럼이 2개 미만이면 다시 읽은 쪽에서 헤더를 못 찾으므로 전체 읽기
+    return positions if len(positions) >= 2 else None
+
+
+# ===================== 엑셀 =====================
+
+def _read_xlsx_stream(data: bytes, nrows: int | None = None,
+                      usecols: list[int] | None = None) -> pd.DataFrame:
+    """openpyxl 읽기 전용 모드로 필요한 행/칼럼 범위만 순회"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(BytesIO(data), read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        # 내보내기 프로그램이 dimension을 잘못 적는 경우가 있어 pandas처럼 재계산
+        ws.reset_dimensions()
+        if usecols:
+            lo, hi = min(usecols), max(usecols)
+            rows = ws.iter_rows(min_col=lo + 1, max_col=hi + 1, max_row=nrows, values_only=True)
+            picks = [c - lo for c in usecols]
+            records = [[row[p] if p < len(row) else None for p in picks] for row in rows]
+            columns = list(usecols)
+        else:
+            records = [list(row) for row in ws.iter_rows(max_row=nrows, values_only=True)]
+            columns = list(range(max((len(r) for r in records), default=0)))
+    finally:
+        wb.close()
+
+    df = pd.DataFrame(records, columns=columns, dtype=object)
+    return df.mask(df.isin(NA_STRINGS))
+
+
+def _is_zip(data: bytes) -> bool:
+    return data[:2] == b"PK"
+
+
+def read_excel_columns(data: bytes, nrows: int | None = None,
+                       usecols: list[int] | None = None) -> pd.DataFrame:
+    """엑셀 첫 시트를 header=None으로 읽기 — calamine > openpyxl 스트리밍 > pandas 기본 순"""
+    if HAS_CALAMINE:
+        return pd.read_excel(BytesIO(data), header=None, engine="calamine",
+                             nrows=nrows, usecols=usecols)
+    if _is_zip(data):
+        return _read_xlsx_stream(data, nrows, usecols)
+    # .xls 등 — pandas가 엔진 선택
+    return pd.read_excel(BytesIO(data), header=None, nrows=nrows, usecols=usecols)
+
+
+# ===================== CSV / TSV =====================
+
+def _decode(data: bytes) -> str:
+    for enc in CSV_ENCODINGS:
+        try:
+            return data.decode(enc)
+        except UnicodeDecodeError:
+            continue
+    return data.decode(CSV_ENCODINGS[0], errors="replace")
+
+
+def read_delimited(data: bytes, sep: str) -> pd.DataFrame:
+    """CSV/TSV를 엑셀과 같은 두 단계로 읽기 (값은 모두 문자열)"""
+    text = _decode(data)
+    head = list(islice(csv.reader(StringIO(text), delimiter=sep), PEEK_ROWS))
+    peek = pd.DataFrame(head, dtype=object)
+    peek = peek.mask(peek.isin(NA_STRINGS))
+    width = max((len(r) for r in head), default=0)
+    usecols = needed_columns(peek)
+
+    def parse(n_fields: int) -> pd.DataFrame:
+        return pd.read_csv(StringIO(text), sep=sep, header=None, names=range(n_fields),
+                           usecols=usecols, dtype=str, skip_blank_lines=False)
+
+    try:
+        return parse(width)
+    except pd.errors.ParserError:
+        # 앞부분보다 칸이 많은 행이 있으면 전체 폭을 세고 다시 읽음
+        width = max(len(r) for r in csv.reader(StringIO(text), delimiter=sep))
+        return parse(width)
+
+
+# ===================== 진입점 =====================
+
+def file_kind(name: str) -> str:
+    ext = name.rsplit(".", 1)[-1].lower() if "." in name else ""
+    return ext if ext in ("csv", "tsv") else "excel"
+
+
+def read_statement(data: bytes, name: str = "") -> pd.DataFrame:
+    """명세서 파일 → process_dataframe에 넣을 원본 DataFrame (헤더가 있으면 매핑되는 칼럼만)"""
+    kind = file_kind(name)
+    if kind == "csv":
+        return read_delimited(data, ",")
+    if kind == "tsv":
+        return read_delimited(data, "\t")
+    usecols = needed_columns(read_excel_columns(data, nrows=PEEK_ROWS))
+    return read_excel_columns(data, usecols=usecols)
@@ -0,0 +1,112 @@
+"""명세서 ↔ 결제 알림 대조 — 같은 거래를 짝짓고 한쪽에만 있는 행을 찾음
+
+알림 행을 (부호 있는 금액, 날짜) 순으로 정렬한 키 배열로 만들고 (환불은 음수라 같은 금액의 결제와 짝지어지지 않음), 명세서 행마다 같은 금액·날짜 창 안의
+구간을 searchsorted로 찾는다. 후보는 그 구간 안에서만 생기므로 행 수에 거의 비례한다.
+후보는 가맹점 이름 유사도가 기준 이상인 것만 남기고, 점수 → 날짜 차이 순으로 1:1 배정한다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ledger.dedup import merchant_similarity, normalize_merchant
+from ledger.money import signed_amounts
+from ledger.schema import CATEGORY_BASE, to_category
+
+DEFAULT_WINDOW = 2
+DEFAULT_SIMILARITY = 0.5
+# 키 = 금액 * _SPAN + 날짜(일) — 날짜 창이 다른 금액으로 넘어가지 않도록 충분히 큰 값
+_SPAN = 1 << 20
+_EPOCH = pd.Timestamp("1970-01-01")
+MATCH_COLUMNS = ["stmt_row", "note_row", "days_apart", "score"]
+# 대조가 읽는 칼럼 (+ 행 인덱스) — 이 내용이 같으면 결과도 같음
+RECONCILE_COLUMNS = ["날짜", "결제금액", "할인", "지출 내용"]
+
+
+@dataclass
+class Reconciliation:
+    matched: pd.DataFrame          # stmt_row, note_row, days_apart, score
+    statement_only: pd.Index       # 명세서에만 있는 행
+    notification_only: pd.Index    # 알림에만 있는 행
+
+
+def _keys(df: pd.DataFrame) -> pd.DataFrame:
+    """비교용 칼럼 — 날짜나 금액이 없는 행은 뺌"""
+    dates = pd.to_datetime(df["날짜"], errors="coerce")
+    keys = pd.DataFrame({
+        "day": (dates.dt.normalize() - _EPOCH).dt.days,
+        "amount": signed_amounts(df),
+        "merchant": normalize_merchant(df["지출 내용"]),
+    }, index=df.index)
+    keys = keys[keys["day"].notna() & keys["amount"].notna()].astype({"day": "int64", "amount": "int64"})
+    keys["key"] = keys["amount"] * _SPAN + keys["day"]
+    return keys
+
+
+def candidates(stmt: pd.DataFrame, notes: pd.DataFrame, window: int) -> pd.DataFrame:
+    """같은 금액, 날짜 차이 window일 이내인 (명세서 위치, 알림 위치) 쌍 — 정렬 인덱스 구간 조회"""
+    order = np.argsort(notes["key"].to_numpy(), kind="stable")
+    sorted_keys = notes["key"].to_numpy()[order]
+    skeys = stmt["key"].to_numpy()
+    lo = np.searchsorted(sorted_keys, skeys - window, side="left")
+    hi = np.searchsorted(sorted_keys, skeys + window, side="right")
+    counts = hi - lo
+    s_pos = np.repeat(np.arange(len(stmt)), counts)
+    # 각 명세서 행의 구간 [lo, hi)를 펼침
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    n_pos = order[np.repeat(lo, counts) + offsets]
+    return pd.DataFrame({"s": s_pos, "n": n_pos})
+
+
+def reconcile(statement: pd.DataFrame, notifications: pd.DataFrame,
+              window: int = DEFAULT_WINDOW, min_similarity: float = DEFAULT_SIMILARITY) -> Reconciliation:
+    """명세서 행과 알림 행 짝짓기 — 금액이 같고 날짜가 window일 이내, 가맹점 유사도 min_similarity 이상"""
+    stmt, notes = _keys(statement), _keys(notifications)
+    matched = pd.DataFrame(columns=MATCH_COLUMNS)
+    if len(stmt) and len(notes):
+        cand = candidates(stmt, notes, window)
+        if len(cand):
+            s_merchant = stmt["merchant"].to_numpy()[cand["s"]]
+            n_merchant = notes["merchant"].to_numpy()[cand["n"]]
+            cand["days_apart"] = np.abs(stmt["day"].to_numpy()[cand["s"]] - notes["day"].to_numpy()[cand["n"]])
+            # 유사도는 고유한 이름 쌍마다 한 번만
+            names = pd.DataFrame({"a": s_merchant, "b": n_merchant})
+            codes, uniques = pd.factorize(pd.MultiIndex.from_frame(names))
+            scores = np.array([merchant_similarity(a, b) for a, b in uniques])
+            cand["score"] = scores[codes]
+            cand = cand[cand["score"] >= min_similarity]
+            cand = cand.sort_values(["score", "days_apart", "s", "n"],
+                                    ascending=[False, True, True, True], kind="stable")
+            used_s, used_n, out = set(), set(), []
+            for s, n, days, score in zip(cand["s"], cand["n"], cand["days_apart"], cand["score"]):
+                if s in used_s or n in used_n:
+                    continue
+                used_s.add(s)
+                used_n.add(n)
+                out.append((stmt.index[s], notes.index[n], int(days), float(score)))
+            matched = pd.DataFrame(out, columns=MATCH_COLUMNS)
+    return Reconciliation(
+        matched=matched,
+        statement_only=statement.index.difference(matched["stmt_row"], sort=False),
+        notification_only=notifications.index.difference(matched["note_row"], sort=False),
+    )
+
+
+def copy_categories(src: pd.DataFrame, dst: pd.DataFrame, pairs: pd.DataFrame,
+                    src_col: str, dst_col: str, overwrite: bool = False) -> pd.DataFrame:
+    """짝지은 행의 대분류/소분류를 src → dst로 복사한 새 표 (overwrite가 아니면 dst가 빈 칸인 행만)"""
+    if pairs.empty:
+        return dst
+    values = src.loc[pairs[src_col], ["대분류", "소분류"]].astype(object).to_numpy()
+    target = pd.Index(pairs[dst_col])
+    if not overwrite:
+        blank = dst.loc[target, "대분류"].astype(object).fillna("").astype(str).str.strip().eq("").to_numpy()
+        values, target = values[blank], target[blank]
+    if not len(target):
+        return dst
+    dst = dst.copy()
+    for i, col in enumerate(["대분류", "소분류"]):
+        column = dst[col].astype(object)
+        column.loc[target] = values[:, i]
+        dst[col] = to_category(column, CATEGORY_BASE[col])
+    return dst
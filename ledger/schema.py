@@ -0,0 +1,78 @@
+"""가계부 표 dtype 스키마 — 분류/결제수단은 categorical, 금액은 Int64(원), 날짜는 datetime64"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+from ledger.config import ALL_MAJOR, ALL_MINOR, DATA_COLUMNS, PAYMENT_METHODS
+
+MONEY_COLUMNS = ["결제금액", "할인", "실지출"]
+TEXT_COLUMNS = ["지출 내용", "비고"]
+# 칼럼 → 기본 범주 (표에 다른 값이 있으면 뒤에 덧붙임 — 값을 버리지 않음)
+CATEGORY_BASE = {
+    "결제수단": PAYMENT_METHODS,
+    "대분류": [""] + ALL_MAJOR,
+    "소분류": [""] + ALL_MINOR,
+}
+
+
+def to_won(values: pd.Series) -> pd.Series:
+    """금액 → 원 단위 nullable 정수"""
+    if isinstance(values.dtype, pd.Int64Dtype):
+        return values
+    n = pd.to_numeric(values, errors="coerce").astype("float64")
+    return n.where(np.isfinite(n)).round().astype("Int64")
+
+
+def to_category(values: pd.Series, base: list[str]) -> pd.Series:
+    """문자열 categorical — 기본 범주 + 표에만 있는 값(정렬)"""
+    if isinstance(values.dtype, CategoricalDtype):
+        observed = [str(v) for v in values.cat.categories]
+        values = values.astype(object)
+    else:
+        values = values.astype(object)
+        mask = values.notna()
+        values[mask] = values[mask].astype(str)
+        observed = values[mask].unique().tolist()
+    known = set(base)
+    extra = sorted({v for v in observed if v not in known})
+    return values.astype(CategoricalDtype(list(base) + extra))
+
+
+def enforce_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """가계부 표를 스키마 dtype으로 변환 (없는 칼럼은 빈 칼럼으로 추가, 칼럼 순서 정렬)"""
+    df = df.copy()
+    for col in DATA_COLUMNS:
+        if col not in df.columns:
+            df[col] = pd.Series(index=df.index, dtype=object)
+    df["날짜"] = pd.to_datetime(df["날짜"], errors="coerce")
+    for col in MONEY_COLUMNS:
+        df[col] = to_won(df[col])
+    for col, base in CATEGORY_BASE.items():
+        df[col] = to_category(df[col], base)
+    for col in TEXT_COLUMNS:
+        df[col] = df[col].astype(object)
+    extras = [c for c in df.columns if c not in DATA_COLUMNS]
+    return df[DATA_COLUMNS + extras]
+
+
+def empty_ledger() -> pd.DataFrame:
+    return enforce_schema(pd.DataFrame(columns=DATA_COLUMNS))
+
+
+def concat_ledgers(frames: list[pd.DataFrame], **kwargs) -> pd.DataFrame:
+    """여러 표 합치기 — 범주가 달라 object로 풀린 칼럼을 다시 스키마로"""
+    frames = [f for f in frames if len(f)]
+    if not frames:
+        return empty_ledger()
+    return enforce_schema(pd.concat(frames, **kwargs))
+
+
+def columns_fingerprint(df: pd.DataFrame, columns: list[str], index: bool = False) -> str:
+    """칼럼 값(과 인덱스) 기준 내용 해시 — 편집기가 리런마다 새 객체를 돌려줘도 내용이 같으면 같은 값"""
+    cols = [c for c in columns if c in df.columns]
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(cols).encode())
+    h.update(pd.util.hash_pandas_object(df[cols], index=index).to_numpy().tobytes())
+    return h.hexdigest()
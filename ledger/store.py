@@ -0,0 +1,312 @@
+"""가계부 저장소 — SQLite(WAL)에 (연도, 월)별 지출/아이폰 내역과 연도별 수입을 보관"""
+import sqlite3
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ledger.aggregate import MonthPartial, partial_from_groups
+from ledger.config import DATA_COLUMNS, INCOME_CATEGORIES, MONTHS
+from ledger.schema import concat_ledgers, enforce_schema
+
+# 표준 칼럼명 → SQL 칼럼명
+SQL_COLUMNS = {
+    "날짜": "date", "결제수단": "payment", "대분류": "major", "소분류": "minor",
+    "지출 내용": "item", "결제금액": "amount", "할인": "discount", "실지출": "spend", "비고": "note",
+}
+FROM_SQL = {v: k for k, v in SQL_COLUMNS.items()}
+MONEY_SQL = {"amount", "discount", "spend"}
+INCOME_SQL = [f"m{i}" for i in range(1, 13)]
+# 날짜를 못 읽은 행을 보관하는 파티션 (연도 0) — 날짜를 입력하면 해당 (연도, 월)로 옮김
+UNDATED = (0, 0)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS ledger (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    pos INTEGER NOT NULL,
+    date TEXT, payment TEXT, major TEXT, minor TEXT, item TEXT,
+    amount REAL, discount REAL, spend REAL, note TEXT
+);
+CREATE TABLE IF NOT EXISTS income_year (
+    year INTEGER NOT NULL,
+    pos INTEGER NOT NULL,
+    category TEXT,
+    {", ".join(f"{c} REAL" for c in INCOME_SQL)},
+    PRIMARY KEY (year, pos)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+# 연도 칼럼이 생긴 뒤에 만드는 인덱스 (예전 저장소는 옮긴 다음)
+INDEXES = """
+CREATE INDEX IF NOT EXISTS ledger_period ON ledger(kind, year, month, pos);
+CREATE INDEX IF NOT EXISTS ledger_date ON ledger(date);
+CREATE INDEX IF NOT EXISTS ledger_category ON ledger(major, minor);
+"""
+
+
+def partials_sql(n_months: int) -> str:
+    """한 해의 달 n_months개 부분합 쿼리 — 인자는 (kind, year, *months)"""
+    return ("SELECT month, major, minor, substr(date, 1, 10) AS day, "
+            "SUM(amount) AS sum, COUNT(amount) AS count, COUNT(*) AS rows FROM ledger "
+            f"WHERE kind = ? AND year = ? AND month IN ({', '.join('?' * n_months)}) "
+            "GROUP BY month, major, minor, day")
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """행별 내용 해시 — 저장 후 바뀐 행을 찾는 데 씀"""
+    return pd.util.hash_pandas_object(df.reindex(columns=DATA_COLUMNS), index=False).to_numpy()
+
+
+def to_sql_records(df: pd.DataFrame) -> pd.DataFrame:
+    """DataFrame → SQL 칼럼명/파이썬 값 (결측은 None)"""
+    out = {}
+    for kor, col in SQL_COLUMNS.items():
+        values = df[kor] if kor in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if col == "date":
+            d = pd.to_datetime(values, errors="coerce")
+            out[col] = d.dt.strftime("%Y-%m-%d %H:%M:%S").astype(object).where(d.notna(), None)
+        elif col in MONEY_SQL:
+            n = pd.to_numeric(values, errors="coerce")
+            out[col] = n.astype(object).where(n.notna(), None)
+        else:
+            out[col] = values.astype(object).where(values.notna(), None)
+    return pd.DataFrame(out, index=df.index)
+
+
+def _migrate_single_year(conn: sqlite3.Connection):
+    """연도 없이 월(1~12)만 있던 저장소 → (연도, 월) 파티션
+
+    예전 데이터는 한 해치를 월 칸에 나눠 둔 것이라, 날짜에 가장 많이 나오는 연도
+    (날짜가 하나도 없으면 올해)를 모든 행과 수입 표의 연도로 쓴다.
+    """
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(ledger)")}
+    if "year" in cols:
+        return
+    years = Counter(int(r[0]) for r in conn.execute(
+        "SELECT substr(date, 1, 4) FROM ledger WHERE date GLOB '[0-9][0-9][0-9][0-9]-*'"))
+    year = years.most_common(1)[0][0] if years else date.today().year
+    conn.execute(f"ALTER TABLE ledger ADD COLUMN year INTEGER NOT NULL DEFAULT {int(year)}")
+    conn.execute("DROP INDEX IF EXISTS ledger_partition")
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'income'").fetchone():
+        conn.execute(f"INSERT OR IGNORE INTO income_year (year, pos, category, {', '.join(INCOME_SQL)}) "
+                     f"SELECT ?, pos, category, {', '.join(INCOME_SQL)} FROM income", (year,))
+        conn.execute("DROP TABLE income")
+
+
+class LedgerStore:
+    """(kind, 연도, 월) 파티션 단위로 읽고, 저장은 바뀐 행만 UPDATE/INSERT/DELETE
+
+    행 id는 DataFrame 인덱스로 들고 다닌다. 저장소에서 읽은 표는 인덱스가 곧 id이고,
+    새 행은 append_rows로 음수 임시 인덱스를 붙여 INSERT 한 뒤 id로 인덱스를 바꾼다.
+    행이 있는 파티션에는 이 객체로 읽은(또는 저장한) 표만 저장할 수 있다 — 0부터 세는
+    기본 인덱스 표를 넘겨 기존 행을 덮어쓰거나 지우는 일을 막으려고 그 밖의 라벨은 거절한다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 파티션 → 마지막으로 읽거나 쓴 상태 (id → 해시, 위치)
+        self._snapshots: dict[tuple[str, int, int], pd.DataFrame] = {}
+        # 파티션 → 이 객체로 저장한 횟수 (내보내기 캐시 키 등, 표를 읽지 않고 바뀜 여부 확인)
+        self._revisions: dict[tuple[str, int, int], int] = {}
+        self._income_hash: dict[int, int] = {}
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            _migrate_single_year(conn)
+            conn.executescript(INDEXES)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ===================== 지출/아이폰 내역 =====================
+
+    def load(self, kind: str, year: int, month: int) -> pd.DataFrame:
+        """파티션 하나 읽기 — 인덱스는 행 id"""
+        cols = ", ".join(SQL_COLUMNS.values())
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                f"SELECT id, {cols} FROM ledger WHERE kind = ? AND year = ? AND month = ? ORDER BY pos, id",
+                conn, params=(kind, year, month), index_col="id")
+        df = enforce_schema(df.rename(columns=FROM_SQL)[DATA_COLUMNS])
+        df.index.name = None
+        self._remember(kind, year, month, df)
+        return df
+
+    def _remember(self, kind: str, year: int, month: int, df: pd.DataFrame):
+        self._snapshots[(kind, year, month)] = pd.DataFrame(
+            {"h": row_hashes(df), "pos": np.arange(len(df))}, index=df.index.astype("int64"))
+
+    def forget(self, kind: str, year: int, month: int):
+        """메모리에서 내린 파티션의 스냅샷 버리기 (다시 읽으면 새로 만듦)"""
+        self._snapshots.pop((kind, year, month), None)
+
+    def _snapshot(self, conn, kind: str, year: int, month: int) -> pd.DataFrame:
+        snap = self._snapshots.get((kind, year, month))
+        if snap is None:
+            # 이 객체로 읽은 적 없는 파티션 — 행이 있으면 어느 행을 보고 고친 표인지 알 수 없음
+            (n,) = conn.execute("SELECT COUNT(*) FROM ledger WHERE kind = ? AND year = ? AND month = ?",
+                                (kind, year, month)).fetchone()
+            if n:
+                raise ValueError(f"읽지 않은 파티션에는 저장할 수 없습니다 ({kind} {year}-{month}) — load() 먼저")
+            snap = pd.DataFrame({"h": pd.Series(dtype="uint64"), "pos": pd.Series(dtype="int64")},
+                                index=pd.Index([], dtype="int64"))
+        return snap
+
+    def save(self, kind: str, year: int, month: int, df: pd.DataFrame) -> pd.DataFrame:
+        """바뀐 행만 반영 — 새 행이 있으면 id로 인덱스를 바꾼 새 DataFrame, 아니면 df 그대로
+
+        행이 있는 파티션인데 이 객체로 읽지 않았거나, 음수(임시)도 저장된 id도 아닌 라벨이
+        있으면 ValueError (아무것도 쓰지 않음).
+        """
+        hashes = row_hashes(df)
+        ids = pd.to_numeric(pd.Series(df.index), errors="coerce")
+        with self._connect() as conn:
+            snap = self._snapshot(conn, kind, year, month)
+            known = (ids.isin(snap.index) & ~ids.duplicated()).to_numpy()
+            foreign = ~known & (ids >= 0).to_numpy()
+            if len(snap) and foreign.any():
+                raise ValueError(f"저장소에서 오지 않은 행 라벨 {ids[foreign].head(3).tolist()} "
+                                 f"({kind} {year}-{month}) — 새 행은 append_rows로 붙이세요")
+            pos = np.arange(len(df))
+
+            known_ids = ids[known].astype("int64").to_numpy()
+            prev = snap.reindex(known_ids)
+            changed = (prev["h"].to_numpy() != hashes[known]) | (prev["pos"].to_numpy() != pos[known])
+            deleted = snap.index.difference(known_ids)
+            if not changed.any() and known.all() and deleted.empty:
+                return df
+
+            records = list(to_sql_records(df).itertuples(index=False, name=None))
+            cols = list(SQL_COLUMNS.values())
+            conn.executemany("DELETE FROM ledger WHERE id = ? AND kind = ? AND year = ? AND month = ?",
+                             [(int(i), kind, year, month) for i in deleted])
+            assignments = ", ".join(f"{c} = ?" for c in cols)
+            upd = pos[known][changed]
+            conn.executemany(
+                f"UPDATE ledger SET pos = ?, {assignments} WHERE id = ? AND kind = ? AND year = ? AND month = ?",
+                [(int(p), *records[p], int(i), kind, year, month)
+                 for p, i in zip(upd, known_ids[changed])])
+            new_index = ids.to_numpy(dtype=object)
+            insert_sql = (f"INSERT INTO ledger (kind, year, month, pos, {', '.join(cols)}) "
+                          f"VALUES (?, ?, ?, ?, {', '.join('?' * len(cols))})")
+            for p in pos[~known]:
+                cur = conn.execute(insert_sql, (kind, year, month, int(p), *records[p]))
+                new_index[p] = cur.lastrowid
+
+        if not known.all():
+            df = df.copy()
+            df.index = pd.Index(new_index.astype("int64"))
+        self._remember(kind, year, month, df)
+        key = (kind, year, month)
+        self._revisions[key] = self._revisions.get(key, 0) + 1
+        return df
+
+    def revision(self, kind: str, year: int, month: int) -> int:
+        return self._revisions.get((kind, year, month), 0)
+
+    # ===================== 기간 질의 =====================
+
+    def years(self) -> list[int]:
+        """데이터(지출/아이폰/수입)가 있는 연도 (날짜 없는 행 보관 파티션 제외)"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT DISTINCT year FROM ledger WHERE year > 0 "
+                                "UNION SELECT DISTINCT year FROM income_year")
+            return sorted(int(r[0]) for r in rows)
+
+    def partials(self, kind: str, periods: list[tuple[int, int]]) -> dict[tuple[int, int], MonthPartial]:
+        """파티션별 부분합을 표를 읽지 않고 GROUP BY로 — 행이 없는 파티션은 빈 부분합"""
+        out = {}
+        by_year: dict[int, list[int]] = {}
+        for y, m in sorted(set(periods)):
+            by_year.setdefault(y, []).append(m)
+        with self._connect() as conn:
+            # 연도마다 한 번 — (kind, year, month) 인덱스로 그 달들의 행만 찾음
+            for y, months in by_year.items():
+                groups = pd.read_sql_query(partials_sql(len(months)), conn, params=(kind, y, *months))
+                groups["day"] = pd.to_datetime(groups["day"], errors="coerce")
+                for m, g in groups.groupby("month"):
+                    out[(y, int(m))] = partial_from_groups(g)
+        empty = partial_from_groups(pd.DataFrame(
+            {"major": [], "minor": [], "day": pd.Series(dtype="datetime64[ns]"),
+             "sum": [], "count": [], "rows": []}))
+        return {p: out.get(p, empty) for p in periods}
+
+    # ===================== 수입 =====================
+
+    def load_income(self, year: int) -> pd.DataFrame | None:
+        """한 해의 수입 표 — 저장된 적이 없으면 None"""
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                f"SELECT category, {', '.join(INCOME_SQL)} FROM income_year WHERE year = ? ORDER BY pos",
+                conn, params=(year,))
+        if df.empty:
+            return None
+        df.columns = ["수입 카테고리"] + MONTHS
+        df[MONTHS] = df[MONTHS].fillna(0)
+        self._income_hash[year] = int(pd.util.hash_pandas_object(df, index=False).sum())
+        return df
+
+    def save_income(self, year: int, df: pd.DataFrame):
+        """수입 표 저장 — 작아서 바뀌었으면 그 해 것을 통째로 다시 씀"""
+        h = int(pd.util.hash_pandas_object(df, index=False).sum())
+        if h == self._income_hash.get(year):
+            return
+        rows = []
+        for p, row in enumerate(df.reindex(columns=["수입 카테고리"] + MONTHS).itertuples(index=False)):
+            amounts = pd.to_numeric(pd.Series(row[1:]), errors="coerce")
+            rows.append((year, p, row[0], *amounts.astype(object).where(amounts.notna(), None)))
+        with self._connect() as conn:
+            conn.execute("DELETE FROM income_year WHERE year = ?", (year,))
+            conn.executemany(
+                f"INSERT INTO income_year (year, pos, category, {', '.join(INCOME_SQL)}) "
+                f"VALUES ({', '.join('?' * (len(INCOME_SQL) + 3))})", rows)
+        self._income_hash[year] = h
+
+    # ===================== 기타 상태 =====================
+
+    def get_meta(self, key: str, default: str | None = None) -> str | None:
+        """키-값 상태 (메시지 가져오기의 마지막 rowid 등)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def set_meta(self, key: str, value: str):
+        with self._connect() as conn:
+            conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                         "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, value))
+
+
+def append_rows(df: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """저장소 표 뒤에 새 행 붙이기 — 새 행은 음수 임시 인덱스라 기존 id와 겹치지 않고 저장 때 INSERT 됨
+
+    아직 저장 안 한 임시 행이 df에 있으면 그보다 작은 라벨부터 씀.
+    """
+    ids = pd.to_numeric(pd.Series(df.index, dtype=object), errors="coerce")
+    low = int(min(ids.min(), 0)) if ids.notna().any() else 0
+    new = new.copy()
+    new.index = pd.RangeIndex(low - len(new), low)
+    return concat_ledgers([df, new])
+
+
+def default_income() -> pd.DataFrame:
+    data = {"수입 카테고리": INCOME_CATEGORIES}
+    for m_name in MONTHS:
+        data[m_name] = [0] * len(INCOME_CATEGORIES)
+    return pd.DataFrame(data)
@@ -0,0 +1,38 @@
+"""기간 집계 — 파티션 부분합 캐시와 기간 요약"""
+import pandas as pd
+
+from ledger.aggregate import PartitionAggregates, compare_by_major, month_partial
+from ledger.schema import enforce_schema
+
+
+def ledger(rows) -> pd.DataFrame:
+    return enforce_schema(pd.DataFrame(rows, columns=["날짜", "대분류", "소분류", "지출 내용", "결제금액"]))
+
+
+MARCH = ledger([
+    ("2025-03-02", "식비", "차/커피", "스타벅스", 5600),
+    ("2025-03-05", "교통비", "택시비", "카카오택시", 12000),
+])
+
+
+def test_update_keys_on_content_not_object():
+    agg = PartitionAggregates()
+    first = agg.update((2025, 3), MARCH)
+    # 편집기가 돌려준 같은 내용의 새 객체, 집계와 무관한 칼럼만 바뀐 표 → 다시 집계하지 않음
+    assert agg.update((2025, 3), MARCH.copy()) is first
+    assert agg.update((2025, 3), MARCH.assign(비고="메모")) is first
+    changed = MARCH.copy()
+    changed.loc[0, "결제금액"] = 6000
+    assert agg.update((2025, 3), changed).total == 18000
+
+
+def test_summary_over_periods():
+    agg = PartitionAggregates()
+    agg.update((2025, 3), MARCH)
+    agg.put((2024, 3), month_partial(ledger([("2024-03-01", "식비", "식재료", "마트", 10000)])))
+    cur, prev = agg.summary([(2025, 3)]), agg.summary([(2024, 3)])
+    assert (cur.total, prev.total) == (17600, 10000)
+    assert agg.summary().monthly.index.tolist() == [(2024, 3), (2025, 3)]
+    compare = compare_by_major(cur, prev)
+    assert compare.loc["식비", "증감"] == -4400
+    assert compare.loc["교통비", "이전"] == 0
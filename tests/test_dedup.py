@@ -0,0 +1,70 @@
+"""중복 거래 찾기 — 카드 명세서와 은행 내역이 겹치는 경우"""
+import pandas as pd
+
+from ledger.dedup import find_duplicates
+from ledger.money import normalize_amounts
+
+
+def ledger(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["날짜", "지출 내용", "결제금액", "결제수단"])
+
+
+CARD = ledger([
+    ("2025-03-02", "스타벅스 강남점", 5600, "신한카드"),
+    ("2025-03-05", "(주)쿠팡", 32000, "신한카드"),
+    ("2025-03-09", "GS25 역삼점", 4300, "신한카드"),
+])
+# 같은 결제의 은행 출금 — 결제수단이 비어 있고, 하루 늦고, 가맹점명이 잘림
+BANK = ledger([
+    ("2025-03-03", "스타벅스", 5600, ""),
+    ("2025-03-05", "쿠팡", 32000, ""),
+    ("2025-03-20", "월세", 500000, ""),
+])
+
+
+def test_exact_ignores_card_vs_bank():
+    assert find_duplicates([CARD, BANK]).empty
+
+
+def test_tolerant_matches_card_vs_bank():
+    pairs = find_duplicates([CARD, BANK], tolerant=True)
+    assert list(zip(pairs["row"], pairs["ref_row"])) == [(0, 0), (1, 1)]
+    assert set(pairs["match"]) == {"fuzzy"}
+    assert list(pairs["days_apart"]) == [1, 0]
+
+
+def test_tolerant_matches_different_payment_names():
+    bank = BANK.assign(결제수단="국민은행")
+    pairs = find_duplicates([CARD, bank], tolerant=True)
+    assert list(pairs["row"]) == [0, 1]
+
+
+def test_tolerant_respects_day_window_and_amount():
+    far = ledger([("2025-03-05", "스타벅스", 5600, ""), ("2025-03-05", "쿠팡", 32001, "")])
+    assert find_duplicates([CARD, far], tolerant=True).empty
+
+
+def test_tolerant_prefers_same_payment():
+    first = ledger([
+        ("2025-03-02", "스타벅스", 5600, "국민카드"),
+        ("2025-03-02", "스타벅스", 5600, "신한카드"),
+    ])
+    second = ledger([("2025-03-02", "스타벅스 강남", 5600, "신한카드")])
+    pairs = find_duplicates([first, second], tolerant=True)
+    assert list(pairs["ref_row"]) == [1]
+
+
+def test_refund_is_not_a_duplicate_of_purchase():
+    # 환불은 normalize_amounts를 거쳐 결제금액 = 할인 = 5600 으로 기록됨
+    first = normalize_amounts(ledger([("2025-03-02", "스타벅스", 5600, "신한카드")]))
+    second = normalize_amounts(ledger([
+        ("2025-03-02", "스타벅스", 5600, "신한카드"),
+        ("2025-03-02", "스타벅스", -5600, "신한카드"),
+    ]))
+    refund_only = second.iloc[[1]]
+    for tolerant in (False, True):
+        assert list(find_duplicates([first, second], tolerant=tolerant)["row"]) == [0]
+        assert find_duplicates([first, refund_only], tolerant=tolerant).empty
+    # 같은 환불이 두 명세서에 있으면 그건 중복
+    pairs = find_duplicates([second, second.copy()])
+    assert list(pairs["row"]) == [0, 1]
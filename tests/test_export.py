@@ -0,0 +1,25 @@
+"""엑셀 내보내기 캐시 — 해시 메모가 지나간 표를 붙잡지 않는지"""
+import gc
+
+import pandas as pd
+
+from ledger.export import ExportCache
+
+
+def test_fingerprint_memo_does_not_keep_frames():
+    cache = ExportCache()
+    first = pd.DataFrame({"결제금액": [5600, 12000]})
+    fp = cache.fingerprint({"3월": first})
+    for _ in range(100):   # 편집기가 리런마다 같은 내용의 새 표를 돌려주는 경우
+        assert cache.fingerprint({"3월": first.copy()}) == fp
+    gc.collect()
+    assert len(cache._fingerprints) == 1
+
+
+def test_fingerprint_follows_content():
+    cache = ExportCache()
+    df = pd.DataFrame({"결제금액": [5600]})
+    fp = cache.fingerprint({"3월": df})
+    assert cache.fingerprint({"3월": df}) == fp
+    assert cache.fingerprint({"4월": df}) != fp
+    assert cache.fingerprint({"3월": df.assign(결제금액=5700)}) != fp
@@ -0,0 +1,77 @@
+"""월 표 페이지 보기 — 거르기와 편집한 페이지 되돌려 합치기"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from ledger.paging import TableFilter, TableIndex, merge_page, page_rows
+from ledger.schema import enforce_schema
+from ledger.store import append_rows
+
+
+def ledger(rows, index=None) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=["날짜", "대분류", "지출 내용", "결제금액"], index=index)
+    return enforce_schema(df)
+
+
+# 저장소에서 읽은 표처럼 인덱스가 행 id
+FULL = ledger([
+    ("2025-03-01", "식비", "스타벅스", 5600),
+    ("2025-03-02", "교통비", "택시", 12000),
+    ("2025-03-03", "식비", "마트", 43000),
+    ("2025-03-04", "식비", "스타벅스", 4800),
+], index=[11, 12, 13, 14])
+
+
+def test_select_and_page():
+    index = TableIndex(FULL)
+    pos = index.select(TableFilter(majors=("식비",), text="스타"))
+    assert FULL.index[pos].tolist() == [11, 14]
+    pos = index.select(TableFilter(start=date(2025, 3, 2), end=date(2025, 3, 3)))
+    assert FULL.index[pos].tolist() == [12, 13]
+    assert page_rows(np.arange(4), 2, 3).tolist() == [3]
+
+
+def test_unchanged_page_returns_full():
+    page = FULL.iloc[[1, 2]]
+    assert merge_page(FULL, page, page.copy()) is FULL
+
+
+def test_edit_and_delete_by_row_id():
+    page = FULL.iloc[[1, 2]]
+    edited = page.drop(index=12)
+    edited.loc[13, "결제금액"] = 40000
+    out = merge_page(FULL, page, edited)
+    assert out.index.tolist() == [11, 13, 14]
+    assert out.loc[13, "결제금액"] == 40000
+    assert out.loc[14, "결제금액"] == 4800
+
+
+def test_added_row_label_colliding_with_off_page_id():
+    # 편집기가 새 행에 붙인 라벨이 페이지 밖 행의 id와 같아도 새 행으로 붙고, 그 행은 그대로
+    page = FULL.iloc[[0, 1]]
+    added = ledger([("2025-03-05", "식비", "빵집", 3000)], index=[14])
+    out = merge_page(FULL, page, pd.concat([page, added]))
+    assert out.index.is_unique
+    assert len(out) == 5
+    assert out.loc[14, "지출 내용"] == "스타벅스"
+    assert out.loc[out.index < 0, "지출 내용"].tolist() == ["빵집"]
+
+
+def test_added_rows_without_labels():
+    page = FULL.iloc[[0]]
+    added = ledger([("2025-03-05", "식비", "빵집", 3000), ("2025-03-06", "식비", "떡집", 2000)],
+                   index=[np.nan, np.nan])
+    out = merge_page(FULL, page, pd.concat([page, added]))
+    assert out.index.is_unique
+    assert out["지출 내용"].tolist()[-2:] == ["빵집", "떡집"]
+
+
+def test_added_rows_with_unsaved_rows_in_full():
+    # 저장 전이라 음수 임시 라벨이 남은 표에 또 붙여도 라벨이 겹치지 않음
+    full = append_rows(FULL, ledger([("2025-03-05", "식비", "빵집", 3000)]))
+    page = full.iloc[[0]]
+    added = ledger([("2025-03-06", "식비", "떡집", 2000)], index=[99])
+    out = merge_page(full, page, pd.concat([page, added]))
+    assert out.index.is_unique
+    assert out.loc[out.index < 0, "지출 내용"].tolist() == ["빵집", "떡집"]
@@ -0,0 +1,31 @@
+"""명세서 ↔ 결제 알림 대조 — 결제와 같은 금액의 환불(취소)"""
+import pandas as pd
+
+from ledger.money import normalize_amounts
+from ledger.reconcile import reconcile
+
+
+def ledger(rows) -> pd.DataFrame:
+    return normalize_amounts(pd.DataFrame(rows, columns=["날짜", "지출 내용", "결제금액"]))
+
+
+def test_matches_purchase_and_refund_separately():
+    stmt = ledger([
+        ("2025-03-02", "스타벅스 강남점", 5600),
+        ("2025-03-02", "스타벅스 강남점", -5600),    # 같은 날 취소
+    ])
+    notes = ledger([
+        ("2025-03-02", "스타벅스", -5600),           # 취소 알림
+        ("2025-03-02", "스타벅스", 5600),
+    ])
+    result = reconcile(stmt, notes)
+    assert sorted(zip(result.matched["stmt_row"], result.matched["note_row"])) == [(0, 1), (1, 0)]
+
+
+def test_refund_is_not_paired_with_purchase():
+    stmt = ledger([("2025-03-02", "스타벅스 강남점", -5600)])
+    notes = ledger([("2025-03-02", "스타벅스", 5600)])
+    result = reconcile(stmt, notes)
+    assert result.matched.empty
+    assert list(result.statement_only) == [0]
+    assert list(result.notification_only) == [0]
@@ -0,0 +1,137 @@
+"""LedgerStore — 바뀐 행만 저장, 예전(연도 없는) 저장소 옮기기, 파티션 부분합"""
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from ledger.aggregate import month_partial
+from ledger.config import MONTHS
+from ledger.schema import enforce_schema
+from ledger.store import INCOME_SQL, LedgerStore, append_rows, default_income, partials_sql, row_hashes
+
+
+def ledger(rows) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=["날짜", "대분류", "소분류", "지출 내용", "결제금액"])
+    return enforce_schema(df)
+
+
+MARCH = [
+    ("2025-03-02", "식비", "차/커피", "스타벅스", 5600),
+    ("2025-03-05", "생활용품비", "생활용품", "쿠팡", 32000),
+    ("2025-03-05", None, None, "미분류", None),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LedgerStore(tmp_path / "ledger.db")
+
+
+def test_save_load_round_trip(store):
+    saved = store.save("month", 2025, 3, ledger(MARCH))
+    assert (saved.index > 0).all()          # 새 행은 INSERT 후 id가 인덱스가 됨
+    loaded = store.load("month", 2025, 3)
+    assert list(loaded.index) == list(saved.index)
+    assert (row_hashes(loaded) == row_hashes(saved)).all()   # 빈 칸은 None/NaN 어느 쪽이든 같은 해시
+    assert store.save("month", 2025, 3, loaded) is loaded
+    assert store.load("month", 2024, 3).empty
+    assert store.load("iphone", 2025, 3).empty
+    assert store.years() == [2025]
+
+
+def test_save_only_writes_changes(store):
+    saved = store.save("month", 2025, 3, ledger(MARCH))
+    assert store.save("month", 2025, 3, saved) is saved
+    assert store.revision("month", 2025, 3) == 1
+
+    edited = saved.copy()
+    edited.loc[edited.index[0], "비고"] = "친구 것 포함"
+    edited = append_rows(edited.drop(index=edited.index[1]), ledger([MARCH[1]]))
+    out = store.save("month", 2025, 3, edited)
+    assert store.revision("month", 2025, 3) == 2
+    assert list(out.index[:2]) == list(saved.index[[0, 2]])
+    assert out.index[2] not in saved.index
+
+    # 새 저장소 객체(스냅샷 없음)로 다시 읽어도 같은 표
+    fresh = LedgerStore(store.path).load("month", 2025, 3)
+    assert list(fresh.index) == list(out.index)
+    assert fresh["비고"].iat[0] == "친구 것 포함"
+    assert fresh["지출 내용"].tolist() == ["스타벅스", "미분류", "쿠팡"]
+
+
+def test_migrates_single_year_store(tmp_path):
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(f"""
+        CREATE TABLE ledger (id INTEGER PRIMARY KEY, kind TEXT NOT NULL, month INTEGER NOT NULL,
+            pos INTEGER NOT NULL, date TEXT, payment TEXT, major TEXT, minor TEXT, item TEXT,
+            amount REAL, discount REAL, spend REAL, note TEXT);
+        CREATE INDEX ledger_partition ON ledger(kind, month, pos);
+        CREATE TABLE income (pos INTEGER PRIMARY KEY, category TEXT,
+            {", ".join(f"{c} REAL" for c in INCOME_SQL)});
+    """)
+    conn.executemany("INSERT INTO ledger (kind, month, pos, date, item, amount) VALUES (?, ?, ?, ?, ?, ?)", [
+        ("month", 1, 0, "2024-01-03 00:00:00", "스타벅스", 5600),
+        ("month", 1, 1, "2024-01-09 00:00:00", "쿠팡", 32000),
+        ("month", 2, 0, None, "날짜 없음", 1000),
+        ("iphone", 1, 0, "2024-01-03 00:00:00", "스타벅스", 5600),
+    ])
+    conn.execute("INSERT INTO income (pos, category, m1) VALUES (0, '급여', 3000000)")
+    conn.commit()
+    conn.close()
+
+    store = LedgerStore(path)
+    assert store.years() == [2024]
+    assert store.load("month", 2024, 1)["지출 내용"].tolist() == ["스타벅스", "쿠팡"]
+    assert store.load("month", 2024, 2)["지출 내용"].tolist() == ["날짜 없음"]
+    assert len(store.load("iphone", 2024, 1)) == 1
+    income = store.load_income(2024)
+    assert income["수입 카테고리"].tolist() == ["급여"]
+    assert income[MONTHS[0]].iat[0] == 3000000
+
+    # 두 번 열어도 그대로
+    assert LedgerStore(path).load("month", 2024, 1)["지출 내용"].tolist() == ["스타벅스", "쿠팡"]
+
+
+def test_income_per_year(store):
+    assert store.load_income(2025) is None
+    income = default_income()
+    income.loc[0, MONTHS[2]] = 100
+    store.save_income(2025, income)
+    assert store.load_income(2025)[MONTHS[2]].iat[0] == 100
+    assert store.load_income(2024) is None
+
+
+def test_partials_match_month_partial(store):
+    saved = store.save("month", 2025, 3, ledger(MARCH))
+    store.save("month", 2024, 3, ledger([("2024-03-01", "식비", "식재료", "마트", 10000)]))
+    parts = store.partials("month", [(2025, 3), (2024, 3), (2025, 4)])
+
+    expected = month_partial(saved)
+    got = parts[(2025, 3)]
+    assert (got.rows, got.total, got.n_amount) == (expected.rows, expected.total, expected.n_amount)
+    pd.testing.assert_series_equal(got.by_major.sort_index(), expected.by_major.sort_index(),
+                                   check_index_type=False)
+    assert parts[(2024, 3)].total == 10000
+    assert parts[(2025, 4)].rows == 0
+
+
+def test_partials_use_period_index(store):
+    with sqlite3.connect(store.path) as conn:
+        plan = conn.execute("EXPLAIN QUERY PLAN " + partials_sql(2), ("month", 2025, 1, 2)).fetchall()
+    assert any("ledger_period (kind=? AND year=? AND month=?)" in row[-1] for row in plan)
+
+
+def test_save_refuses_foreign_labels(store):
+    saved = store.save("month", 2025, 3, ledger(MARCH))
+    # 0부터 세는 기본 인덱스 표 — 저장된 id와 겹쳐도 덮어쓰거나 지우지 않음
+    with pytest.raises(ValueError):
+        store.save("month", 2025, 3, ledger(MARCH[:1]))
+    # 이 객체로 읽지 않은 파티션에 저장
+    with pytest.raises(ValueError):
+        LedgerStore(store.path).save("month", 2025, 3, saved)
+    assert list(LedgerStore(store.path).load("month", 2025, 3).index) == list(saved.index)
+
+    # 새 행은 append_rows로 붙이면 됨
+    out = store.save("month", 2025, 3, append_rows(saved, ledger(MARCH[:1])))
+    assert len(out) == 4